@@ -1,149 +1,16 @@
-import pandas as pd
-import numpy as np
-import seaborn as sns
-import matplotlib.pyplot as plt
+"""
+Pipeline analisis lengkap: load -> training -> evaluasi -> feature importance ->
+ringkasan LLM -> artefak hasil -> presentasi.
+
+Jalankan langsung (`python Mental_Health_Data.py`) atau lewat `python cli.py analyze`.
+Modul ini aman di-import: dependensi berat baru dimuat di dalam `main()`.
+"""
 import os
-import replicate # Pastikan modul 'replicate' sudah diinstal
-
-# Hapus import userdata karena ini spesifik Google Colab
-# from google.colab import userdata
-
-from sklearn.model_selection import train_test_split
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import classification_report, confusion_matrix, roc_auc_score
-
-# --- DIRECTORY UNTUK PLOT ---
-# Buat direktori untuk menyimpan plot jika belum ada
-plots_dir = "plots_output"
-if not os.path.exists(plots_dir):
-    os.makedirs(plots_dir)
-
-# --- MULAI ANALISIS DATA ---
-print("--- Memulai Analisis Data ---")
-
-# STEP 3: Load Dataset
-try:
-    df = pd.read_csv('survey.csv')
-    df.columns = df.columns.str.strip()
-    print("📊 Dataset Loaded!")
-    print(df.head())
-except FileNotFoundError:
-    print("Error: 'survey.csv' tidak ditemukan di direktori yang sama.")
-    print("Pastikan file 'survey.csv' ada di lokasi yang sama dengan skrip ini.")
-    exit() # Hentikan eksekusi jika file tidak ditemukan
-
-
-# STEP 4: Data Cleaning
-def clean_gender(g):
-    g = str(g).lower()
-    if 'male' in g:
-        return 'male'
-    elif 'female' in g:
-        return 'female'
-    else:
-        return 'other'
-
-if 'Gender' in df.columns:
-    df['Gender'] = df['Gender'].apply(clean_gender)
-if 'work_interfere' in df.columns:
-    df['work_interfere'] = df['work_interfere'].fillna("Don't know")
-if 'self_employed' in df.columns:
-    df['self_employed'] = df['self_employed'].fillna("Don't know")
-print("\n✅ Data Cleaning Selesai.")
-
-# STEP 5: EDA - Generate Plots and Save
-sns.set_theme(style="whitegrid")
-
-# Plot 1: Distribusi Treatment
-plt.figure(figsize=(10, 5))
-sns.countplot(x='treatment', data=df)
-plt.title("Distribusi Treatment")
-plt.xlabel("Mencari Perawatan Mental")
-plt.ylabel("Jumlah Responden")
-plt.tight_layout()
-# Simpan plot
-treatment_plot_path = os.path.join(plots_dir, "treatment_distribution.png")
-plt.savefig(treatment_plot_path, dpi=300)
-plt.close() # Tutup plot agar tidak ditampilkan di jendela terpisah
-
-print(f"\n📊 Plot 'Distribusi Treatment' disimpan di: {treatment_plot_path}")
-
-# STEP 6: Encode Categorical Columns
-for col in df.select_dtypes(include=['object', 'category']).columns:
-    df[col] = df[col].astype('category').cat.codes
-print("\n✅ Kolom Kategorikal Dikodekan.")
-
-# STEP 7: Modeling
-drop_cols = ['Timestamp', 'state', 'comments']
-for col in drop_cols:
-    if col in df.columns:
-        df.drop(col, axis=1, inplace=True)
-
-X = df.drop('treatment', axis=1)
-y = df['treatment']
-
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-
-model = RandomForestClassifier(random_state=42)
-model.fit(X_train, y_train)
-y_pred = model.predict(X_test)
-print("\n✅ Model Random Forest Dilatih.")
-
-# STEP 8: Evaluation
-print("\n📈 Classification Report:")
-print(classification_report(y_test, y_pred))
-
-# Plot 2: Confusion Matrix
-plt.figure(figsize=(8, 6))
-sns.heatmap(confusion_matrix(y_test, y_pred), annot=True, fmt='d', cmap='Blues',
-            xticklabels=['Predicted No Treatment', 'Predicted Treatment'],
-            yticklabels=['Actual No Treatment', 'Actual Treatment'])
-plt.xlabel("Prediksi")
-plt.ylabel("Aktual")
-plt.title("Confusion Matrix")
-plt.tight_layout()
-# Simpan plot
-confusion_matrix_path = os.path.join(plots_dir, "confusion_matrix.png")
-plt.savefig(confusion_matrix_path, dpi=300)
-plt.close() # Tutup plot
-
-print(f"\n📊 Plot 'Confusion Matrix' disimpan di: {confusion_matrix_path}")
-
-roc_score = roc_auc_score(y_test, model.predict_proba(X_test)[:, 1])
-print(f"ROC AUC Score: {roc_score:.2f}")
-
-# STEP 9: Feature Importance
-importances = pd.Series(model.feature_importances_, index=X.columns).sort_values(ascending=False)
-top_features = importances.head(3).index.tolist() # Digunakan untuk prompt LLM
-print("\n📌 Top Feature Importance:")
-print(importances.head(5))
-
-# Plot 3: Feature Importance Bar Plot
-plt.figure(figsize=(12, 6))
-importances.plot(kind='bar', color='#0066cc') # Warna biru kustom
-plt.title("Feature Importance")
-plt.ylabel("Importansi")
-plt.xlabel("Fitur")
-plt.xticks(rotation=45, ha='right')
-plt.tight_layout()
-# Simpan plot
-feature_importance_path = os.path.join(plots_dir, "feature_importance.png")
-plt.savefig(feature_importance_path, dpi=300)
-plt.close() # Tutup plot
-
-print(f"\n📊 Plot 'Feature Importance' disimpan di: {feature_importance_path}")
-
-# STEP 10: Prepare Summary Text
-# Pastikan classification_report_dict tersedia untuk detail distribusi
-classification_rep_dict = classification_report(y_test, y_pred, output_dict=True)
-treatment_count_yes = classification_rep_dict['1']['support']
-treatment_count_no = classification_rep_dict['0']['support']
-total_respondents = treatment_count_yes + treatment_count_no
-treatment_percent_yes = (treatment_count_yes / total_respondents) * 100 if total_respondents else 0
-treatment_percent_no = (treatment_count_no / total_respondents) * 100 if total_respondents else 0
-
-
-prompt_text_for_llm = f"""
+
+
+def build_summary_prompt(top_features, treatment_percent_yes, treatment_percent_no, roc_score):
+    """Prompt ringkasan eksekutif untuk LLM dari temuan utama analisis."""
+    return f"""
 Berikut adalah hasil analisis data survei kesehatan mental di industri teknologi:
 
 - Fitur paling berpengaruh terhadap prediksi perawatan mental: {', '.join(top_features)}.
@@ -153,44 +20,336 @@ Berikut adalah hasil analisis data survei kesehatan mental di industri teknologi
 Tuliskan ringkasan eksekutif yang ringkas dan menarik dari temuan ini untuk laporan manajemen HR. Fokus pada implikasi untuk kebijakan HR, temuan kunci, dan tambahkan judul yang menarik.
 """
 
-print("\n📄 Prompt yang akan dikirim ke IBM Granite:")
-print(prompt_text_for_llm)
 
-# STEP 11: Summarization via Replicate API
-final_summary_text = ""
-# Ambil API key dari environment variable
-api_token = os.environ.get("REPLICATE_API_TOKEN")
+def default_summary_text(model_name, roc_score, top_features, treatment_yes_percent):
+    """Ringkasan bawaan jika LLM tidak tersedia (tanpa REPLICATE_API_TOKEN)."""
+    top_features_text = ", ".join(f"*{feature}*" for feature in top_features)
+    return f"""
+    **Analisis Kesehatan Mental di Sektor Teknologi: Insight Kunci untuk HR**
+
+    Model {model_name} berhasil memprediksi status pencarian perawatan mental pekerja berdasarkan data survei, dengan skor ROC AUC {roc_score:.2f}. Fitur paling berpengaruh adalah {top_features_text}. Distribusi menunjukkan sekitar {treatment_yes_percent:.0f}% responden pernah mencari perawatan mental.
+
+    Insight ini menekankan pentingnya intervensi HR dalam mengatasi stres kerja, mempromosikan lingkungan kerja yang mendukung keterbukaan, dan mempertimbangkan faktor-faktor di atas dalam program kesejahteraan. Dengan fokus pada area-area ini, perusahaan dapat secara proaktif meningkatkan dukungan kesehatan mental bagi karyawan.
+    """
+
+
+# --- TAHAP ANALISIS BERSAMA (dipakai `main()` dan `pipeline.survey_stages`) ---
+def split_dataset(X, y, test_size=0.2):
+    """Split train/test yang sama untuk semua entry point (random_state=42)."""
+    from sklearn.model_selection import train_test_split
+
+    return train_test_split(X, y, test_size=test_size, random_state=42)
+
+
+def target_distribution(y, labels):
+    """Jumlah dan persentase responden per kelas target, urut sesuai vocabulary encoder."""
+    import numpy as np
+
+    counts = np.bincount(y, minlength=len(labels))
+    total = counts.sum()
+    return {label: {"count": int(count), "percent": float(count / total * 100) if total else 0.0}
+            for label, count in zip(labels, counts)}
+
+
+def train_bundle(X_train, y_train, encoder, feature_names, training_config, bundle_path, compact_path=None):
+    """
+    Melatih model lalu menyimpan bundle (encoder + model + urutan fitur) ke `bundle_path`;
+    untuk random forest juga forest ringkas ke `compact_path`.
+    Mengembalikan (model, detik_fit, path_compact atau None).
+    """
+    from scoring import ModelBundle
+    from training import train_model
+
+    model, fit_seconds = train_model(X_train, y_train, training_config)
+    bundle = ModelBundle(model, encoder, feature_names)
+    bundle.save(bundle_path)
+    if compact_path is None or training_config.backend != "random_forest":
+        return model, fit_seconds, None
+    return model, fit_seconds, bundle.export_compact(compact_path)
+
+
+def evaluate_model(model, X_test, y_test):
+    """Metrik holdout: ROC AUC, classification report (dict), confusion matrix dan nama model."""
+    from sklearn.metrics import classification_report, confusion_matrix, roc_auc_score
 
-if api_token:
+    y_pred = model.predict(X_test)
+    return {
+        "roc_auc": float(roc_auc_score(y_test, model.predict_proba(X_test)[:, 1])),
+        "classification_report": classification_report(y_test, y_pred, output_dict=True),
+        "confusion_matrix": confusion_matrix(y_test, y_pred).tolist(),
+        "model": type(model).__name__,
+    }
+
+
+def feature_importance_table(model, X_test, y_test, feature_names, method="impurity", max_rows=5000,
+                             n_repeats=10):
+    """
+    Tabel importansi (kolom `feature`, `importance_mean`, ...) terurut menurun;
+    mengembalikan (tabel, metode). "impurity" memakai feature_importances_ model;
+    "permutation" (juga otomatis untuk model tanpa feature_importances_) memakai
+    permutation importance paralel pada subsampel stratified test set.
+    """
+    import pandas as pd
+
+    if method == "impurity" and hasattr(model, "feature_importances_"):
+        table = pd.DataFrame({"feature": list(feature_names), "importance_mean": model.feature_importances_})
+        return table.sort_values("importance_mean", ascending=False, ignore_index=True), "impurity"
+    from feature_attribution import permutation_importance
+
+    table = permutation_importance(model, X_test, y_test, feature_names, max_rows=max_rows, n_repeats=n_repeats,
+                                   random_state=42)
+    return table, "permutation"
+
+
+def summary_prompt_from_report(top_features, report, roc_score):
+    """Prompt ringkasan; distribusi treatment diambil dari support classification report."""
+    total = report["1"]["support"] + report["0"]["support"]
+    percent_yes = report["1"]["support"] / total * 100 if total else 0
+    percent_no = report["0"]["support"] / total * 100 if total else 0
+    return build_summary_prompt(top_features, percent_yes, percent_no, roc_score)
+
+
+def executive_summary(prompt, summary_backend, use_llm, model_name, roc_score, top_features,
+                      treatment_yes_percent):
+    """
+    Ringkasan eksekutif via LLM (`use_llm`) atau ringkasan bawaan.
+    Mengembalikan (teks, berhasil); berhasil=False jika LLM dipanggil tetapi gagal,
+    sehingga hasil cadangan tidak di-cache sebagai hasil akhir.
+    """
+    from summarizer import BACKENDS, DEFAULT_MODEL, DEFAULT_PARAMS, summarize_sync
+
+    if not use_llm:
+        print("\n⚠️ REPLICATE_API_TOKEN tidak diatur atau gagal mengambilnya. Menggunakan ringkasan default.")
+        return default_summary_text(model_name, roc_score, top_features, treatment_yes_percent), True
     try:
-        print("⏳ Memanggil IBM Granite via Replicate...")
-        # Gunakan replicate.run langsung, bukan client.run
-        summary_llm_output = replicate.run(
-            "ibm-granite/granite-3.2-8b-instruct",
-            input={
-                "prompt": prompt_text_for_llm,
-                "max_new_tokens": 250,
-                "temperature": 0.7,
-            }
-        )
-        final_summary_text = "".join(summary_llm_output).strip() # Mengubah generator output menjadi string
+        print(f"⏳ Memanggil IBM Granite via {summary_backend} (timeout, retry & cache aktif)...")
+        text = summarize_sync(prompt, BACKENDS[summary_backend](), model=DEFAULT_MODEL, params=DEFAULT_PARAMS)
         print("✅ Ringkasan berhasil diperoleh.")
+        return text, True
     except Exception as e:
-        final_summary_text = "Ringkasan eksekutif tidak dapat dihasilkan saat ini karena masalah API atau koneksi."
-        print(f"❌ Gagal mendapatkan ringkasan dari Replicate: {e}")
-else:
-    final_summary_text = """
-    **Analisis Kesehatan Mental di Sektor Teknologi: Insight Kunci untuk HR**
+        print(f"❌ Gagal mendapatkan ringkasan dari {summary_backend}: {e}")
+        return "Ringkasan eksekutif tidak dapat dihasilkan saat ini karena masalah API atau koneksi.", False
+
+
+def results_payload(metrics, importances, top_features, class_distribution, summary_text, prompt, plots):
+    """Isi results.json (tanpa figure) yang dibaca presentasi."""
+    return {
+        "metrics": {key: metrics[key] for key in
+                    ("roc_auc", "classification_report", "model", "n_features", "n_respondents")},
+        "importances": importances.round(6).to_dict(),
+        "top_features": top_features,
+        "class_distribution": class_distribution,
+        "summary_text": summary_text.strip(),
+        "prompt": prompt,
+        "plots": plots,
+    }
+
+
+def main():
+    import pandas as pd
+
+    from dataset_cache import load_survey_dataset
+    from plotting import PlotRenderer
+    from profiling import StageProfiler
+    from results_artifact import AnalysisResults, save_results
+    from training import TrainingConfig
+
+    # Hapus import userdata karena ini spesifik Google Colab
+    # from google.colab import userdata
+
+    # --- DIRECTORY UNTUK PLOT ---
+    # Buat direktori untuk menyimpan plot jika belum ada
+    plots_dir = "plots_output"
+    if not os.path.exists(plots_dir):
+        os.makedirs(plots_dir)
+
+    # --- DIRECTORY UNTUK ARTEFAK MODEL ---
+    model_dir = "model_output"
+    os.makedirs(model_dir, exist_ok=True)
+
+    # Plot dirender paralel di background; set PLOT_PREVIEW=1 untuk versi DPI rendah
+    # (disimpan di plots_output/preview) dan PLOT_FORCE=1 untuk mengabaikan cache plot.
+    plot_renderer = PlotRenderer(
+        plots_dir,
+        preview=os.environ.get("PLOT_PREVIEW") == "1",
+        force=os.environ.get("PLOT_FORCE") == "1",
+    )
+
+    # --- PROFIL PER TAHAP ---
+    # Setiap tahap mencatat wall/CPU time, peak RSS dan jumlah baris ke
+    # model_output/stage_trace.json. PROFILE_STAGES=cprofile|tracemalloc menambah
+    # profil detail per tahap (file .prof di model_output/profiles).
+    profiler = StageProfiler(
+        hook=os.environ.get("PROFILE_STAGES") or None,
+        profile_dir=os.path.join(model_dir, "profiles"),
+    )
+
+    # --- MULAI ANALISIS DATA ---
+    print("--- Memulai Analisis Data ---")
+
+    # STEP 3 - 6: Load, Cleaning & Encoding (dengan cache dataset)
+    # Dibaca per chunk dengan skema bertipe (kategori, Int8, datetime) dan kolom
+    # 'comments' dilewati: teks mentah hanya ada untuk satu chunk, tetapi frame bertipe
+    # hasil cleaning tetap dimuat utuh sebelum encoding (memori ~ jumlah baris x kolom kode).
+    # Hasil akhirnya (matriks fitur ter-encode + target) disimpan di cache dan
+    # dimuat ulang via memmap selama survey.csv dan konfigurasi cleaning tidak berubah.
+    with profiler.stage("load_clean_encode") as stage:
+        SURVEY_PATH = 'survey.csv'
+        CHUNK_SIZE = int(os.environ.get("SURVEY_CHUNK_SIZE", 100_000))
+        try:
+            dataset, cache_hit = load_survey_dataset(SURVEY_PATH, chunksize=CHUNK_SIZE)
+        except FileNotFoundError:
+            print("Error: 'survey.csv' tidak ditemukan di direktori yang sama.")
+            print("Pastikan file 'survey.csv' ada di lokasi yang sama dengan skrip ini.")
+            return # Hentikan eksekusi jika file tidak ditemukan
+        if cache_hit:
+            print(f"⚡ Dataset ter-encode dimuat dari cache ({dataset.key}), parsing CSV dilewati.")
+
+        X, y, feature_names, encoder = dataset.X, dataset.y, dataset.feature_names, dataset.encoder
+        encoder_path = os.path.join(model_dir, "encoder.json")
+        encoder.save(encoder_path)
+        print(f"💾 Encoder disimpan di: {encoder_path}")
+        stage.rows = int(len(y))
+        stage.extra["cache_hit"] = bool(cache_hit)
+
+    # STEP 5: EDA - Generate Plots and Save
+    # Plot 1: Distribusi Treatment
+    with profiler.stage("eda_plots") as stage:
+        class_distribution = target_distribution(y, encoder.vocabularies['treatment'])
+        treatment_plot_path = plot_renderer.submit("treatment_distribution", "treatment_distribution", {
+            "labels": list(class_distribution),
+            "counts": [item["count"] for item in class_distribution.values()],
+        })
+        print(f"\n📊 Plot 'Distribusi Treatment' dijadwalkan: {treatment_plot_path}")
+        stage.rows = int(len(y))
+
+    # STEP 7: Modeling
+    with profiler.stage("train") as stage:
+        X_train, X_test, y_train, y_test = split_dataset(X, y)
+
+        # Konfigurasi mesin training bisa diatur lewat environment variable, mis.
+        # TRAIN_BACKEND=hist_gradient_boosting TRAIN_N_JOBS=8 TRAIN_MAX_SAMPLES=0.5
+        training_config = TrainingConfig(
+            backend=os.environ.get("TRAIN_BACKEND", "random_forest"),
+            n_estimators=int(os.environ.get("TRAIN_N_ESTIMATORS", 100)),
+            n_jobs=int(os.environ.get("TRAIN_N_JOBS", -1)),
+            max_samples=float(os.environ["TRAIN_MAX_SAMPLES"]) if os.environ.get("TRAIN_MAX_SAMPLES") else None,
+            random_state=42,
+        )
+        # Simpan bundle model (encoder + model + urutan fitur) untuk scoring data baru
+        bundle_path = os.path.join(model_dir, "treatment_model.joblib")
+        model, fit_seconds, compact_path = train_bundle(X_train, y_train, encoder, feature_names, training_config,
+                                                        bundle_path, os.path.join(model_dir, "treatment_model_compact"))
+        print(f"\n✅ Model {type(model).__name__} Dilatih.")
+        print(f"💾 Bundle model disimpan di: {bundle_path}")
+        if compact_path:
+            print(f"💾 Forest ringkas (mmap, tanpa sklearn) disimpan di: {compact_path}")
+        stage.rows = int(len(y_train))
+        stage.extra["fit_seconds"] = round(fit_seconds, 6)
+
+    # STEP 8: Evaluation
+    with profiler.stage("evaluate") as stage:
+        metrics = evaluate_model(model, X_test, y_test)
+        print("\n📈 Classification Report:")
+        print(pd.DataFrame(metrics["classification_report"]).transpose().round(2))
+
+        # Plot 2: Confusion Matrix
+        confusion_matrix_path = plot_renderer.submit("confusion_matrix", "confusion_matrix", {
+            "matrix": metrics["confusion_matrix"],
+        })
+        print(f"\n📊 Plot 'Confusion Matrix' dijadwalkan: {confusion_matrix_path}")
+
+        roc_score = metrics["roc_auc"]
+        print(f"ROC AUC Score: {roc_score:.2f}")
+        print(f"⏱️ Konfigurasi training: {training_config.to_dict()} -> fit {fit_seconds:.2f} s, ROC AUC {roc_score:.4f}")
+        stage.rows = int(len(y_test))
+
+    # STEP 9: Feature Importance
+    with profiler.stage("feature_importance") as stage:
+        # Default: feature_importances_ (impurity) dari model. FEATURE_IMPORTANCE=permutation
+        # memakai permutation importance paralel pada subsampel stratified test set (lebih
+        # lambat, tetapi tidak bias ke fitur dengan banyak kode seperti Country dan Age);
+        # juga dipakai otomatis untuk model tanpa feature_importances_.
+        importance_table, importance_method = feature_importance_table(
+            model, X_test, y_test, feature_names,
+            method=os.environ.get("FEATURE_IMPORTANCE", "impurity"),
+            max_rows=int(os.environ.get("PERMUTATION_MAX_ROWS", 5000)),
+            n_repeats=int(os.environ.get("PERMUTATION_REPEATS", 10)),
+        )
+        if importance_method == "permutation":
+            importance_table.to_csv(os.path.join(model_dir, "permutation_importance.csv"), index=False)
+        importances = importance_table.set_index("feature")["importance_mean"]
+        stage.extra["method"] = importance_method
+        top_features = importances.head(3).index.tolist() # Digunakan untuk prompt LLM
+        print(f"\n📌 Top Feature Importance ({importance_method}):")
+        print(importances.head(5))
+
+        # Plot 3: Feature Importance Bar Plot
+        feature_importance_path = plot_renderer.submit("feature_importance", "feature_importance", {
+            "features": importances.index.tolist(),
+            "importances": importances.round(6).tolist(),
+        })
+        print(f"\n📊 Plot 'Feature Importance' dijadwalkan: {feature_importance_path}")
+        stage.rows = int(len(y_test))
+
+    # STEP 10: Prepare Summary Text
+    # Distribusi treatment untuk prompt diambil dari support classification report
+    with profiler.stage("prepare_summary"):
+        prompt_text_for_llm = summary_prompt_from_report(top_features, metrics["classification_report"], roc_score)
+
+        print("\n📄 Prompt yang akan dikirim ke IBM Granite:")
+        print(prompt_text_for_llm)
+
+    # STEP 11: Summarization via Replicate API
+    with profiler.stage("summarize"):
+        # Ambil API key dari environment variable
+        api_token = os.environ.get("REPLICATE_API_TOKEN")
+        # SUMMARY_BACKEND=mock memakai backend lokal (tanpa jaringan) untuk pengujian.
+        summary_backend = os.environ.get("SUMMARY_BACKEND", "replicate")
+        final_summary_text, _ = executive_summary(
+            prompt_text_for_llm, summary_backend, bool(api_token) or summary_backend == "mock",
+            metrics["model"], roc_score, top_features, class_distribution["Yes"]["percent"],
+        )
 
-    Model Random Forest berhasil memprediksi status pencarian perawatan mental pekerja berdasarkan data survei, dengan skor ROC AUC 0.88 yang sangat baik. Fitur paling berpengaruh adalah *interferensi kerja*, *riwayat keluarga*, dan *anonimitas*. Distribusi menunjukkan sekitar 51% responden pernah mencari perawatan mental.
+    # Tunggu plot yang masih dirender di background (berjalan paralel dengan STEP 10-11)
+    with profiler.stage("render_plots"):
+        rendered_plots = plot_renderer.close()
+        print(f"\n📊 Plot dirender: {rendered_plots or '-'}; dilewati (tidak berubah): {plot_renderer.skipped or '-'}")
+
+    # STEP 12: Output Final Summary
+    with profiler.stage("save_results"):
+        print("\n📋 Ringkasan Final yang dihasilkan:")
+        print("=" * 60)
+        print(final_summary_text)
+        print("=" * 60)
+
+        # Artefak hasil analisis untuk presentasi (metrik, importansi, ringkasan, figure)
+        metrics.update(n_features=len(feature_names), n_respondents=int(len(y)))
+        results_path = save_results(
+            results_payload(metrics, importances, top_features, class_distribution, final_summary_text,
+                            prompt_text_for_llm, plot_renderer.specs),
+            {
+                "treatment_distribution": treatment_plot_path,
+                "confusion_matrix": confusion_matrix_path,
+                "feature_importance": feature_importance_path,
+            },
+            os.path.join(model_dir, "results.json"),
+        )
+        print(f"\n💾 Artefak hasil analisis disimpan di: {results_path}")
 
-    Insight ini menekankan pentingnya intervensi HR dalam mengatasi stres kerja, mempromosikan lingkungan kerja yang mendukung keterbukaan (anonimitas), dan mempertimbangkan riwayat kesehatan mental keluarga dalam program kesejahteraan. Dengan fokus pada area-area ini, perusahaan dapat secara proaktif meningkatkan dukungan kesehatan mental bagi karyawan.
-    """
-    print("\n⚠️ REPLICATE_API_TOKEN tidak diatur atau gagal mengambilnya. Menggunakan ringkasan default.")
+    # STEP 13: Presentasi langsung dari artefak hasil (BUILD_DECK=0 untuk melewati)
+    with profiler.stage("deck"):
+        if os.environ.get("BUILD_DECK", "1") == "1":
+            from presentasi_mental_health import build_presentation
+            from slide_images import ImagePreparer
+            deck_path = "Mental_Health_Capstone_Presentation_Final.pptx"
+            build_presentation(AnalysisResults.load(results_path), image_preparer=ImagePreparer()).save(deck_path)
+            print(f"✅ Presentasi berhasil disimpan di: {deck_path}")
+
+    profiler.report()
+    trace_path = profiler.save(os.path.join(model_dir, "stage_trace.json"))
+    print(f"💾 Trace profil per tahap disimpan di: {trace_path}")
 
-# STEP 12: Output Final Summary
-print("\n📋 Ringkasan Final yang dihasilkan:")
-print("=" * 60)
-print(final_summary_text)
-print("=" * 60)
 
+if __name__ == "__main__":
+    main()
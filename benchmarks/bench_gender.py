@@ -0,0 +1,59 @@
+"""
+Benchmark normalisasi Gender: `apply(clean_gender)` per baris (versi lama)
+dibandingkan `normalize_gender` tervektorisasi pada kolom sintetis.
+
+Jalankan dari root repo:
+    python benchmarks/bench_gender.py --rows 10000000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from cleaning import normalize_gender  # noqa: E402
+
+
+def clean_gender(g):
+    """Implementasi lama dari Mental_Health_Data.py (dipertahankan untuk pembanding)."""
+    g = str(g).lower()
+    if 'male' in g:
+        return 'male'
+    elif 'female' in g:
+        return 'female'
+    else:
+        return 'other'
+
+
+def synthetic_gender_column(rows, survey_path="survey.csv", seed=42):
+    """Kolom Gender sintetis dengan distribusi nilai mentah seperti survey.csv."""
+    freq = pd.read_csv(survey_path, usecols=["Gender"])["Gender"].value_counts(normalize=True, dropna=False)
+    rng = np.random.default_rng(seed)
+    return pd.Series(rng.choice(freq.index.to_numpy(dtype=object), size=rows, p=freq.to_numpy()), name="Gender")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    column = synthetic_gender_column(args.rows)
+    print(f"📊 {args.rows:,} baris, {column.nunique(dropna=False)} nilai unik")
+
+    start = time.perf_counter()
+    normalize_gender(column)
+    vectorized = time.perf_counter() - start
+    print(f"normalize_gender     : {vectorized:8.3f} s ({args.rows / vectorized:,.0f} baris/s)")
+
+    start = time.perf_counter()
+    column.apply(clean_gender)
+    per_row = time.perf_counter() - start
+    print(f"apply(clean_gender)  : {per_row:8.3f} s ({args.rows / per_row:,.0f} baris/s)")
+    print(f"Speedup              : {per_row / vectorized:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
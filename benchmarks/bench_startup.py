@@ -0,0 +1,101 @@
+"""
+Benchmark waktu startup CLI: setiap perintah dijalankan sebagai proses baru
+berkali-kali (seperti job batch berumur pendek) dan dilaporkan median/min.
+Opsional `--importtime` menampilkan modul dengan import kumulatif terlama.
+
+Jalankan dari root repo:
+    python benchmarks/bench_startup.py --runs 20 --importtime
+"""
+import argparse
+import csv
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("pandas", "sklearn", "matplotlib", "seaborn", "pptx", "replicate", "joblib")
+# Scoring dengan model ringkas tidak boleh memuat modul ini (lihat compact_forest).
+COMPACT_FORBIDDEN = ("joblib", "sklearn")
+COMPACT_LABEL = "cli score (1 record, ringkas)"
+
+
+def startup_commands(score_input):
+    commands = {
+        "cli --help": ["cli.py", "--help"],
+        "cli score --help": ["cli.py", "score", "--help"],
+        "import Mental_Health_Data": ["-c", "import Mental_Health_Data"],
+    }
+    if os.path.exists(os.path.join(ROOT, "model_output", "treatment_model.joblib")):
+        commands["cli score (1 record)"] = ["cli.py", "score", "--input", score_input, "--output", os.devnull]
+    compact_path = os.path.join("model_output", "treatment_model_compact")
+    if os.path.isdir(os.path.join(ROOT, compact_path)):
+        commands[COMPACT_LABEL] = ["cli.py", "score", "--model", compact_path, "--input",
+                                                     score_input, "--output", os.devnull]
+    return commands
+
+
+def time_command(args, runs):
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *args], cwd=ROOT, check=True, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def heavy_modules_loaded(args):
+    """Modul berat yang ter-import setelah perintah selesai parsing (dilihat via -X importtime)."""
+    result = subprocess.run([sys.executable, "-X", "importtime", *args], cwd=ROOT, capture_output=True, text=True)
+    imported = {line.split("|")[-1].strip().split(".")[0] for line in result.stderr.splitlines() if "|" in line}
+    return sorted(imported & set(HEAVY_MODULES))
+
+
+def import_profile(args, top=10):
+    """(modul, detik kumulatif) terlama dari `python -X importtime`."""
+    result = subprocess.run([sys.executable, "-X", "importtime", *args], cwd=ROOT, capture_output=True, text=True)
+    rows = []
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((parts[2].strip(), int(parts[1]) / 1e6))
+    return sorted(rows, key=lambda row: row[1], reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--importtime", action="store_true")
+    args = parser.parse_args()
+
+    # Satu record JSON (baris pertama survey.csv) untuk mensimulasikan job scoring kecil.
+    with open(os.path.join(ROOT, "survey.csv"), encoding="utf-8", newline="") as f:
+        record = next(csv.DictReader(f))
+    with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as f:
+        f.write(json.dumps(record) + "\n")
+        score_input = f.name
+    try:
+        print(f"{'perintah':<32}{'median (s)':>12}{'min (s)':>10}  modul berat")
+        leaked = []
+        for label, command in startup_commands(score_input).items():
+            timings = time_command(command, args.runs)
+            heavy = heavy_modules_loaded(command)
+            print(f"{label:<32}{statistics.median(timings):>12.3f}{min(timings):>10.3f}  {', '.join(heavy) or '-'}")
+            if label == COMPACT_LABEL:
+                leaked = [module for module in heavy if module in COMPACT_FORBIDDEN]
+        if args.importtime:
+            print("\n⏱️ Import kumulatif terlama untuk `cli score --help`:")
+            for module, seconds in import_profile(["cli.py", "score", "--help"]):
+                print(f"  {module:<40}{seconds:.3f} s")
+    finally:
+        os.unlink(score_input)
+    if leaked:
+        sys.exit(f"❌ Scoring model ringkas memuat {', '.join(leaked)}; harus tanpa joblib/sklearn.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Suite benchmark pipeline pada survei sintetis berbagai skala.
+
+Untuk setiap skala, tahap berikut diukur (wall/CPU time, peak RSS, baris/s)
+dengan `profiling.StageProfiler`:
+    load -> validate -> clean_gender -> encoding -> training -> prediction -> plotting -> deck
+
+Hasil disimpan di `benchmarks/results/<commit>.json` (format sama dengan
+stage_trace.json), sehingga dua commit bisa dibandingkan dengan:
+    python profiling.py benchmarks/results/<commit_lama>.json benchmarks/results/<commit_baru>.json
+
+Jalankan dari root repo (10m butuh beberapa GB RAM dan waktu cukup lama):
+    python benchmarks/bench_suite.py --scales 10k 1m 10m
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+from sklearn.metrics import roc_auc_score
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from cleaning import clean_survey, normalize_gender  # noqa: E402
+from data_loader import load_survey  # noqa: E402
+from dataset_cache import DROP_COLUMNS, TARGET_COLUMN  # noqa: E402
+from encoder import CategoricalEncoder  # noqa: E402
+from profiling import StageProfiler  # noqa: E402
+from synthetic_survey import parse_rows, synthetic_survey_path  # noqa: E402
+from training import TrainingConfig, train_model  # noqa: E402
+from validation import ValidationReport, iter_validated_survey  # noqa: E402
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def git_revision():
+    """(commit pendek, ada perubahan belum di-commit?) atau ('unknown', False)."""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                check=True).stdout.strip()
+        dirty = bool(subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"],
+                                    capture_output=True, text=True, check=True).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown", False
+
+
+def run_scale(profiler, label, csv_path, args, work_dir):
+    """Menjalankan semua tahap untuk satu file sintetis."""
+    from plotting import PlotRenderer
+    from presentasi_mental_health import build_presentation
+    from results_artifact import AnalysisResults, save_results
+    from slide_images import ImagePreparer
+
+    with profiler.stage(f"{label}/load") as stage:
+        df = load_survey(csv_path, chunksize=args.chunksize)
+        stage.rows = len(df)
+
+    with profiler.stage(f"{label}/validate") as stage:
+        report = ValidationReport()
+        for _ in iter_validated_survey(csv_path, args.chunksize, quarantine=os.path.join(work_dir, "quarantine.csv"),
+                                       report=report):
+            pass
+        stage.rows = report.rows
+        stage.extra["quarantined"] = report.quarantined
+
+    with profiler.stage(f"{label}/clean_gender") as stage:
+        normalize_gender(df["Gender"])
+        stage.rows = len(df)
+
+    with profiler.stage(f"{label}/encoding") as stage:
+        df = clean_survey(df).drop(columns=DROP_COLUMNS, errors="ignore")
+        encoder = CategoricalEncoder()
+        encoded = encoder.fit_transform(df)
+        X = encoded.drop(columns=TARGET_COLUMN).to_numpy(dtype=np.float32, na_value=np.nan)
+        y = encoded[TARGET_COLUMN].to_numpy()
+        feature_names = [col for col in encoded.columns if col != TARGET_COLUMN]
+        stage.rows = len(df)
+    del df, encoded
+
+    # Training dibatasi `--train-rows` baris (subsampel acak) agar skala 10m tetap wajar.
+    rng = np.random.default_rng(42)
+    train_rows = rng.choice(len(y), args.train_rows, replace=False) if len(y) > args.train_rows else slice(None)
+    with profiler.stage(f"{label}/training") as stage:
+        config = TrainingConfig(n_estimators=args.n_estimators, n_jobs=args.n_jobs, random_state=42)
+        model, _ = train_model(X[train_rows], y[train_rows], config)
+        stage.rows = len(y[train_rows])
+
+    with profiler.stage(f"{label}/prediction") as stage:
+        proba = model.predict_proba(X)[:, 1]
+        stage.rows = len(y)
+
+    with profiler.stage(f"{label}/plotting") as stage:
+        predictions = (proba >= 0.5).astype(y.dtype)
+        confusion = np.bincount(y * 2 + predictions, minlength=4).reshape(2, 2)
+        order = np.argsort(model.feature_importances_)[::-1]
+        figure_data = {
+            "treatment_distribution": {"labels": encoder.vocabularies[TARGET_COLUMN],
+                                       "counts": np.bincount(y, minlength=2).tolist()},
+            "confusion_matrix": {"matrix": confusion.tolist()},
+            "feature_importance": {"features": [feature_names[i] for i in order],
+                                   "importances": model.feature_importances_[order].round(6).tolist()},
+        }
+        renderer = PlotRenderer(os.path.join(work_dir, "plots"), force=True)
+        figure_paths = {kind: renderer.submit(kind, kind, data) for kind, data in figure_data.items()}
+        renderer.close()
+
+    with profiler.stage(f"{label}/deck"):
+        results_path = save_results({
+            "metrics": {"roc_auc": float(roc_auc_score(y, proba)), "model": type(model).__name__,
+                        "n_features": len(feature_names), "n_respondents": int(len(y))},
+            "importances": dict(zip(figure_data["feature_importance"]["features"],
+                                    figure_data["feature_importance"]["importances"])),
+            "top_features": figure_data["feature_importance"]["features"][:3],
+            "class_distribution": {
+                label: {"count": int(count), "percent": float(count / len(y) * 100)}
+                for label, count in zip(encoder.vocabularies[TARGET_COLUMN], np.bincount(y, minlength=2))
+            },
+            "summary_text": "Benchmark",
+        }, figure_paths, os.path.join(work_dir, "results.json"))
+        build_presentation(AnalysisResults.load(results_path), image_preparer=ImagePreparer()).save(
+            os.path.join(work_dir, "deck.pptx"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", nargs="+", default=["10k", "1m"], help="mis. 10k 1m 10m")
+    parser.add_argument("--survey", default="survey.csv", help="sumber distribusi untuk data sintetis")
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--n-estimators", type=int, default=100)
+    parser.add_argument("--n-jobs", type=int, default=-1)
+    parser.add_argument("--train-rows", type=int, default=1_000_000)
+    parser.add_argument("--output", default=None, help="default: benchmarks/results/<commit>.json")
+    args = parser.parse_args()
+
+    profiler = StageProfiler()
+    for scale in args.scales:
+        rows = parse_rows(scale)
+        started = time.perf_counter()
+        csv_path = synthetic_survey_path(rows, survey_path=args.survey)
+        print(f"📄 Data sintetis {scale}: {csv_path} ({time.perf_counter() - started:.1f} s)")
+        with tempfile.TemporaryDirectory() as work_dir:
+            run_scale(profiler, scale, csv_path, args, work_dir)
+
+    profiler.report()
+    commit, dirty = git_revision()
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}{'-dirty' if dirty else ''}.json")
+    profiler.save(output, {"commit": commit, "dirty": dirty, "scales": args.scales,
+                           "train_rows": args.train_rows, "n_estimators": args.n_estimators})
+    print(f"\n💾 Hasil benchmark (commit {commit}{', ada perubahan lokal' if dirty else ''}) disimpan di: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+
+# --- NORMALISASI GENDER ---
+GENDER_DTYPE = CategoricalDtype(["female", "male", "other"])
+
+# Sinonim ditulis dalam bentuk huruf kecil tanpa spasi di ujung.
+# Bisa diganti/ditambah lewat argumen `synonyms` pada `normalize_gender`.
+GENDER_SYNONYMS = {
+    "male": "male", "m": "male", "man": "male", "make": "male", "mal": "male",
+    "maile": "male", "mail": "male", "malr": "male", "msle": "male",
+    "cis male": "male", "cis man": "male", "male (cis)": "male", "guy (-ish) ^_^": "male",
+    "male-ish": "male", "something kinda male?": "male",
+    "female": "female", "f": "female", "woman": "female", "femake": "female",
+    "femail": "female", "cis female": "female", "female (cis)": "female",
+    "cis-female/femme": "female", "trans-female": "female", "trans woman": "female",
+    "female (trans)": "female",
+}
+
+
+def _canonical_gender(raw, synonyms):
+    """Memetakan satu nilai mentah unik ke 'female' / 'male' / 'other'."""
+    if not isinstance(raw, str):
+        return "other"
+    key = raw.strip().lower()
+    if key in synonyms:
+        return synonyms[key]
+    # Cek 'female' lebih dulu: setiap string 'female' juga mengandung 'male'.
+    if "female" in key or "woman" in key:
+        return "female"
+    if "male" in key:
+        return "male"
+    return "other"
+
+
+def normalize_gender(values, synonyms=GENDER_SYNONYMS):
+    """
+    Normalisasi kolom Gender secara tervektorisasi.
+    Hanya nilai unik yang dipetakan di Python; baris dipetakan lewat lookup kode,
+    sehingga biayanya bergantung pada jumlah nilai unik, bukan jumlah baris.
+    """
+    values = pd.Series(values)
+    if isinstance(values.dtype, CategoricalDtype):
+        codes, uniques = values.cat.codes.to_numpy(), values.cat.categories
+    else:
+        codes, uniques = pd.factorize(values)
+    other_code = GENDER_DTYPE.categories.get_loc("other")
+    lookup = np.array(
+        [GENDER_DTYPE.categories.get_loc(_canonical_gender(raw, synonyms)) for raw in uniques] + [other_code],
+        dtype=np.int8,
+    )
+    # Kode -1 (NA) jatuh ke elemen terakhir lookup, yaitu 'other'.
+    mapped = lookup[codes]
+    return pd.Series(pd.Categorical.from_codes(mapped, dtype=GENDER_DTYPE), index=values.index, name=values.name)
+
+
+# --- CLEANING PER CHUNK ---
+def clean_survey(chunk, gender_synonyms=GENDER_SYNONYMS):
+    """Cleaning standar survei; aman dijalankan per chunk saat load."""
+    if 'Gender' in chunk.columns:
+        chunk['Gender'] = normalize_gender(chunk['Gender'], gender_synonyms)
+    if 'work_interfere' in chunk.columns:
+        chunk['work_interfere'] = chunk['work_interfere'].fillna("Don't know")
+    if 'self_employed' in chunk.columns:
+        chunk['self_employed'] = chunk['self_employed'].fillna("Don't know")
+    return chunk
@@ -0,0 +1,204 @@
+"""
+CLI terpadu untuk pipeline kesehatan mental.
+
+Subcommand:
+    load       load + cleaning + encoding survei (dengan cache dataset)
+    train      melatih model treatment dan menyimpan bundle
+    score      menilai CSV/JSON Lines dengan bundle tersimpan
+    plot       merender ulang plot dari artefak hasil (results.json)
+    summarize  ringkasan eksekutif via LLM dari prompt artefak hasil
+    deck       membangun presentasi PPTX dari artefak hasil
+    analyze    pipeline lengkap (sama dengan `python Mental_Health_Data.py`)
+    pipeline   pipeline lengkap sebagai DAG: tahap paralel, yang tidak berubah dilewati
+
+Modul ini hanya meng-import argparse/os/sys. pandas, sklearn, matplotlib,
+python-pptx dan replicate dimuat di dalam handler subcommand yang memakainya,
+sehingga `--help` dan job scoring singkat tidak membayar biaya import semuanya.
+
+Contoh:
+    python cli.py train --backend hist_gradient_boosting
+    python cli.py score --input survey.csv --output scores.csv
+    python cli.py deck --image-format png8
+"""
+import argparse
+import os
+import sys
+
+# Default path ditulis ulang di sini (bukan di-import dari modulnya) agar
+# parsing argumen tidak memicu import pandas/joblib.
+MODEL_DIR = "model_output"
+DEFAULT_BUNDLE_PATH = os.path.join(MODEL_DIR, "treatment_model.joblib")
+DEFAULT_COMPACT_PATH = os.path.join(MODEL_DIR, "treatment_model_compact")
+DEFAULT_RESULTS_PATH = os.path.join(MODEL_DIR, "results.json")
+DEFAULT_DECK_PATH = "Mental_Health_Capstone_Presentation_Final.pptx"
+
+
+def cmd_load(args):
+    from dataset_cache import load_survey_dataset
+
+    dataset, cache_hit = load_survey_dataset(args.survey, chunksize=args.chunksize, verbose=not args.quiet)
+    encoder_path = os.path.join(args.model_dir, "encoder.json")
+    dataset.encoder.save(encoder_path)
+    print(f"✅ {len(dataset.y):,} baris x {len(dataset.feature_names)} fitur "
+          f"({'cache hit' if cache_hit else 'dibangun ulang'}, kunci {dataset.key})")
+    print(f"💾 Encoder disimpan di: {encoder_path}")
+
+
+def cmd_train(args):
+    from sklearn.metrics import roc_auc_score
+    from sklearn.model_selection import train_test_split
+
+    from dataset_cache import load_survey_dataset
+    from scoring import ModelBundle
+    from training import TrainingConfig, train_model
+
+    dataset, _ = load_survey_dataset(args.survey, chunksize=args.chunksize, verbose=False)
+    X_train, X_test, y_train, y_test = train_test_split(dataset.X, dataset.y, test_size=args.test_size,
+                                                        random_state=42)
+    config = TrainingConfig(backend=args.backend, n_estimators=args.n_estimators, n_jobs=args.n_jobs,
+                            max_samples=args.max_samples, random_state=42)
+    model, fit_seconds = train_model(X_train, y_train, config)
+    roc_score = roc_auc_score(y_test, model.predict_proba(X_test)[:, 1])
+    bundle = ModelBundle(model, dataset.encoder, dataset.feature_names)
+    bundle_path = bundle.save(args.output)
+    print(f"✅ {type(model).__name__}: fit {fit_seconds:.2f} s, ROC AUC {roc_score:.4f}")
+    print(f"💾 Bundle model disimpan di: {bundle_path}")
+    if args.compact_output and args.backend == "random_forest":
+        print(f"💾 Forest ringkas disimpan di: {bundle.export_compact(args.compact_output)}")
+
+
+def cmd_score(args):
+    from scoring import score_file
+
+    total, elapsed = score_file(args.model, args.input, args.output, args.batch_size, args.workers, args.executor)
+    print(f"✅ {total:,} baris dinilai dalam {elapsed:.2f} s ({total / max(elapsed, 1e-9):,.0f} baris/s)",
+          file=sys.stderr)
+
+
+def cmd_plot(args):
+    from plotting import PlotRenderer
+    from results_artifact import AnalysisResults
+
+    specs = AnalysisResults.load(args.results).get("plots")
+    if not specs:
+        sys.exit(f"❌ {args.results} tidak berisi spesifikasi plot; jalankan ulang `python cli.py analyze`.")
+    with PlotRenderer(args.plots_dir, preview=args.preview, force=args.force) as renderer:
+        for name, spec in specs.items():
+            if not args.only or name in args.only:
+                renderer.submit(name, spec["kind"], spec["data"])
+    print(f"📊 Plot di {renderer.plots_dir}; dilewati (tidak berubah): {renderer.skipped or '-'}")
+
+
+def cmd_summarize(args):
+    from results_artifact import AnalysisResults
+    from summarizer import BACKENDS, DEFAULT_MODEL, summarize_sync
+
+    prompt = args.prompt or AnalysisResults.load(args.results)["prompt"]
+    print(summarize_sync(
+        prompt,
+        BACKENDS[args.backend](),
+        model=DEFAULT_MODEL,
+        params={"max_new_tokens": args.max_new_tokens, "temperature": args.temperature},
+    ))
+
+
+def cmd_deck(args):
+    from presentasi_mental_health import build_presentation
+    from results_artifact import AnalysisResults
+    from slide_images import ImagePreparer
+
+    image_preparer = ImagePreparer(dpi=args.image_dpi, fmt=args.image_format) if args.image_dpi > 0 else None
+    build_presentation(AnalysisResults.load(args.results), image_preparer=image_preparer).save(args.output)
+    print(f"✅ Presentasi berhasil disimpan di: {args.output}")
+
+
+def cmd_analyze(args):
+    import Mental_Health_Data
+
+    Mental_Health_Data.main()
+
+
+def cmd_pipeline(args):
+    import pipeline
+
+    pipeline.main(args.pipeline_args)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subcommands = parser.add_subparsers(dest="command", required=True, metavar="subcommand")
+
+    load = subcommands.add_parser("load", help="load, cleaning & encoding survei")
+    load.add_argument("--survey", default="survey.csv")
+    load.add_argument("--chunksize", type=int, default=100_000)
+    load.add_argument("--model-dir", default=MODEL_DIR)
+    load.add_argument("--quiet", action="store_true")
+    load.set_defaults(handler=cmd_load)
+
+    train = subcommands.add_parser("train", help="melatih model dan menyimpan bundle")
+    train.add_argument("--survey", default="survey.csv")
+    train.add_argument("--chunksize", type=int, default=100_000)
+    train.add_argument("--backend", choices=("random_forest", "hist_gradient_boosting"), default="random_forest")
+    train.add_argument("--n-estimators", type=int, default=100)
+    train.add_argument("--n-jobs", type=int, default=-1)
+    train.add_argument("--max-samples", type=float, default=None)
+    train.add_argument("--test-size", type=float, default=0.2)
+    train.add_argument("--output", default=DEFAULT_BUNDLE_PATH)
+    train.add_argument("--compact-output", default=DEFAULT_COMPACT_PATH,
+                       help="direktori forest ringkas untuk scoring (random_forest saja); '' = lewati")
+    train.set_defaults(handler=cmd_train)
+
+    score = subcommands.add_parser("score", help="menilai data baru dengan bundle tersimpan")
+    score.add_argument("--model", default=DEFAULT_BUNDLE_PATH,
+                       help=f"bundle joblib atau direktori forest ringkas (mis. {DEFAULT_COMPACT_PATH})")
+    score.add_argument("--input", required=True, help="CSV survei, file .jsonl, atau '-' untuk JSON dari stdin")
+    score.add_argument("--output", default="-", help="CSV output, atau '-' untuk stdout")
+    score.add_argument("--batch-size", type=int, default=50_000)
+    score.add_argument("--workers", type=int, default=1)
+    score.add_argument("--executor", choices=("thread", "process"), default="thread")
+    score.set_defaults(handler=cmd_score)
+
+    plot = subcommands.add_parser("plot", help="merender ulang plot dari results.json")
+    plot.add_argument("--results", default=DEFAULT_RESULTS_PATH)
+    plot.add_argument("--plots-dir", default="plots_output")
+    plot.add_argument("--only", nargs="+", default=None, help="nama plot tertentu saja")
+    plot.add_argument("--preview", action="store_true")
+    plot.add_argument("--force", action="store_true")
+    plot.set_defaults(handler=cmd_plot)
+
+    summarize = subcommands.add_parser("summarize", help="ringkasan eksekutif via LLM")
+    summarize.add_argument("--results", default=DEFAULT_RESULTS_PATH)
+    summarize.add_argument("--prompt", default=None, help="default: prompt di results.json")
+    summarize.add_argument("--backend", choices=("mock", "replicate"), default="replicate")
+    summarize.add_argument("--max-new-tokens", type=int, default=250)
+    summarize.add_argument("--temperature", type=float, default=0.7)
+    summarize.set_defaults(handler=cmd_summarize)
+
+    deck = subcommands.add_parser("deck", help="membangun presentasi PPTX dari results.json")
+    deck.add_argument("--results", default=DEFAULT_RESULTS_PATH)
+    deck.add_argument("--output", default=DEFAULT_DECK_PATH)
+    deck.add_argument("--image-dpi", type=int, default=150, help="0 = embed figure tanpa resample")
+    deck.add_argument("--image-format", choices=("png", "png8", "jpeg"), default="png")
+    deck.set_defaults(handler=cmd_deck)
+
+    analyze = subcommands.add_parser("analyze", help="pipeline lengkap (konfigurasi via environment variable)")
+    analyze.set_defaults(handler=cmd_analyze)
+
+    # Argumen diteruskan apa adanya ke `pipeline.main` (lihat `python cli.py pipeline --help`).
+    pipeline = subcommands.add_parser("pipeline", help="pipeline DAG dengan cache per tahap", add_help=False)
+    pipeline.set_defaults(handler=cmd_pipeline)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args, extra = parser.parse_known_args(argv)
+    if args.command == "pipeline":
+        args.pipeline_args = extra
+    elif extra:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+
+# --- SKEMA DATASET SURVEI ---
+# Kategori disusun berurutan secara leksikografis supaya `cat.codes` yang
+# dihasilkan sama dengan `astype('category').cat.codes` pada versi lama.
+YES_NO = CategoricalDtype(["No", "Yes"])
+YES_NO_DONT_KNOW = CategoricalDtype(["Don't know", "No", "Yes"])
+YES_NO_MAYBE = CategoricalDtype(["Maybe", "No", "Yes"])
+YES_NO_SOME = CategoricalDtype(["No", "Some of them", "Yes"])
+
+SURVEY_SCHEMA = {
+    "Timestamp": "datetime",
+    "Age": "int8",
+    "Gender": "category",  # dinormalisasi oleh cleaning.normalize_gender
+    "Country": "category",
+    "state": "category",
+    "self_employed": YES_NO_DONT_KNOW,  # NA diisi "Don't know" saat cleaning
+    "family_history": YES_NO,
+    "treatment": YES_NO,
+    "work_interfere": CategoricalDtype(["Don't know", "Never", "Often", "Rarely", "Sometimes"]),
+    "no_employees": CategoricalDtype(["1-5", "100-500", "26-100", "500-1000", "6-25", "More than 1000"]),
+    "remote_work": YES_NO,
+    "tech_company": YES_NO,
+    "benefits": YES_NO_DONT_KNOW,
+    "care_options": CategoricalDtype(["No", "Not sure", "Yes"]),
+    "wellness_program": YES_NO_DONT_KNOW,
+    "seek_help": YES_NO_DONT_KNOW,
+    "anonymity": YES_NO_DONT_KNOW,
+    "leave": CategoricalDtype(["Don't know", "Somewhat difficult", "Somewhat easy", "Very difficult", "Very easy"]),
+    "mental_health_consequence": YES_NO_MAYBE,
+    "phys_health_consequence": YES_NO_MAYBE,
+    "coworkers": YES_NO_SOME,
+    "supervisor": YES_NO_SOME,
+    "mental_health_interview": YES_NO_MAYBE,
+    "phys_health_interview": YES_NO_MAYBE,
+    "mental_vs_physical": YES_NO_DONT_KNOW,
+    "obs_consequence": YES_NO,
+    "comments": "object",
+}
+SURVEY_COLUMNS = list(SURVEY_SCHEMA)
+
+# Age memakai integer nullable: nilai yang tidak bisa di-parse atau tidak muat di
+# int8 (mis. "abc", 329, 99999999999) menjadi NA, bukan sentinel yang bisa
+# tertukar dengan Age mentah yang sah.
+AGE_DTYPE = "Int8"
+
+
+def _read_dtypes(columns):
+    """Dtype yang diberikan ke `pd.read_csv` (Timestamp & Age di-parse terpisah)."""
+    dtypes = {}
+    for col in columns:
+        dtype = SURVEY_SCHEMA[col]
+        # Kategori dibaca dinamis agar jawaban di luar vocabulary skema tidak hilang menjadi NaN.
+        if dtype == "category" or isinstance(dtype, CategoricalDtype):
+            dtypes[col] = "category"
+        elif col != "Age" and dtype != "datetime":
+            dtypes[col] = dtype
+    return dtypes
+
+
+def parse_age(values):
+    """Age mentah (angka atau teks) -> Int8 nullable; NA jika bukan bilangan bulat yang muat di int8."""
+    age = pd.to_numeric(pd.Series(values), errors="coerce").to_numpy(dtype=np.float64)
+    valid = (age >= np.iinfo(np.int8).min) & (age <= np.iinfo(np.int8).max) & (age == np.floor(age))
+    return pd.arrays.IntegerArray(np.where(valid, age, 0).astype(np.int8), ~valid)
+
+
+def schema_categorical(values, dtype):
+    """
+    Kategorikal dengan kategori skema di urutan yang sama, ditambah nilai di luar
+    vocabulary skema di belakangnya (apa adanya). Encoder memetakan nilai tambahan
+    itu ke `UNKNOWN_CODE`, bukan ke NA yang lalu diisi sebagai jawaban sah.
+    """
+    values = pd.Series(values)
+    if not isinstance(values.dtype, CategoricalDtype):
+        values = values.astype("category")
+    extra = values.cat.categories.difference(dtype.categories)
+    return values.cat.set_categories(list(dtype.categories) + list(extra))
+
+
+def _finalize_chunk(chunk):
+    """Menerapkan tipe akhir yang tidak bisa ditangani `read_csv` secara langsung."""
+    chunk.columns = chunk.columns.str.strip()
+    for col in chunk.columns:
+        dtype = SURVEY_SCHEMA.get(col)
+        if isinstance(dtype, CategoricalDtype):
+            chunk[col] = schema_categorical(chunk[col], dtype)
+        elif dtype == "category" and not isinstance(chunk[col].dtype, CategoricalDtype):
+            chunk[col] = chunk[col].astype("category")
+    if "Age" in chunk.columns:
+        chunk["Age"] = parse_age(chunk["Age"])
+    if "Timestamp" in chunk.columns:
+        chunk["Timestamp"] = pd.to_datetime(chunk["Timestamp"], errors="coerce")
+    return chunk
+
+
+def records_to_frame(records):
+    """
+    Mengubah record (list of dict, mis. dari JSON) menjadi DataFrame dengan tipe
+    skema survei yang sama seperti hasil `load_survey`.
+    """
+    return _finalize_chunk(pd.DataFrame.from_records(list(records)))
+
+
+def _select_columns(usecols=None, include_comments=False):
+    columns = list(usecols) if usecols is not None else SURVEY_COLUMNS
+    if not include_comments and usecols is None:
+        columns = [col for col in columns if col != "comments"]
+    unknown = [col for col in columns if col not in SURVEY_SCHEMA]
+    if unknown:
+        raise ValueError(f"Kolom tidak dikenal di skema survei: {unknown}")
+    return columns
+
+
+def iter_survey(path, chunksize=100_000, usecols=None, include_comments=False, transform=None, names=None):
+    """
+    Membaca survei per chunk dengan skema bertipe.
+    Jika `transform` diberikan, fungsi itu dijalankan pada setiap chunk sebelum
+    di-yield, sehingga cleaning/encoding tidak pernah memegang seluruh file.
+    `path` boleh berupa file object; beri `names` jika posisinya sudah melewati header.
+    """
+    columns = _select_columns(usecols, include_comments)
+    reader = pd.read_csv(path, usecols=columns, dtype=_read_dtypes(columns), chunksize=chunksize,
+                         names=names, header=None if names is not None else "infer")
+    with reader:
+        for chunk in reader:
+            chunk = _finalize_chunk(chunk)
+            yield transform(chunk) if transform is not None else chunk
+
+
+def _concat_chunks(chunks):
+    """Menggabungkan chunk; kategori kolom kategorikal disatukan antar chunk."""
+    if len(chunks) == 1:
+        return chunks[0]
+    for col in chunks[0].columns:
+        if not isinstance(chunks[0][col].dtype, CategoricalDtype):
+            continue
+        schema = SURVEY_SCHEMA.get(col)
+        if not isinstance(schema, CategoricalDtype):
+            categories = pd.api.types.union_categoricals([chunk[col] for chunk in chunks]).categories
+            categories = categories.sort_values()
+        elif all(chunk[col].dtype == chunks[0][col].dtype for chunk in chunks):
+            continue
+        else:
+            # Kategori skema tetap di depan; nilai di luar vocabulary dari semua chunk di belakang.
+            extra = pd.Index([]).append([chunk[col].cat.categories.difference(schema.categories) for chunk in chunks])
+            categories = list(schema.categories) + sorted(extra.unique())
+        for chunk in chunks:
+            chunk[col] = chunk[col].cat.set_categories(categories)
+    return pd.concat(chunks, ignore_index=True)
+
+
+def load_survey(path, usecols=None, include_comments=False, chunksize=None, transform=None):
+    """
+    Memuat survei sebagai satu DataFrame bertipe.
+    Dengan `chunksize`, file dibaca bertahap dan hanya hasil `transform` per chunk
+    yang disimpan: string mentah CSV hanya dipegang untuk satu chunk, tetapi hasil
+    akhirnya tetap seluruh baris (kategori & Int8), jadi memori tumbuh dengan jumlah
+    baris. Untuk pemrosesan yang benar-benar terbatas, pakai `iter_survey`.
+    """
+    if chunksize is None:
+        columns = _select_columns(usecols, include_comments)
+        df = _finalize_chunk(pd.read_csv(path, usecols=columns, dtype=_read_dtypes(columns)))
+        return transform(df) if transform is not None else df
+    chunks = list(iter_survey(path, chunksize, usecols, include_comments, transform))
+    return _concat_chunks(chunks)
@@ -0,0 +1,153 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from cleaning import GENDER_SYNONYMS, clean_survey
+from encoder import CategoricalEncoder
+from validation import DEFAULT_QUARANTINE_PATH, SurveyValidator, load_validated_survey
+
+# Naikkan jika format file cache berubah, agar cache lama otomatis tidak terpakai.
+CACHE_FORMAT_VERSION = 1
+DEFAULT_CACHE_DIR = os.path.join(".cache", "dataset")
+
+# Kolom yang tidak dipakai sebagai fitur model, dan kolom target.
+DROP_COLUMNS = ['Timestamp', 'state', 'comments']
+TARGET_COLUMN = 'treatment'
+
+
+def file_digest(path, block_size=1 << 20):
+    """SHA-256 isi file, dibaca per blok agar tidak memuat seluruh file ke memori."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_key(csv_path, config):
+    """Kunci cache = hash isi CSV + konfigurasi cleaning/encoding."""
+    payload = json.dumps(
+        {"csv": file_digest(csv_path), "config": config, "version": CACHE_FORMAT_VERSION},
+        sort_keys=True, ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+class CachedDataset:
+    """Matriks fitur ter-encode + target, dimuat via memmap (tanpa salin)."""
+
+    def __init__(self, X, y, feature_names, encoder, key=None):
+        self.X = X
+        self.y = y
+        self.feature_names = list(feature_names)
+        self.encoder = encoder
+        self.key = key
+
+
+def save_dataset(cache_dir, key, X, y, feature_names, encoder):
+    """Menulis dataset ke `<cache_dir>/<key>/` secara atomik."""
+    os.makedirs(cache_dir, exist_ok=True)
+    target = os.path.join(cache_dir, key)
+    tmp_dir = tempfile.mkdtemp(prefix=f".{key}-", dir=cache_dir)
+    try:
+        np.save(os.path.join(tmp_dir, "X.npy"), np.ascontiguousarray(X))
+        np.save(os.path.join(tmp_dir, "y.npy"), np.ascontiguousarray(y))
+        encoder.save(os.path.join(tmp_dir, "encoder.json"))
+        with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"feature_names": list(feature_names), "rows": int(len(y))}, f, indent=2)
+        if os.path.exists(target):
+            shutil.rmtree(target)
+        os.replace(tmp_dir, target)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    return target
+
+
+def load_dataset(cache_dir, key):
+    """Memuat dataset dari cache (memmap read-only); None jika belum ada."""
+    target = os.path.join(cache_dir, key)
+    meta_path = os.path.join(target, "meta.json")
+    if not os.path.exists(meta_path):
+        return None
+    with open(meta_path, encoding="utf-8") as f:
+        meta = json.load(f)
+    X = np.load(os.path.join(target, "X.npy"), mmap_mode="r")
+    y = np.load(os.path.join(target, "y.npy"), mmap_mode="r")
+    encoder = CategoricalEncoder.load(os.path.join(target, "encoder.json"))
+    return CachedDataset(X, y, meta["feature_names"], encoder, key=key)
+
+
+def load_or_build(csv_path, build_fn, config, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Mengembalikan (dataset, cache_hit).
+    `build_fn()` hanya dipanggil jika kunci untuk CSV + config belum ada di cache;
+    harus mengembalikan (X_df, y, encoder) hasil cleaning & encoding.
+    """
+    key = cache_key(csv_path, config)
+    dataset = load_dataset(cache_dir, key)
+    if dataset is not None:
+        return dataset, True
+    X_df, y, encoder = build_fn()
+    save_dataset(cache_dir, key, feature_matrix(X_df), np.asarray(y), X_df.columns, encoder)
+    return load_dataset(cache_dir, key), False
+
+
+def feature_matrix(X_df):
+    """Satu dtype bersama (int8/int16) agar matriks bisa di-memmap sebagai satu blok."""
+    return X_df.to_numpy(dtype=np.result_type(*X_df.dtypes))
+
+
+# --- DATASET SURVEI STANDAR ---
+def survey_cleaning_config():
+    """Konfigurasi cleaning/encoding standar; ikut menentukan kunci cache."""
+    return {
+        "gender_synonyms": GENDER_SYNONYMS,
+        "fill_value": "Don't know",
+        "drop_cols": DROP_COLUMNS,
+        "target": TARGET_COLUMN,
+        "validation": SurveyValidator().config(),
+    }
+
+
+def build_survey_dataset(csv_path, chunksize=100_000, verbose=True, quarantine_path=DEFAULT_QUARANTINE_PATH):
+    """
+    Load per chunk + validasi + cleaning + encoding; mengembalikan (X_df, y, encoder).
+    Baris yang gagal validasi ditulis ke `quarantine_path` (+ `<nama>_report.json`).
+    """
+    df, report = load_validated_survey(csv_path, chunksize=chunksize, transform=clean_survey,
+                                       quarantine_path=quarantine_path)
+    if quarantine_path:
+        report.save(f"{os.path.splitext(quarantine_path)[0]}_report.json")
+    if verbose:
+        print("📊 Dataset Loaded!")
+        print(df.head())
+        print(f"\n🧪 Validasi: {report.valid:,} baris valid, {report.quarantined:,} dikarantina "
+              f"({report.to_dict()['rule_counts'] or '-'})")
+        print("\n✅ Data Cleaning Selesai.")
+
+    X_df, y, encoder = encode_survey(df)
+    if verbose:
+        print("\n✅ Kolom Kategorikal Dikodekan.")
+    return X_df, y, encoder
+
+
+def encode_survey(df):
+    """Survei yang sudah dibersihkan -> (X_df, y, encoder); kolom non-fitur dibuang."""
+    # Vocabulary per kolom disimpan agar data baru dikodekan konsisten dengan model.
+    df = df.drop(columns=[col for col in DROP_COLUMNS if col in df.columns])
+    encoder = CategoricalEncoder().fit(df)
+    df = encoder.transform(df)
+    return df.drop(TARGET_COLUMN, axis=1), df[TARGET_COLUMN], encoder
+
+
+def load_survey_dataset(csv_path, chunksize=100_000, cache_dir=DEFAULT_CACHE_DIR, verbose=True):
+    """Dataset survei ter-encode dari cache, atau dibangun jika CSV/config berubah."""
+    return load_or_build(
+        csv_path, lambda: build_survey_dataset(csv_path, chunksize, verbose),
+        survey_cleaning_config(), cache_dir,
+    )
@@ -0,0 +1,102 @@
+"""
+Pembuatan banyak deck PPTX sekaligus (mis. satu per segmen/departemen).
+
+Template bergaya (background, footer) dibangun sekali di proses induk, lalu
+setiap worker meng-clone template itu untuk setiap deck. Setiap deck dibangun
+dari artefak hasil (`results.json`) dengan struktur yang sama seperti output
+Mental_Health_Data.py.
+
+Contoh:
+    python deck_builder.py model_output/results.json --repeat 200 --workers 8 --output-dir decks
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+from presentasi_mental_health import build_presentation, build_template
+from results_artifact import AnalysisResults
+from slide_images import DEFAULT_SLIDE_DPI, FORMATS, ImagePreparer
+
+_template_bytes = None
+_image_preparer = None
+
+
+def _init_worker(template_bytes, image_options):
+    global _template_bytes, _image_preparer
+    _template_bytes = template_bytes
+    # Satu preparer per worker: figure identik antar deck hanya di-resample sekali.
+    _image_preparer = ImagePreparer(**image_options) if image_options is not None else None
+
+
+def build_deck(results_path, output_path, template_bytes=None, image_preparer=None):
+    """Membangun satu deck; mengembalikan statistik waktu & ukuran."""
+    started = time.perf_counter()
+    results = AnalysisResults.load(results_path)
+    prs = build_presentation(
+        results,
+        template_bytes=template_bytes if template_bytes is not None else _template_bytes,
+        image_preparer=image_preparer if image_preparer is not None else _image_preparer,
+    )
+    prs.save(output_path)
+    return {
+        "deck": output_path,
+        "results": results_path,
+        "build_seconds": time.perf_counter() - started,
+        "size_bytes": os.path.getsize(output_path),
+    }
+
+
+def generate_decks(jobs, workers=None, image_options=None):
+    """
+    `jobs` = [(results_path, output_path), ...]. Template dibangun sekali lalu
+    dibagikan ke worker lewat initializer. `image_options` (argumen
+    `ImagePreparer`, mis. {"dpi": 150, "fmt": "png8"}) mengaktifkan resample
+    figure; None = embed figure apa adanya. Mengembalikan DataFrame statistik per deck.
+    """
+    template_bytes = build_template()
+    for _, output_path in jobs:
+        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                             initializer=_init_worker, initargs=(template_bytes, image_options)) as pool:
+        futures = [pool.submit(build_deck, results_path, output_path) for results_path, output_path in jobs]
+        return pd.DataFrame([future.result() for future in futures])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("results", nargs="+", help="satu atau lebih artefak results.json")
+    parser.add_argument("--output-dir", default="decks")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--repeat", type=int, default=1, help="jumlah deck per artefak (untuk benchmark)")
+    parser.add_argument("--image-dpi", type=int, default=DEFAULT_SLIDE_DPI, help="0 = embed figure tanpa resample")
+    parser.add_argument("--image-format", choices=FORMATS, default="png")
+    parser.add_argument("--image-cache-dir", default=os.path.join(".cache", "slide_images"))
+    args = parser.parse_args()
+
+    jobs = []
+    for j, results_path in enumerate(args.results):
+        stem = os.path.splitext(os.path.basename(results_path))[0]
+        if len(args.results) > 1:
+            stem = f"{j:03d}_{stem}"
+        for i in range(args.repeat):
+            suffix = f"_{i:04d}" if args.repeat > 1 else ""
+            jobs.append((results_path, os.path.join(args.output_dir, f"{stem}{suffix}.pptx")))
+
+    started = time.perf_counter()
+    image_options = None
+    if args.image_dpi > 0:
+        image_options = {"dpi": args.image_dpi, "fmt": args.image_format, "cache_dir": args.image_cache_dir}
+    stats = generate_decks(jobs, args.workers, image_options)
+    elapsed = time.perf_counter() - started
+    print(stats.head(10).to_string(index=False))
+    print(f"\n✅ {len(stats)} deck dalam {elapsed:.2f} s ({len(stats) / elapsed:.1f} deck/s); "
+          f"rata-rata build {stats['build_seconds'].mean():.3f} s, "
+          f"ukuran rata-rata {stats['size_bytes'].mean() / 1e6:.2f} MB")
+    stats.to_csv(os.path.join(args.output_dir, "deck_stats.csv"), index=False)
+
+
+if __name__ == "__main__":
+    main()
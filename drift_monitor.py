@@ -0,0 +1,310 @@
+"""
+Monitoring drift distribusi jawaban survei per jendela waktu (kolom Timestamp).
+
+Setiap jendela (default: per bulan) disimpan sebagai sketch berukuran terbatas:
+- tabel frekuensi per kolom kategorikal (maks. `max_categories` label; sisanya
+  masuk ke bucket `__other__`);
+- histogram Age per tahun usia dalam `AGE_BOUNDS`, cukup untuk kuantil eksak
+  karena Age sudah divalidasi sebagai bilangan bulat.
+
+Referensi adalah sketch dari data training. Setiap run hanya membaca baris yang
+ditambahkan setelah offset byte terakhir (lihat `incremental.iter_new_rows`) dan
+menggabungkannya ke sketch jendelanya, tanpa membaca ulang histori. Per jendela
+dihitung PSI dan divergensi Jensen-Shannon terhadap referensi; jendela dengan
+baris cukup dan kolom yang melewati ambang ditandai layak retrain.
+
+Contoh (dijalankan berkala setelah data baru di-append):
+    python drift_monitor.py --survey survey.csv --freq M --psi-threshold 0.2
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+
+from cleaning import clean_survey
+from data_loader import SURVEY_SCHEMA
+from dataset_cache import DROP_COLUMNS, TARGET_COLUMN
+from incremental import _complete_end, iter_new_rows, population_stability_index
+from validation import AGE_BOUNDS, iter_validated_survey
+
+STATE_FORMAT_VERSION = 1
+DEFAULT_STATE_PATH = os.path.join("model_output", "drift", "state.json")
+OTHER_LABEL = "__other__"
+MISSING_LABEL = "__missing__"
+MONITORED_COLUMNS = [
+    col for col, dtype in SURVEY_SCHEMA.items()
+    if col not in DROP_COLUMNS and (dtype == "category" or isinstance(dtype, CategoricalDtype))
+]
+AGE_PSI_BINS = 10
+
+
+def jensen_shannon(expected, actual):
+    """Divergensi Jensen-Shannon (basis 2, rentang 0-1) antara dua vektor hitungan."""
+    p = np.asarray(expected, dtype=np.float64)
+    q = np.asarray(actual, dtype=np.float64)
+    if p.sum() == 0 or q.sum() == 0:
+        return 0.0
+    p, q = p / p.sum(), q / q.sum()
+    m = (p + q) / 2
+
+    def kl(a):
+        nonzero = a > 0
+        return np.sum(a[nonzero] * np.log2(a[nonzero] / m[nonzero]))
+
+    return float((kl(p) + kl(q)) / 2)
+
+
+class CategorySketch:
+    """Tabel frekuensi label dengan jumlah label dibatasi."""
+
+    def __init__(self, counts=None, max_categories=200):
+        self.counts = dict(counts or {})
+        self.max_categories = max_categories
+
+    def add(self, values):
+        values = pd.Series(values)
+        tally = values.value_counts(sort=False)
+        missing = int(values.isna().sum())
+        items = [(str(label), int(count)) for label, count in tally.items() if count]
+        if missing:
+            items.append((MISSING_LABEL, missing))
+        for label, count in items:
+            if label not in self.counts and len(self.counts) >= self.max_categories:
+                label = OTHER_LABEL
+            self.counts[label] = self.counts.get(label, 0) + count
+
+    def aligned(self, other):
+        """Vektor hitungan (self, other) atas gabungan label keduanya."""
+        labels = sorted(set(self.counts) | set(other.counts))
+        return ([self.counts.get(label, 0) for label in labels],
+                [other.counts.get(label, 0) for label in labels])
+
+
+class AgeSketch:
+    """Histogram Age per tahun usia; kuantil eksak dengan memori tetap."""
+
+    def __init__(self, counts=None, bounds=AGE_BOUNDS):
+        self.bounds = tuple(bounds)
+        size = self.bounds[1] - self.bounds[0] + 1
+        self.counts = np.asarray(counts if counts is not None else np.zeros(size), dtype=np.int64)
+
+    def add(self, ages):
+        ages = np.asarray(ages, dtype=np.int64)
+        ages = ages[(ages >= self.bounds[0]) & (ages <= self.bounds[1])]
+        self.counts += np.bincount(ages - self.bounds[0], minlength=len(self.counts))
+
+    def quantile(self, q):
+        cumulative = np.cumsum(self.counts)
+        if cumulative[-1] == 0:
+            return None
+        return self.bounds[0] + int(np.searchsorted(cumulative, q * cumulative[-1]))
+
+    def binned(self, edges):
+        """Hitungan per bin [edges[i], edges[i+1]) dari histogram."""
+        ages = np.arange(self.bounds[0], self.bounds[1] + 1)
+        return np.bincount(np.digitize(ages, edges), weights=self.counts, minlength=len(edges) + 1)
+
+    def psi_edges(self, bins=AGE_PSI_BINS):
+        """Batas bin kuantil (dipakai dari sketch referensi)."""
+        edges = [self.quantile(q) for q in np.linspace(0, 1, bins + 1)[1:-1]]
+        return sorted({edge for edge in edges if edge is not None})
+
+
+class WindowSketch:
+    """Sketch satu jendela waktu: jumlah baris, frekuensi per kolom, histogram Age."""
+
+    def __init__(self, payload=None, max_categories=200):
+        payload = payload or {}
+        self.rows = payload.get("rows", 0)
+        self.max_categories = max_categories
+        self.columns = {col: CategorySketch(counts, max_categories)
+                        for col, counts in payload.get("columns", {}).items()}
+        self.age = AgeSketch(payload.get("age"))
+
+    def add(self, chunk):
+        self.rows += len(chunk)
+        for col in MONITORED_COLUMNS:
+            if col in chunk.columns:
+                self.columns.setdefault(col, CategorySketch(max_categories=self.max_categories)).add(chunk[col])
+        if "Age" in chunk.columns:
+            self.age.add(chunk["Age"])
+
+    def target_rate(self, target=TARGET_COLUMN, positive="Yes"):
+        counts = self.columns.get(target, CategorySketch()).counts
+        total = sum(counts.values())
+        return counts.get(positive, 0) / total if total else None
+
+    def to_dict(self):
+        return {"rows": self.rows, "columns": {col: sketch.counts for col, sketch in self.columns.items()},
+                "age": self.age.counts.tolist()}
+
+
+def compare(reference, window):
+    """PSI & JS per kolom (termasuk Age per bin kuantil referensi) + label baru."""
+    scores = {}
+    for col, sketch in window.columns.items():
+        ref = reference.columns.get(col)
+        if ref is None:
+            continue
+        expected, actual = ref.aligned(sketch)
+        new_labels = sorted(label for label in sketch.counts if label not in ref.counts)
+        scores[col] = {"psi": population_stability_index(expected, actual), "js": jensen_shannon(expected, actual),
+                       "new_labels": new_labels}
+    edges = reference.age.psi_edges()
+    expected, actual = reference.age.binned(edges), window.age.binned(edges)
+    scores["Age"] = {"psi": population_stability_index(expected, actual), "js": jensen_shannon(expected, actual),
+                     "new_labels": []}
+    return scores
+
+
+class DriftMonitor:
+    def __init__(self, survey_path, state_path=DEFAULT_STATE_PATH, freq="M", reference_path=None,
+                 psi_threshold=0.2, js_threshold=0.1, min_window_rows=100, max_windows=36, max_categories=200,
+                 chunksize=100_000):
+        self.survey_path = survey_path
+        self.state_path = state_path
+        self.freq = freq
+        self.reference_path = reference_path
+        self.psi_threshold = psi_threshold
+        self.js_threshold = js_threshold
+        # Jendela kecil terlalu berisik untuk dijadikan dasar retrain.
+        self.min_window_rows = min_window_rows
+        self.max_windows = max_windows
+        self.max_categories = max_categories
+        self.chunksize = chunksize
+
+    # --- STATE ---
+    def _load_state(self):
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None
+        if (state.get("version") != STATE_FORMAT_VERSION or state.get("freq") != self.freq
+                or state.get("survey_path") != self.survey_path
+                or os.path.getsize(self.survey_path) < state.get("byte_offset", 0)):
+            return None
+        return state
+
+    def _save_state(self, state):
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.state_path) or ".", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.state_path)
+
+    def build_reference(self, path):
+        """Sketch referensi dari data training (satu pass streaming)."""
+        reference = WindowSketch(max_categories=self.max_categories)
+        for chunk in iter_validated_survey(path, self.chunksize, transform=clean_survey):
+            reference.add(chunk)
+        return reference
+
+    def _initial_state(self, backfill):
+        reference = self.build_reference(self.reference_path or self.survey_path)
+        # Tanpa backfill, seluruh isi file saat ini dianggap data training.
+        offset = 0 if backfill or self.reference_path else _complete_end(self.survey_path)
+        return {"version": STATE_FORMAT_VERSION, "freq": self.freq, "survey_path": self.survey_path,
+                "byte_offset": offset, "reference": reference.to_dict(), "windows": {}}
+
+    # --- RUN ---
+    def run(self, backfill=False):
+        """Memproses baris baru ke sketch jendelanya; mengembalikan (laporan, baris_baru)."""
+        state = self._load_state()
+        if state is None:
+            state = self._initial_state(backfill)
+        windows = {label: WindowSketch(payload, self.max_categories) for label, payload in state["windows"].items()}
+
+        chunks, end = iter_new_rows(self.survey_path, state["byte_offset"], self.chunksize)
+        added = 0
+        for chunk in chunks:
+            chunk = clean_survey(chunk)
+            labels = chunk["Timestamp"].dt.to_period(self.freq).astype(str).to_numpy()
+            for label in np.unique(labels):
+                windows.setdefault(label, WindowSketch(max_categories=self.max_categories)).add(chunk[labels == label])
+            added += len(chunk)
+
+        # Hanya `max_windows` jendela terbaru yang disimpan (memori & ukuran state tetap).
+        kept = sorted(windows)[-self.max_windows:]
+        state["windows"] = {label: windows[label].to_dict() for label in kept}
+        state["byte_offset"] = end
+        self._save_state(state)
+        reference = WindowSketch(state["reference"], self.max_categories)
+        return self.report(reference, {label: windows[label] for label in kept}), added
+
+    def report(self, reference, windows):
+        rows = []
+        for label, window in windows.items():
+            scores = compare(reference, window)
+            flagged = sorted(col for col, score in scores.items()
+                             if score["psi"] >= self.psi_threshold or score["js"] >= self.js_threshold)
+            worst = max(scores, key=lambda col: scores[col]["psi"])
+            rows.append({
+                "window": label,
+                "rows": window.rows,
+                "treatment_rate": window.target_rate(),
+                "max_psi_column": worst,
+                "max_psi": scores[worst]["psi"],
+                "flagged": flagged,
+                "new_labels": {col: score["new_labels"] for col, score in scores.items() if score["new_labels"]},
+                "retrain": bool(flagged) and window.rows >= self.min_window_rows,
+                "scores": scores,
+            })
+        return {
+            "reference_rows": reference.rows,
+            "reference_treatment_rate": reference.target_rate(),
+            "thresholds": {"psi": self.psi_threshold, "js": self.js_threshold, "min_window_rows": self.min_window_rows},
+            "windows": rows,
+            "retrain": any(row["retrain"] for row in rows),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--survey", default="survey.csv")
+    parser.add_argument("--reference", default=None,
+                        help="CSV training terpisah; default: isi survei saat run pertama")
+    parser.add_argument("--state", default=DEFAULT_STATE_PATH)
+    parser.add_argument("--freq", default="M", help="periode jendela pandas (D, W, M, Q)")
+    parser.add_argument("--psi-threshold", type=float, default=0.2)
+    parser.add_argument("--js-threshold", type=float, default=0.1)
+    parser.add_argument("--min-window-rows", type=int, default=100)
+    parser.add_argument("--max-windows", type=int, default=36)
+    parser.add_argument("--backfill", action="store_true",
+                        help="run pertama: isi jendela dari seluruh file (referensi = file yang sama)")
+    parser.add_argument("--report", default=os.path.join("model_output", "drift", "report.json"))
+    parser.add_argument("--fail-on-drift", action="store_true", help="exit code 1 jika ada jendela layak retrain")
+    args = parser.parse_args()
+
+    monitor = DriftMonitor(args.survey, args.state, args.freq, args.reference, args.psi_threshold,
+                           args.js_threshold, args.min_window_rows, args.max_windows)
+    started = time.perf_counter()
+    report, added = monitor.run(backfill=args.backfill)
+    print(f"📥 {added:,} baris baru diproses dalam {time.perf_counter() - started:.2f} s; "
+          f"referensi {report['reference_rows']:,} baris (rate treatment {report['reference_treatment_rate']:.3f})")
+    print(f"\n{'jendela':<10}{'baris':>8}{'treatment':>11}  {'PSI tertinggi':<32}retrain")
+    for row in report["windows"]:
+        rate = f"{row['treatment_rate']:.3f}" if row["treatment_rate"] is not None else "-"
+        worst = f"{row['max_psi_column']} = {row['max_psi']:.3f}"
+        print(f"{row['window']:<10}{row['rows']:>8,}{rate:>11}  {worst:<32}{'⚠️ ya' if row['retrain'] else '-'}")
+        if row["new_labels"]:
+            print(f"{'':<10}label baru: {row['new_labels']}")
+
+    os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 Laporan drift disimpan di: {args.report}")
+    if report["retrain"]:
+        print("⚠️ Drift melewati ambang pada jendela dengan data cukup: pertimbangkan retrain.")
+        if args.fail_on_drift:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import json
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+
+# Kode khusus di luar rentang vocabulary.
+MISSING_CODE = -1  # NA, sama seperti `cat.codes`
+UNKNOWN_CODE = -2  # kategori yang tidak pernah dilihat saat fit
+
+
+def _code_dtype(n_categories):
+    """Dtype integer terkecil yang cukup untuk vocabulary + kode khusus."""
+    for dtype in (np.int8, np.int16, np.int32):
+        if n_categories <= np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+class CategoricalEncoder:
+    """
+    Encoder kategorikal yang menyimpan vocabulary per kolom.
+    Setelah di-fit, batch baru di-transform dengan kode yang sama persis,
+    sehingga model tidak perlu melihat ulang data training.
+    """
+
+    def __init__(self, vocabularies=None):
+        self.vocabularies = dict(vocabularies or {})
+
+    @property
+    def columns(self):
+        return list(self.vocabularies)
+
+    def fit(self, df, columns=None):
+        """Mempelajari vocabulary kolom object/category (urut seperti `cat.codes`)."""
+        if columns is None:
+            # Predikat eksplisit: dtype 'str' pandas 3 tidak lagi ikut `select_dtypes('object')`.
+            columns = [col for col in df.columns
+                       if df[col].dtype == object or isinstance(df[col].dtype, (CategoricalDtype, pd.StringDtype))]
+        self.vocabularies = {}
+        for col in columns:
+            values = df[col]
+            if isinstance(values.dtype, CategoricalDtype):
+                categories = values.cat.categories
+            else:
+                categories = pd.Index(values.dropna().unique()).sort_values()
+            self.vocabularies[col] = [str(category) for category in categories]
+        return self
+
+    def transform(self, df):
+        """Mengganti kolom ter-fit dengan kode integer; kolom lain dibiarkan."""
+        out = df.copy(deep=False)
+        for col, vocabulary in self.vocabularies.items():
+            if col not in out.columns:
+                continue
+            values = out[col]
+            dtype = _code_dtype(len(vocabulary))
+            vocabulary = pd.Index(vocabulary)
+            if isinstance(values.dtype, CategoricalDtype):
+                # Cukup petakan kategori (sedikit), lalu lookup kode per baris.
+                lookup = vocabulary.get_indexer(values.cat.categories.astype(str))
+                lookup = np.where(lookup == -1, UNKNOWN_CODE, lookup)
+                lookup = np.append(lookup, MISSING_CODE).astype(dtype)
+                codes = lookup[values.cat.codes.to_numpy()]
+            else:
+                codes = vocabulary.get_indexer(values.astype(object)).astype(dtype)
+                codes[(codes == -1) & values.notna().to_numpy()] = UNKNOWN_CODE
+            out[col] = codes
+        return out
+
+    def fit_transform(self, df, columns=None):
+        return self.fit(df, columns).transform(df)
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"vocabularies": self.vocabularies}, f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f)["vocabularies"])
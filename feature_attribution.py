@@ -0,0 +1,177 @@
+"""
+Permutation importance paralel dengan interval kepercayaan.
+
+Importansi berbasis impurity (`feature_importances_`) bias ke fitur dengan
+banyak kode (Country, Age). Permutation importance mengukur penurunan skor
+saat satu kolom diacak, tetapi versi naif mahal pada test set besar. Di sini:
+- evaluasi dilakukan pada subsampel stratified (`max_rows`);
+- setiap pasangan (fitur, repeat) adalah task terpisah di process pool;
+- matriks fitur dibagikan lewat shared memory (read-only); worker hanya
+  memegang kolom teracak dan buffer blok baris kecil, bukan salinan matriks;
+- interval kepercayaan dari distribusi t atas penurunan skor per repeat.
+
+Contoh:
+    python feature_attribution.py --max-rows 5000 --repeats 10 --workers 4
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from shared_arrays import SharedArray
+
+SCORERS = ("roc_auc", "accuracy")
+# Baris per blok prediksi di worker: ukuran buffer kerja, bukan ukuran test set.
+ROW_BLOCK = 4096
+
+_worker = {}
+
+
+def stratified_subsample(y, max_rows, random_state=42):
+    """Indeks subsampel berukuran <= `max_rows` dengan proporsi kelas `y` dipertahankan."""
+    y = np.asarray(y)
+    if max_rows is None or len(y) <= max_rows:
+        return np.arange(len(y))
+    from sklearn.model_selection import train_test_split
+
+    rows, _ = train_test_split(np.arange(len(y)), train_size=max_rows, stratify=y, random_state=random_state)
+    return np.sort(rows)
+
+
+def _predict(model, X, scoring):
+    return model.predict_proba(X)[:, 1] if scoring == "roc_auc" else model.predict(X)
+
+
+def _metric(y, predictions, scoring):
+    if scoring == "roc_auc":
+        from sklearn.metrics import roc_auc_score
+        return roc_auc_score(y, predictions)
+    return float((predictions == y).mean())
+
+
+def _score(model, X, y, scoring):
+    return _metric(y, _predict(model, X, scoring), scoring)
+
+
+def _init_worker(model, X_handle, y_handle, scoring, random_state):
+    if hasattr(model, "n_jobs"):
+        model.n_jobs = 1  # paralelisme sudah di tingkat task
+    X = SharedArray.attach(X_handle)
+    y = SharedArray.attach(y_handle)
+    scratch = np.empty((min(ROW_BLOCK, len(X.array)), X.array.shape[1]), dtype=X.array.dtype)
+    _worker.update(model=model, X=X, y=y, scratch=scratch, scoring=scoring, random_state=random_state)
+
+
+def _permuted_score(feature, repeat):
+    """
+    Skor model setelah kolom `feature` diacak (seed deterministik per fitur & repeat).
+    Prediksi dibuat per blok baris: blok disalin ke buffer kecil, kolom `feature`
+    diganti nilai teracak, lalu hasilnya dikumpulkan sebelum metrik dihitung.
+    """
+    X, scratch, scoring = _worker["X"].array, _worker["scratch"], _worker["scoring"]
+    rng = np.random.default_rng([_worker["random_state"], feature, repeat])
+    permuted = X[rng.permutation(len(X)), feature]
+    predictions = None
+    for start in range(0, len(X), len(scratch)):
+        stop = min(start + len(scratch), len(X))
+        block = scratch[:stop - start]
+        block[:] = X[start:stop]
+        block[:, feature] = permuted[start:stop]
+        block_predictions = _predict(_worker["model"], block, scoring)
+        if predictions is None:
+            predictions = np.empty(len(X), dtype=block_predictions.dtype)
+        predictions[start:stop] = block_predictions
+    return feature, repeat, _metric(_worker["y"].array, predictions, scoring)
+
+
+def permutation_importance(model, X, y, feature_names=None, max_rows=5000, n_repeats=10, scoring="roc_auc",
+                           workers=None, confidence=0.95, random_state=42):
+    """
+    Permutation importance model yang sudah dilatih pada (X, y).
+    Mengembalikan DataFrame per fitur (importance_mean, importance_std,
+    ci_low, ci_high) terurut menurun, dengan `attrs` berisi skor baseline
+    dan jumlah baris yang dievaluasi. `workers=1` berjalan di proses ini.
+    """
+    if scoring not in SCORERS:
+        raise ValueError(f"Scoring tidak dikenal: {scoring!r} (pilihan: {', '.join(SCORERS)})")
+    from scipy import stats
+
+    rows = stratified_subsample(y, max_rows, random_state)
+    X_eval = np.asarray(X)[rows]
+    y_eval = np.asarray(y)[rows]
+    n_features = X_eval.shape[1]
+    feature_names = list(feature_names) if feature_names is not None else [f"x{i}" for i in range(n_features)]
+    baseline = _score(model, X_eval, y_eval, scoring)
+    tasks = [(feature, repeat) for feature in range(n_features) for repeat in range(n_repeats)]
+    scores = np.empty((n_features, n_repeats))
+
+    with SharedArray.publish(X_eval) as X_shared, SharedArray.publish(y_eval) as y_shared:
+        initargs = (model, X_shared.handle, y_shared.handle, scoring, random_state)
+        if workers == 1:
+            _init_worker(*initargs)
+            results = [_permuted_score(*task) for task in tasks]
+            _worker.clear()
+        else:
+            workers = workers or os.cpu_count()
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+                results = list(pool.map(_permuted_score, *zip(*tasks),
+                                        chunksize=max(1, len(tasks) // (workers * 4))))
+    for feature, repeat, score in results:
+        scores[feature, repeat] = score
+
+    drops = baseline - scores
+    mean = drops.mean(axis=1)
+    std = drops.std(axis=1, ddof=1) if n_repeats > 1 else np.zeros(n_features)
+    margin = stats.t.ppf((1 + confidence) / 2, max(n_repeats - 1, 1)) * std / np.sqrt(n_repeats)
+    table = pd.DataFrame({
+        "feature": feature_names,
+        "importance_mean": mean,
+        "importance_std": std,
+        "ci_low": mean - margin,
+        "ci_high": mean + margin,
+    }).sort_values("importance_mean", ascending=False, ignore_index=True)
+    table.attrs.update(baseline_score=baseline, scoring=scoring, rows=len(rows), n_repeats=n_repeats,
+                       confidence=confidence)
+    return table
+
+
+def main():
+    from sklearn.model_selection import train_test_split
+
+    from dataset_cache import load_survey_dataset
+    from scoring import DEFAULT_BUNDLE_PATH, ModelBundle
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--survey", default="survey.csv")
+    parser.add_argument("--bundle", default=DEFAULT_BUNDLE_PATH)
+    parser.add_argument("--test-size", type=float, default=0.2,
+                        help="porsi holdout (split sama dengan Mental_Health_Data.py); 0 = seluruh data")
+    parser.add_argument("--max-rows", type=int, default=5000)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--scoring", choices=SCORERS, default="roc_auc")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", default=os.path.join("model_output", "permutation_importance.csv"))
+    args = parser.parse_args()
+
+    dataset, _ = load_survey_dataset(args.survey, verbose=False)
+    bundle = ModelBundle.load(args.bundle)
+    X, y = dataset.X, dataset.y
+    if args.test_size > 0:
+        _, X, _, y = train_test_split(X, y, test_size=args.test_size, random_state=42)
+
+    started = time.perf_counter()
+    table = permutation_importance(bundle.model, X, y, dataset.feature_names, args.max_rows, args.repeats,
+                                   args.scoring, args.workers)
+    print(f"✅ Permutation importance {len(table)} fitur x {args.repeats} repeat pada {table.attrs['rows']:,} baris "
+          f"dalam {time.perf_counter() - started:.2f} s (baseline {args.scoring} {table.attrs['baseline_score']:.4f})")
+    print(table.head(10).to_string(index=False))
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    table.to_csv(args.output, index=False)
+    print(f"\n💾 Tabel importansi disimpan di: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,377 @@
+"""
+Pipeline inkremental untuk survei yang terus bertambah (append-only).
+
+State (high-water mark byte offset + Timestamp terakhir, jumlah kelas, distribusi
+kategori) disimpan di `model_output/incremental/state.json`. Setiap run hanya
+membaca baris baru setelah offset, membersihkan dan meng-encode baris itu dengan
+encoder tersimpan, lalu:
+- menambah pohon via warm-start jika baris baru sejak refresh >= `--retrain-rows`;
+- retrain penuh jika distribusi baru menyimpang (PSI >= `--drift-threshold`).
+
+Contoh (dijalankan berkala, mis. tiap jam):
+    python incremental.py --survey survey.csv --retrain-rows 5000
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from cleaning import clean_survey
+from data_loader import iter_survey
+from dataset_cache import DROP_COLUMNS, TARGET_COLUMN, build_survey_dataset, feature_matrix
+from encoder import UNKNOWN_CODE
+from scoring import ModelBundle
+from training import TrainingConfig, grow_forest, train_model
+from validation import QuarantineWriter, ValidationReport, iter_validated_survey
+
+DEFAULT_STATE_DIR = os.path.join("model_output", "incremental")
+PSI_EPSILON = 1e-4
+
+
+def population_stability_index(expected, actual):
+    """PSI antara dua vektor hitungan (atau proporsi) dengan bin yang sama."""
+    expected = np.asarray(expected, dtype=np.float64)
+    actual = np.asarray(actual, dtype=np.float64)
+    if expected.sum() == 0 or actual.sum() == 0:
+        return 0.0
+    p = np.clip(expected / expected.sum(), PSI_EPSILON, None)
+    q = np.clip(actual / actual.sum(), PSI_EPSILON, None)
+    return float(np.sum((q - p) * np.log(q / p)))
+
+
+class _BoundedReader:
+    """File object yang berhenti membaca pada byte `end` (baris terakhir yang utuh)."""
+
+    def __init__(self, f, end):
+        self._f = f
+        self._end = end
+
+    def read(self, size=-1):
+        remaining = self._end - self._f.tell()
+        if remaining <= 0:
+            return b""
+        return self._f.read(remaining if size is None or size < 0 else min(size, remaining))
+
+    def readline(self, size=-1):
+        remaining = self._end - self._f.tell()
+        return self._f.readline(remaining if size is None or size < 0 else min(size, remaining)) if remaining > 0 else b""
+
+    def __iter__(self):
+        return iter(self.readline, b"")
+
+
+def _complete_end(path):
+    """Offset setelah newline terakhir; baris yang masih ditulis dilewati."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        block = 1 << 16
+        while end > 0:
+            start = max(0, end - block)
+            f.seek(start)
+            data = f.read(end - start)
+            newline = data.rfind(b"\n")
+            if newline != -1:
+                return start + newline + 1
+            end = start
+    return 0
+
+
+def _header_info(path):
+    with open(path, "rb") as f:
+        header_line = f.readline()
+    columns = [col.strip().strip('"') for col in header_line.decode("utf-8").strip().split(",")]
+    return columns, len(header_line)
+
+
+def iter_new_rows(path, offset, chunksize=100_000, quarantine=None, report=None):
+    """
+    Membaca & memvalidasi baris baru mulai dari `offset` (byte) per chunk.
+    Baris yang gagal validasi dikirim ke `quarantine`. Mengembalikan (iterator chunk, offset_akhir).
+    """
+    columns, header_end = _header_info(path)
+    offset = max(offset, header_end)
+    end = _complete_end(path)
+    if end <= offset:
+        return iter(()), offset
+    usecols = [col for col in columns if col != "comments"]
+
+    def chunks():
+        with open(path, "rb") as f:
+            f.seek(offset)
+            reader = _BoundedReader(f, end)
+            yield from iter_validated_survey(reader, chunksize=chunksize, usecols=usecols, names=columns,
+                                             quarantine=quarantine, report=report)
+
+    return chunks(), end
+
+
+class IncrementalState:
+    def __init__(self, payload=None):
+        payload = payload or {}
+        self.byte_offset = payload.get("byte_offset", 0)
+        self.last_timestamp = payload.get("last_timestamp")
+        self.header_columns = payload.get("header_columns")
+        self.rows_processed = payload.get("rows_processed", 0)
+        self.rows_since_refresh = payload.get("rows_since_refresh", 0)
+        self.class_counts = payload.get("class_counts", {})
+        self.distributions = payload.get("distributions", {})
+        self.reference = payload.get("reference", {})
+        self.history = payload.get("history", [])
+        # File pending (relatif ke direktori state) yang sesuai dengan `byte_offset` ini.
+        self.pending_file = payload.get("pending_file")
+
+    def to_dict(self):
+        return dict(vars(self))
+
+    @classmethod
+    def load(cls, path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls(json.load(f))
+        except FileNotFoundError:
+            return None
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2, default=str)
+        os.replace(tmp_path, path)
+
+
+def _count_codes(codes, vocabulary):
+    """Hitungan per kode vocabulary + bucket '__unknown__' untuk kategori baru."""
+    codes = np.asarray(codes)
+    counts = np.bincount(codes[codes >= 0], minlength=len(vocabulary))
+    result = dict(zip(vocabulary, counts.tolist()))
+    result["__unknown__"] = int((codes == UNKNOWN_CODE).sum())
+    return result
+
+
+def _add_counts(total, counts):
+    for key, value in counts.items():
+        total[key] = total.get(key, 0) + int(value)
+
+
+class IncrementalPipeline:
+    def __init__(self, survey_path, state_dir=DEFAULT_STATE_DIR, retrain_rows=5000, drift_threshold=0.2,
+                 extra_trees=10, chunksize=100_000, training_config=None, min_drift_rows=500):
+        self.survey_path = survey_path
+        self.state_dir = state_dir
+        self.state_path = os.path.join(state_dir, "state.json")
+        self.bundle_path = os.path.join(state_dir, "treatment_model.joblib")
+        self.quarantine_path = os.path.join(state_dir, "quarantine.csv")
+        self.retrain_rows = retrain_rows
+        self.drift_threshold = drift_threshold
+        self.extra_trees = extra_trees
+        # PSI pada sampel yang sangat kecil terlalu berisik untuk memicu retrain.
+        self.min_drift_rows = min_drift_rows
+        self.chunksize = chunksize
+        self.training_config = training_config or TrainingConfig()
+
+    # --- RETRAIN PENUH ---
+    def full_retrain(self, reason):
+        """
+        Melatih ulang dari awal file sampai baris utuh terakhir saat retrain dimulai.
+        Baris yang ditambahkan selama retrain berada setelah offset itu dan dibaca run berikutnya.
+        Tidak memakai cache dataset bersama; karantina ditulis ke file milik pipeline ini.
+        """
+        print(f"🔁 Retrain penuh ({reason})...")
+        end = _complete_end(self.survey_path)
+        with open(self.survey_path, "rb") as f:
+            X_df, y, encoder = build_survey_dataset(_BoundedReader(f, end), self.chunksize, verbose=False,
+                                                    quarantine_path=self.quarantine_path)
+        feature_names = list(X_df.columns)
+        X, y = feature_matrix(X_df), y.to_numpy()
+        model, _ = train_model(X, y, self.training_config)
+        bundle = ModelBundle(model, encoder, feature_names)
+        bundle.save(self.bundle_path)
+
+        state = IncrementalState()
+        state.header_columns = _header_info(self.survey_path)[0]
+        state.byte_offset = end
+        state.rows_processed = int(len(y))
+        state.class_counts = _count_codes(y, encoder.vocabularies[TARGET_COLUMN])
+        state.distributions = {
+            col: _count_codes(X[:, i], encoder.vocabularies[col])
+            for i, col in enumerate(feature_names) if col in encoder.vocabularies
+        }
+        state.reference = {"class_counts": state.class_counts, "distributions": state.distributions}
+        state.last_timestamp = self._last_timestamp(end, state.last_timestamp)
+        state.history.append({"event": "full_retrain", "reason": reason, "rows": state.rows_processed,
+                              "at": time.strftime("%Y-%m-%d %H:%M:%S")})
+        return state, bundle
+
+    def _last_timestamp(self, end, current):
+        # Hanya kolom Timestamp yang dibaca; cukup murah dibanding cleaning penuh.
+        last = None
+        with open(self.survey_path, "rb") as f:
+            for chunk in iter_survey(_BoundedReader(f, end), chunksize=self.chunksize, usecols=["Timestamp"]):
+                chunk_max = chunk["Timestamp"].max()
+                if pd.notna(chunk_max) and (last is None or chunk_max > last):
+                    last = chunk_max
+        return str(last) if last is not None else current
+
+    # --- DRIFT ---
+    def drift_scores(self, state, new_counts):
+        """PSI per kolom antara distribusi referensi dan distribusi baris baru."""
+        scores = {}
+        for col, counts in new_counts.items():
+            reference = state.reference.get("distributions", {}).get(col)
+            if col == TARGET_COLUMN:
+                reference = state.reference.get("class_counts")
+            if not reference:
+                continue
+            keys = sorted(set(reference) | set(counts))
+            scores[col] = population_stability_index([reference.get(k, 0) for k in keys],
+                                                     [counts.get(k, 0) for k in keys])
+        return scores
+
+    # --- RUN ---
+    def run(self):
+        state = IncrementalState.load(self.state_path)
+        if (state is None or not os.path.exists(self.bundle_path)
+                or state.header_columns != _header_info(self.survey_path)[0]
+                or os.path.getsize(self.survey_path) < state.byte_offset):
+            state, _ = self.full_retrain("state belum ada atau file survei diganti")
+            self._commit(state)
+            return state
+
+        bundle = ModelBundle.load(self.bundle_path)
+        report = ValidationReport()
+        chunks, end_offset = iter_new_rows(self.survey_path, state.byte_offset, self.chunksize,
+                                           QuarantineWriter(self.quarantine_path, append=True), report)
+        new_X, new_y, new_counts, last_timestamp = [], [], {}, state.last_timestamp
+        for chunk in chunks:
+            if "Timestamp" in chunk.columns and chunk["Timestamp"].notna().any():
+                chunk_max = str(chunk["Timestamp"].max())
+                last_timestamp = max(last_timestamp or chunk_max, chunk_max)
+            encoded = bundle.encoder.transform(clean_survey(chunk).drop(
+                columns=[col for col in DROP_COLUMNS if col in chunk.columns]))
+            new_X.append(encoded[bundle.feature_names].to_numpy())
+            new_y.append(encoded[TARGET_COLUMN].to_numpy())
+            for col in bundle.feature_names + [TARGET_COLUMN]:
+                if col in bundle.encoder.vocabularies:
+                    _add_counts(new_counts.setdefault(col, {}),
+                                _count_codes(encoded[col], bundle.encoder.vocabularies[col]))
+
+        n_new = sum(len(y) for y in new_y)
+        if report.quarantined:
+            state.history.append({"event": "quarantine", "rows": report.quarantined, "rules": report.rule_counts,
+                                  "at": time.strftime("%Y-%m-%d %H:%M:%S")})
+            print(f"🧪 {report.quarantined:,} baris baru dikarantina ke {self.quarantine_path}: {report.rule_counts}")
+        if n_new == 0:
+            print("✅ Tidak ada baris baru yang valid.")
+            if report.quarantined:
+                state.byte_offset = end_offset
+                self._commit(state)
+            return state
+        X_batch, y_batch = np.concatenate(new_X), np.concatenate(new_y)
+        print(f"📥 {n_new:,} baris baru diproses (offset {state.byte_offset:,} -> {end_offset:,})")
+
+        state.byte_offset = end_offset
+        state.last_timestamp = last_timestamp
+        state.rows_processed += n_new
+        state.rows_since_refresh += n_new
+        _add_counts(state.class_counts, new_counts.pop(TARGET_COLUMN, {}))
+        for col, counts in new_counts.items():
+            _add_counts(state.distributions.setdefault(col, {}), counts)
+
+        # Drift dihitung atas semua baris sejak refresh terakhir, bukan hanya run ini.
+        X_pending, y_pending = self._load_pending(state.pending_file)
+        X_pending = np.concatenate([X_pending, X_batch]) if X_pending is not None else X_batch
+        y_pending = np.concatenate([y_pending, y_batch]) if y_pending is not None else y_batch
+        pending_counts = {TARGET_COLUMN: _count_codes(y_pending, bundle.encoder.vocabularies[TARGET_COLUMN])}
+        for i, col in enumerate(bundle.feature_names):
+            if col in bundle.encoder.vocabularies:
+                pending_counts[col] = _count_codes(X_pending[:, i], bundle.encoder.vocabularies[col])
+        scores = self.drift_scores(state, pending_counts)
+        worst = max(scores.items(), key=lambda item: item[1], default=(None, 0.0))
+        print(f"📈 PSI tertinggi: {worst[0]} = {worst[1]:.3f} (ambang {self.drift_threshold})")
+
+        if worst[1] >= self.drift_threshold and len(y_pending) >= self.min_drift_rows:
+            state, _ = self.full_retrain(f"drift PSI {worst[0]}={worst[1]:.3f}")
+        elif state.rows_since_refresh >= self.retrain_rows and self._missing_classes(bundle, y_pending):
+            # Pohon baru butuh semua kelas target; baris tetap pending sampai kelas yang kurang muncul.
+            missing = self._missing_classes(bundle, y_pending)
+            state.pending_file = self._write_pending(X_pending, y_pending, end_offset)
+            state.history.append({"event": "warm_start_deferred", "missing_classes": missing,
+                                  "rows": int(len(y_pending)), "at": time.strftime("%Y-%m-%d %H:%M:%S")})
+            print(f"⏸️ Warm start ditunda: kelas {missing} belum ada di {len(y_pending):,} baris pending.")
+        elif state.rows_since_refresh >= self.retrain_rows:
+            known = (y_pending >= 0)
+            grow_forest(bundle.model, X_pending[known], y_pending[known], self.extra_trees)
+            bundle.save(self.bundle_path)
+            state.pending_file = None
+            state.history.append({"event": "warm_start", "rows": int(known.sum()), "extra_trees": self.extra_trees,
+                                  "at": time.strftime("%Y-%m-%d %H:%M:%S")})
+            state.rows_since_refresh = 0
+            print(f"🌲 Model diperbarui dengan {self.extra_trees} pohon baru dari {int(known.sum()):,} baris.")
+        else:
+            state.pending_file = self._write_pending(X_pending, y_pending, end_offset)
+        self._commit(state)
+        return state
+
+    @staticmethod
+    def _missing_classes(bundle, y_pending):
+        """Label kelas model yang tidak muncul di baris pending (kode target diketahui saja)."""
+        vocabulary = bundle.encoder.vocabularies[TARGET_COLUMN]
+        present = np.unique(y_pending[y_pending >= 0])
+        return [vocabulary[int(code)] for code in np.setdiff1d(bundle.model.classes_, present)]
+
+    # --- PENDING & STATE ---
+    def _load_pending(self, name):
+        """Baris ter-encode sejak refresh terakhir yang tercatat di state; (None, None) jika kosong."""
+        if not name:
+            return None, None
+        with np.load(os.path.join(self.state_dir, name)) as pending:
+            return pending["X"], pending["y"]
+
+    def _write_pending(self, X, y, offset):
+        """
+        Menulis pending ke file baru bernama sesuai offset (temp + rename).
+        File lama tetap utuh sampai state yang menunjuk file baru tersimpan, jadi
+        kegagalan sebelum `_commit` tidak pernah menggandakan baris di pending.
+        """
+        os.makedirs(self.state_dir, exist_ok=True)
+        name = f"pending-{offset}.npz"
+        fd, tmp_path = tempfile.mkstemp(dir=self.state_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, X=X, y=y)
+        os.replace(tmp_path, os.path.join(self.state_dir, name))
+        return name
+
+    def _commit(self, state):
+        """Menyimpan state (titik commit atomik), lalu menghapus file pending yang tidak dirujuk lagi."""
+        state.save(self.state_path)
+        for name in os.listdir(self.state_dir):
+            if name.startswith("pending") and name.endswith(".npz") and name != state.pending_file:
+                os.remove(os.path.join(self.state_dir, name))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--survey", default="survey.csv")
+    parser.add_argument("--state-dir", default=DEFAULT_STATE_DIR)
+    parser.add_argument("--retrain-rows", type=int, default=5000)
+    parser.add_argument("--drift-threshold", type=float, default=0.2)
+    parser.add_argument("--extra-trees", type=int, default=10)
+    parser.add_argument("--min-drift-rows", type=int, default=500)
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    args = parser.parse_args()
+
+    pipeline = IncrementalPipeline(args.survey, args.state_dir, args.retrain_rows, args.drift_threshold,
+                                   args.extra_trees, args.chunksize, min_drift_rows=args.min_drift_rows)
+    state = pipeline.run()
+    print(f"📊 Total baris: {state.rows_processed:,}; distribusi treatment: "
+          f"{ {k: v for k, v in state.class_counts.items() if k != '__unknown__'} }; "
+          f"Timestamp terakhir: {state.last_timestamp}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""
+Layanan HTTP lokal untuk prediksi treatment dengan micro-batching.
+
+Model dimuat sekali saat start. Request yang datang bersamaan dikumpulkan
+menjadi satu batch (maksimal `--max-batch-size` record atau `--max-wait-ms`
+milidetik) sebelum `predict_proba` dipanggil.
+Setiap record divalidasi dulu (kolom fitur & tipe, 422 jika gagal); jika satu
+batch tetap gagal, record di dalamnya diulang satu per satu. Body yang lebih
+besar dari `--max-body-bytes` ditolak (413) sebelum dibaca.
+
+Endpoint:
+    POST /predict   body: satu record survei (JSON) -> {"treatment_probability": ...}
+    GET  /metrics   latensi p50/p99, throughput, ukuran batch
+    GET  /health
+
+Contoh:
+    python inference_server.py --port 8080
+    curl -s -XPOST localhost:8080/predict -d '{"Age": 30, "Gender": "F", ...}'
+"""
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+from http import HTTPStatus
+
+import numpy as np
+
+from data_loader import SURVEY_SCHEMA, records_to_frame
+from scoring import DEFAULT_BUNDLE_PATH, ModelBundle
+from validation import AGE_BOUNDS, NULLABLE_COLUMNS
+
+# Satu record survei hanya ratusan byte; batas ini mencegah body raksasa dibaca ke memori.
+DEFAULT_MAX_BODY_BYTES = 64 * 1024
+
+
+class ServiceMetrics:
+    """Counter throughput dan latensi (jendela terbatas, memori konstan)."""
+
+    def __init__(self, window=10_000):
+        self.started = time.perf_counter()
+        self.latencies = deque(maxlen=window)
+        self.requests = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_records = 0
+
+    def snapshot(self):
+        latencies_ms = np.asarray(self.latencies) * 1000
+        uptime = time.perf_counter() - self.started
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "batches": self.batches,
+            "mean_batch_size": self.batched_records / self.batches if self.batches else 0.0,
+            "throughput_rps": self.requests / uptime if uptime else 0.0,
+            "latency_p50_ms": float(np.percentile(latencies_ms, 50)) if latencies_ms.size else None,
+            "latency_p99_ms": float(np.percentile(latencies_ms, 99)) if latencies_ms.size else None,
+            "uptime_seconds": uptime,
+        }
+
+
+def validate_record(record, feature_names):
+    """
+    Daftar masalah satu record sebelum masuk batch: kolom fitur wajib ada, Age
+    bilangan bulat dalam `AGE_BOUNDS`, kolom kategori berupa string (atau null
+    untuk kolom di `NULLABLE_COLUMNS`). Jawaban di luar vocabulary tetap boleh;
+    encoder memetakannya ke kode unknown.
+    """
+    problems = [f"kolom fitur tidak ada: {col}" for col in feature_names if col not in record]
+    for col in feature_names:
+        if col not in record:
+            continue
+        value = record[col]
+        if col == "Age":
+            integral = isinstance(value, int) or (isinstance(value, float) and value.is_integer())
+            if isinstance(value, bool) or not integral or not AGE_BOUNDS[0] <= value <= AGE_BOUNDS[1]:
+                problems.append(f"Age harus bilangan bulat {AGE_BOUNDS[0]}-{AGE_BOUNDS[1]}, bukan {value!r}")
+        elif value is None:
+            if col not in NULLABLE_COLUMNS:
+                problems.append(f"{col} tidak boleh kosong")
+        elif col in SURVEY_SCHEMA and not isinstance(value, str):
+            problems.append(f"{col} harus berupa string, bukan {type(value).__name__}")
+    return problems
+
+
+class MicroBatcher:
+    """Menggabungkan record dari request bersamaan menjadi satu panggilan model."""
+
+    def __init__(self, bundle, metrics, max_batch_size=256, max_wait_ms=5.0):
+        self.bundle = bundle
+        self.metrics = metrics
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue = asyncio.Queue()
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def predict(self, record):
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((record, future))
+        return await future
+
+    async def _collect(self):
+        batch = [await self._queue.get()]
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - asyncio.get_running_loop().time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            records = [record for record, _ in batch]
+            try:
+                # Inferensi di thread terpisah agar event loop tetap menerima request.
+                probabilities = await asyncio.to_thread(self._predict, records)
+            except Exception:
+                # Satu record bermasalah tidak boleh menggagalkan request lain di batch yang sama.
+                await self._predict_individually(batch)
+                continue
+            self.metrics.batches += 1
+            self.metrics.batched_records += len(batch)
+            for (_, future), probability in zip(batch, probabilities):
+                if not future.done():
+                    future.set_result(float(probability))
+
+    def _predict(self, records):
+        return self.bundle.predict_proba(records_to_frame(records))
+
+    async def _predict_individually(self, batch):
+        for record, future in batch:
+            try:
+                probability = (await asyncio.to_thread(self._predict, [record]))[0]
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                continue
+            self.metrics.batches += 1
+            self.metrics.batched_records += 1
+            if not future.done():
+                future.set_result(float(probability))
+
+
+class InferenceServer:
+    def __init__(self, bundle, max_batch_size=256, max_wait_ms=5.0, max_body_bytes=DEFAULT_MAX_BODY_BYTES):
+        self.max_body_bytes = max_body_bytes
+        self.metrics = ServiceMetrics()
+        self.batcher = MicroBatcher(bundle, self.metrics, max_batch_size, max_wait_ms)
+
+    async def _respond(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode("utf-8")
+        headers = (
+            f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(headers.encode("latin-1") + body)
+        await writer.drain()
+
+    async def _handle_request(self, method, path, body):
+        if method == "GET" and path == "/health":
+            return HTTPStatus.OK, {"status": "ok"}
+        if method == "GET" and path == "/metrics":
+            return HTTPStatus.OK, self.metrics.snapshot()
+        if method == "POST" and path == "/predict":
+            started = time.perf_counter()
+            try:
+                record = json.loads(body)
+                if not isinstance(record, dict):
+                    raise ValueError("body harus berupa satu objek JSON")
+            except ValueError as e:
+                self.metrics.errors += 1
+                return HTTPStatus.BAD_REQUEST, {"error": str(e)}
+            problems = validate_record(record, self.batcher.bundle.feature_names)
+            if problems:
+                self.metrics.errors += 1
+                return HTTPStatus.UNPROCESSABLE_ENTITY, {"error": "; ".join(problems)}
+            try:
+                probability = await self.batcher.predict(record)
+            except Exception as e:
+                self.metrics.errors += 1
+                return HTTPStatus.UNPROCESSABLE_ENTITY, {"error": str(e)}
+            self.metrics.requests += 1
+            self.metrics.latencies.append(time.perf_counter() - started)
+            return HTTPStatus.OK, {"treatment_probability": probability}
+        return HTTPStatus.NOT_FOUND, {"error": f"{method} {path} tidak dikenal"}
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, path, _ = request_line.decode("latin-1").split(" ", 2)
+                except ValueError:
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST, {"error": "request line tidak valid"}, False)
+                    break
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    length = int(headers.get("content-length", 0))
+                    if length < 0:
+                        raise ValueError
+                except ValueError:
+                    await self._respond(writer, HTTPStatus.BAD_REQUEST, {"error": "Content-Length tidak valid"}, False)
+                    break
+                if length > self.max_body_bytes:
+                    # Body tidak dibaca; koneksi ditutup karena sisa body masih ada di socket.
+                    self.metrics.errors += 1
+                    await self._respond(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                        {"error": f"body melebihi {self.max_body_bytes} byte"}, False)
+                    break
+                body = await reader.readexactly(length)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                status, payload = await self._handle_request(method, path.split("?", 1)[0], body)
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionResetError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host, port):
+        self.batcher.start()
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        print(f"🚀 Inference server berjalan di http://{host}:{port}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            await self.batcher.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=DEFAULT_BUNDLE_PATH)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-batch-size", type=int, default=256)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    parser.add_argument("--max-body-bytes", type=int, default=DEFAULT_MAX_BODY_BYTES)
+    args = parser.parse_args()
+
+    server = InferenceServer(ModelBundle.load(args.model), args.max_batch_size, args.max_wait_ms,
+                             args.max_body_bytes)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n👋 Inference server dihentikan.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Cross-validation dan pencarian hyperparameter paralel untuk model treatment.
+
+Kandidat konfigurasi RandomForest dievaluasi dengan successive halving:
+setiap ronde menambah jumlah fold stratified yang dievaluasi, lalu hanya
+sepertiga (`eta`) konfigurasi terbaik yang lanjut ke ronde berikutnya.
+Matriks fitur dibagikan ke worker lewat shared memory, bukan di-pickle per task.
+
+Contoh:
+    python model_selection.py --candidates 24 --folds 5 --workers 4
+"""
+import argparse
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import roc_auc_score
+from sklearn.model_selection import StratifiedKFold
+
+from shared_arrays import SharedArray
+
+PARAM_DISTRIBUTIONS = {
+    "n_estimators": [50, 100, 200, 400],
+    "max_depth": [None, 5, 10, 20],
+    "min_samples_leaf": [1, 2, 5, 10],
+    "max_features": ["sqrt", "log2", 0.5],
+    "max_samples": [None, 0.5, 0.8],
+}
+
+# --- STATE WORKER (diisi sekali per proses oleh initializer) ---
+_worker = {}
+
+
+def _init_worker(X_handle, y_handle, n_folds, random_state):
+    X = SharedArray.attach(X_handle)
+    y = SharedArray.attach(y_handle)
+    folds = list(StratifiedKFold(n_folds, shuffle=True, random_state=random_state).split(X.array, y.array))
+    _worker.update(X=X, y=y, folds=folds, random_state=random_state)
+
+
+def _evaluate_fold(candidate_id, params, fold):
+    X, y = _worker["X"].array, _worker["y"].array
+    train_idx, test_idx = _worker["folds"][fold]
+    model = RandomForestClassifier(random_state=_worker["random_state"], n_jobs=1, **params)
+    started = time.perf_counter()
+    model.fit(X[train_idx], y[train_idx])
+    fit_seconds = time.perf_counter() - started
+    auc = roc_auc_score(y[test_idx], model.predict_proba(X[test_idx])[:, 1])
+    return candidate_id, fold, auc, fit_seconds
+
+
+def sample_candidates(n_candidates, param_distributions=PARAM_DISTRIBUTIONS, random_state=42):
+    """Sampel acak konfigurasi unik dari `param_distributions`."""
+    rng = np.random.default_rng(random_state)
+    names = list(param_distributions)
+    total = math.prod(len(values) for values in param_distributions.values())
+    candidates, seen = [], set()
+    while len(candidates) < min(n_candidates, total):
+        params = {name: param_distributions[name][rng.integers(len(param_distributions[name]))] for name in names}
+        key = tuple(params.values())
+        if key not in seen:
+            seen.add(key)
+            candidates.append(params)
+    return candidates
+
+
+def _fold_schedule(n_folds, eta):
+    """Jumlah fold kumulatif per ronde, mis. 5 fold & eta=3 -> [1, 3, 5]."""
+    schedule, folds = [], 1
+    while folds < n_folds:
+        schedule.append(folds)
+        folds *= eta
+    return schedule + [n_folds]
+
+
+def halving_search(X, y, candidates, n_folds=5, eta=3, workers=None, random_state=42):
+    """
+    Successive halving di atas k-fold stratified, dijalankan di process pool.
+    Mengembalikan DataFrame peringkat: params, fold dievaluasi, mean/std AUC,
+    rata-rata waktu fit, dan ronde tempat konfigurasi dipangkas.
+    """
+    X = np.ascontiguousarray(X)
+    y = np.ascontiguousarray(y)
+    scores = {i: [] for i in range(len(candidates))}
+    fit_times = {i: [] for i in range(len(candidates))}
+    pruned_at = {}
+    alive = list(range(len(candidates)))
+
+    with SharedArray.publish(X) as X_shared, SharedArray.publish(y) as y_shared:
+        with ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(X_shared.handle, y_shared.handle, n_folds, random_state),
+        ) as pool:
+            done_folds = 0
+            for rung, n_rung_folds in enumerate(_fold_schedule(n_folds, eta)):
+                futures = [pool.submit(_evaluate_fold, i, candidates[i], fold)
+                           for i in alive for fold in range(done_folds, n_rung_folds)]
+                for future in futures:
+                    candidate_id, _, auc, fit_seconds = future.result()
+                    scores[candidate_id].append(auc)
+                    fit_times[candidate_id].append(fit_seconds)
+                done_folds = n_rung_folds
+                if done_folds == n_folds:
+                    break
+                # Pangkas konfigurasi buruk lebih awal: hanya 1/eta terbaik yang lanjut.
+                ranked = sorted(alive, key=lambda i: np.mean(scores[i]), reverse=True)
+                keep = max(1, math.ceil(len(ranked) / eta))
+                for i in ranked[keep:]:
+                    pruned_at[i] = rung
+                alive = ranked[:keep]
+                print(f"🔎 Ronde {rung}: {done_folds} fold, {len(alive)} konfigurasi lanjut")
+
+    rows = []
+    for i, params in enumerate(candidates):
+        rows.append({
+            **params,
+            "folds": len(scores[i]),
+            "mean_auc": float(np.mean(scores[i])),
+            "std_auc": float(np.std(scores[i])),
+            "mean_fit_seconds": float(np.mean(fit_times[i])),
+            "pruned_at_round": pruned_at.get(i),
+        })
+    table = pd.DataFrame(rows)
+    table["pruned_at_round"] = table["pruned_at_round"].astype("Int64")
+    return table.sort_values(["folds", "mean_auc"], ascending=False, ignore_index=True)
+
+
+def main():
+    from dataset_cache import load_survey_dataset
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--survey", default="survey.csv")
+    parser.add_argument("--candidates", type=int, default=24)
+    parser.add_argument("--folds", type=int, default=5)
+    parser.add_argument("--eta", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output", default=os.path.join("model_output", "search_results.csv"))
+    args = parser.parse_args()
+
+    dataset, _ = load_survey_dataset(args.survey, verbose=False)
+    candidates = sample_candidates(args.candidates)
+    started = time.perf_counter()
+    table = halving_search(dataset.X, dataset.y, candidates, args.folds, args.eta, args.workers)
+    print(f"\n✅ Pencarian selesai dalam {time.perf_counter() - started:.1f} s")
+    print(table.head(10).to_string())
+
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    table.to_csv(args.output, index=False)
+    print(f"\n💾 Tabel peringkat disimpan di: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
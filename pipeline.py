@@ -0,0 +1,504 @@
+"""
+Runner pipeline end-to-end sebagai DAG tahap dengan cache berbasis isi.
+
+Tahap (load -> clean -> encode -> train -> evaluate/importance -> plots/summarize
+-> results -> deck) dideklarasikan dengan dependensi, file input eksternal dan
+file output. Fingerprint tahap = hash kode tahap + parameter + isi file input +
+isi output tahap hulu. Tahap dilewati jika fingerprint sama dengan run terakhir
+dan semua output-nya masih ada dengan isi yang sama; karena yang di-hash adalah
+isi output hulu, tahap hulu yang dijalankan ulang tetapi menghasilkan file
+identik tidak memicu tahap hilir.
+
+Tahap yang dependensinya sudah selesai dijalankan bersamaan di thread pool
+(mis. evaluate & permutation importance, lalu plots & ringkasan LLM). State
+disimpan di `model_output/pipeline/state.json` setelah setiap tahap.
+
+Contoh:
+    python pipeline.py                      # jalankan yang berubah saja
+    python pipeline.py --dry-run            # tampilkan rencana tanpa menjalankan
+    python pipeline.py --force train        # paksa tahap train (hilir ikut jika output berubah)
+"""
+import argparse
+import hashlib
+import importlib.util
+import inspect
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+
+from dataset_cache import TARGET_COLUMN, file_digest
+
+PIPELINE_FORMAT_VERSION = 1
+DEFAULT_DECK_PATH = "Mental_Health_Capstone_Presentation_Final.pptx"
+
+
+@dataclass
+class Stage:
+    """
+    Satu tahap DAG; `run()` harus menulis semua path di `outputs`.
+    Jika `run()` mengembalikan False, hasilnya tidak dianggap up-to-date pada run
+    berikutnya (mis. ringkasan cadangan saat API LLM gagal).
+    """
+    name: str
+    run: object
+    deps: list = field(default_factory=list)
+    inputs: list = field(default_factory=list)  # file eksternal (mis. survey.csv)
+    outputs: list = field(default_factory=list)
+    params: dict = field(default_factory=dict)  # ikut fingerprint; harus bisa di-JSON-kan
+    code: list = field(default_factory=list)  # modul yang menentukan hasil tahap
+
+
+def artifact_digest(path):
+    """SHA-256 isi file, atau gabungan (path relatif + isi) semua file di direktori; None jika tidak ada."""
+    if os.path.isdir(path):
+        digest = hashlib.sha256()
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for name in sorted(files):
+                full_path = os.path.join(root, name)
+                digest.update(os.path.relpath(full_path, path).encode("utf-8"))
+                digest.update(file_digest(full_path).encode("ascii"))
+        return digest.hexdigest()
+    if os.path.exists(path):
+        return file_digest(path)
+    return None
+
+
+def _function_sources(func, seen=None):
+    """
+    Source `func` beserta fungsi bantu yang dipanggilnya (closure atau global di
+    modul yang sama), rekursif, agar perubahan helper ikut mengubah fingerprint.
+    """
+    seen = set() if seen is None else seen
+    if func in seen:
+        return []
+    seen.add(func)
+    sources = [inspect.getsource(func)]
+    references = inspect.getclosurevars(func)
+    for value in [*references.nonlocals.values(), *references.globals.values()]:
+        if inspect.isfunction(value) and value.__module__ == func.__module__:
+            sources.extend(_function_sources(value, seen))
+    return sources
+
+
+def code_digest(stage):
+    digest = hashlib.sha256()
+    for source in _function_sources(stage.run):
+        digest.update(source.encode("utf-8"))
+    for module in stage.code:
+        spec = importlib.util.find_spec(module)
+        digest.update(f"{module}:{file_digest(spec.origin)}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def topological_order(stages):
+    """Urutan tahap yang memenuhi dependensi; ValueError untuk dependensi tak dikenal atau siklus."""
+    by_name = {stage.name: stage for stage in stages}
+    if len(by_name) != len(stages):
+        raise ValueError("Nama tahap harus unik")
+    for stage in stages:
+        unknown = [dep for dep in stage.deps if dep not in by_name]
+        if unknown:
+            raise ValueError(f"Tahap {stage.name!r} bergantung pada tahap yang tidak ada: {unknown}")
+    order, visiting, done = [], set(), set()
+
+    def visit(stage):
+        if stage.name in done:
+            return
+        if stage.name in visiting:
+            raise ValueError(f"Siklus dependensi melibatkan tahap {stage.name!r}")
+        visiting.add(stage.name)
+        for dep in stage.deps:
+            visit(by_name[dep])
+        visiting.discard(stage.name)
+        done.add(stage.name)
+        order.append(stage)
+
+    for stage in stages:
+        visit(stage)
+    return order
+
+
+class PipelineRunner:
+    def __init__(self, stages, state_path, jobs=None, force=()):
+        self.stages = topological_order(stages)
+        self.state_path = state_path
+        self.jobs = jobs or min(4, os.cpu_count() or 1)
+        self.force = set(force)
+        unknown = self.force - {stage.name for stage in self.stages}
+        if unknown:
+            raise ValueError(f"Tahap tidak dikenal untuk --force: {sorted(unknown)}")
+        self._state = self._load_state()
+        self._lock = threading.Lock()
+
+    # --- STATE ---
+    def _load_state(self):
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+        return state.get("stages", {}) if state.get("version") == PIPELINE_FORMAT_VERSION else {}
+
+    def _save_state(self):
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.state_path) or ".", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"version": PIPELINE_FORMAT_VERSION, "stages": self._state}, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    # --- FINGERPRINT ---
+    def fingerprint(self, stage):
+        """Hash kode + parameter + input eksternal + output tahap hulu (dari state run ini)."""
+        upstream = {}
+        for dep in stage.deps:
+            upstream.update(self._state[dep]["outputs"])
+        payload = {
+            "code": code_digest(stage),
+            "params": stage.params,
+            "inputs": {path: artifact_digest(path) for path in stage.inputs},
+            "upstream": upstream,
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+    def is_up_to_date(self, stage, fingerprint):
+        record = self._state.get(stage.name)
+        return (stage.name not in self.force and record is not None and record["fingerprint"] == fingerprint
+                and set(record["outputs"]) == set(stage.outputs)
+                and all(artifact_digest(path) == digest for path, digest in record["outputs"].items()))
+
+    # --- EKSEKUSI ---
+    def _execute(self, stage):
+        fingerprint = self.fingerprint(stage)
+        if self.is_up_to_date(stage, fingerprint):
+            return "skipped", 0.0
+        print(f"▶️  {stage.name} ...")
+        started = time.perf_counter()
+        cacheable = stage.run() is not False
+        seconds = time.perf_counter() - started
+        outputs = {path: artifact_digest(path) for path in stage.outputs}
+        missing = [path for path, digest in outputs.items() if digest is None]
+        if missing:
+            raise RuntimeError(f"Tahap {stage.name!r} tidak menulis output: {missing}")
+        with self._lock:
+            previous = self._state.get(stage.name, {}).get("outputs")
+            self._state[stage.name] = {"fingerprint": fingerprint if cacheable else None, "outputs": outputs,
+                                       "seconds": round(seconds, 3), "at": time.strftime("%Y-%m-%d %H:%M:%S")}
+            self._save_state()
+        return ("ran" if previous != outputs else "ran (output sama)"), seconds
+
+    def run(self):
+        """Menjalankan DAG; mengembalikan {tahap: {"status", "seconds", "start"}}."""
+        results, running = {}, {}
+        remaining = list(self.stages)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix="stage") as pool:
+            while remaining or running:
+                for stage in list(remaining):
+                    statuses = [results[dep]["status"] for dep in stage.deps if dep in results]
+                    if any(status in ("failed", "blocked") for status in statuses):
+                        results[stage.name] = {"status": "blocked", "seconds": 0.0, "start": None}
+                        remaining.remove(stage)
+                    elif len(statuses) == len(stage.deps):
+                        future = pool.submit(self._execute, stage)
+                        running[future] = (stage, time.perf_counter() - started)
+                        remaining.remove(stage)
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    stage, start = running.pop(future)
+                    try:
+                        status, seconds = future.result()
+                    except Exception:
+                        print(f"❌ Tahap {stage.name} gagal:\n{traceback.format_exc()}", file=sys.stderr)
+                        status, seconds = "failed", time.perf_counter() - started - start
+                    results[stage.name] = {"status": status, "seconds": seconds, "start": start}
+                    if status != "skipped":
+                        print(f"{'❌' if status == 'failed' else '✅'} {stage.name}: {status} ({seconds:.2f} s)")
+        return results
+
+    def plan(self):
+        """Status tanpa menjalankan: tahap hilir dari tahap yang basi ditandai 'mungkin'."""
+        plan = {}
+        for stage in self.stages:
+            if any(plan[dep] != "up-to-date" for dep in stage.deps):
+                plan[stage.name] = "mungkin (hulu berubah)"
+            elif self.is_up_to_date(stage, self.fingerprint(stage)):
+                plan[stage.name] = "up-to-date"
+            else:
+                plan[stage.name] = "jalankan"
+        return plan
+
+
+# --- TAHAP PIPELINE SURVEI ---
+@dataclass
+class PipelineConfig:
+    survey_path: str = "survey.csv"
+    model_dir: str = "model_output"
+    plots_dir: str = "plots_output"
+    deck_path: str = DEFAULT_DECK_PATH
+    chunksize: int = 100_000
+    backend: str = "random_forest"
+    n_estimators: int = 100
+    max_samples: float | None = None
+    n_jobs: int = -1  # tidak memengaruhi model, jadi tidak ikut fingerprint
+    test_size: float = 0.2
+    importance: str = "impurity"
+    permutation_max_rows: int = 5000
+    permutation_repeats: int = 10
+    summary_backend: str = "replicate"
+    build_deck: bool = True
+    image_dpi: int = 150
+    image_format: str = "png"
+
+    @property
+    def work_dir(self):
+        return os.path.join(self.model_dir, "pipeline")
+
+    @property
+    def state_path(self):
+        return os.path.join(self.work_dir, "state.json")
+
+
+def _write_json(payload, path):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _read_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def survey_stages(config):
+    """Tahap analisis survei sebagai DAG; isi tahap memakai fungsi yang sama dengan `Mental_Health_Data.main`."""
+    work = config.work_dir
+    validated_path = os.path.join(work, "validated.pkl")
+    validation_report_path = os.path.join(work, "validation_report.json")
+    clean_path = os.path.join(work, "clean.pkl")
+    dataset_dir = os.path.join(work, "dataset")
+    bundle_path = os.path.join(config.model_dir, "treatment_model.joblib")
+    compact_path = os.path.join(config.model_dir, "treatment_model_compact")
+    metrics_path = os.path.join(work, "metrics.json")
+    importance_path = os.path.join(config.model_dir, "permutation_importance.csv")
+    plot_specs_path = os.path.join(work, "plots.json")
+    plot_names = ("treatment_distribution", "confusion_matrix", "feature_importance")
+    plot_paths = {name: os.path.join(config.plots_dir, f"{name}.png") for name in plot_names}
+    summary_path = os.path.join(work, "summary.json")
+    results_path = os.path.join(config.model_dir, "results.json")
+    training_params = {"backend": config.backend, "n_estimators": config.n_estimators,
+                       "max_samples": config.max_samples, "random_state": 42}
+
+    def load_dataset_split():
+        from dataset_cache import load_dataset
+        from Mental_Health_Data import split_dataset
+
+        dataset = load_dataset(work, "dataset")
+        return dataset, split_dataset(dataset.X, dataset.y, config.test_size)
+
+    def load():
+        from validation import load_validated_survey
+
+        df, report = load_validated_survey(config.survey_path, chunksize=config.chunksize,
+                                           quarantine_path=os.path.join(work, "quarantine.csv"))
+        df.to_pickle(validated_path)
+        report.save(validation_report_path)
+        print(f"🧪 Validasi: {report.valid:,} baris valid, {report.quarantined:,} dikarantina")
+
+    def clean():
+        import pandas as pd
+
+        from cleaning import clean_survey
+
+        clean_survey(pd.read_pickle(validated_path)).to_pickle(clean_path)
+
+    def encode():
+        import pandas as pd
+
+        from dataset_cache import encode_survey, feature_matrix, save_dataset
+
+        X_df, y, encoder = encode_survey(pd.read_pickle(clean_path))
+        save_dataset(work, "dataset", feature_matrix(X_df), y.to_numpy(), X_df.columns, encoder)
+
+    def train():
+        from Mental_Health_Data import train_bundle
+        from training import TrainingConfig
+
+        dataset, (X_train, _, y_train, _) = load_dataset_split()
+        train_bundle(X_train, y_train, dataset.encoder, dataset.feature_names,
+                     TrainingConfig(n_jobs=config.n_jobs, **training_params), bundle_path, compact_path)
+
+    def evaluate():
+        from Mental_Health_Data import evaluate_model, target_distribution
+        from scoring import ModelBundle
+
+        dataset, (_, X_test, _, y_test) = load_dataset_split()
+        metrics = evaluate_model(ModelBundle.load(bundle_path).model, X_test, y_test)
+        metrics.update(
+            n_features=len(dataset.feature_names),
+            n_respondents=int(len(dataset.y)),
+            class_distribution=target_distribution(dataset.y, dataset.encoder.vocabularies[TARGET_COLUMN]),
+        )
+        _write_json(metrics, metrics_path)
+
+    def importance():
+        from Mental_Health_Data import feature_importance_table
+        from scoring import ModelBundle
+
+        dataset, (_, X_test, _, y_test) = load_dataset_split()
+        table, _ = feature_importance_table(ModelBundle.load(bundle_path).model, X_test, y_test,
+                                            dataset.feature_names, config.importance,
+                                            config.permutation_max_rows, config.permutation_repeats)
+        table.to_csv(importance_path, index=False)
+
+    def read_importances():
+        import pandas as pd
+
+        return pd.read_csv(importance_path).set_index("feature")["importance_mean"]
+
+    def plots():
+        from plotting import PlotRenderer
+
+        metrics = _read_json(metrics_path)
+        importances = read_importances()
+        distribution = metrics["class_distribution"]
+        with PlotRenderer(config.plots_dir) as renderer:
+            renderer.submit("treatment_distribution", "treatment_distribution", {
+                "labels": list(distribution),
+                "counts": [item["count"] for item in distribution.values()],
+            })
+            renderer.submit("confusion_matrix", "confusion_matrix", {"matrix": metrics["confusion_matrix"]})
+            renderer.submit("feature_importance", "feature_importance", {
+                "features": importances.index.tolist(),
+                "importances": importances.round(6).tolist(),
+            })
+        _write_json(renderer.specs, plot_specs_path)
+
+    def summarize():
+        from Mental_Health_Data import executive_summary, summary_prompt_from_report
+
+        metrics = _read_json(metrics_path)
+        top_features = read_importances().head(3).index.tolist()
+        prompt = summary_prompt_from_report(top_features, metrics["classification_report"], metrics["roc_auc"])
+        # Ringkasan cadangan karena LLM gagal tidak di-cache: dicoba lagi pada run berikutnya.
+        text, cacheable = executive_summary(prompt, config.summary_backend, summary_params["llm"], metrics["model"],
+                                            metrics["roc_auc"], top_features,
+                                            metrics["class_distribution"]["Yes"]["percent"])
+        _write_json({"prompt": prompt, "top_features": top_features, "summary_text": text.strip()}, summary_path)
+        return cacheable
+
+    def results():
+        from Mental_Health_Data import results_payload
+        from results_artifact import save_results
+
+        metrics = _read_json(metrics_path)
+        summary = _read_json(summary_path)
+        save_results(
+            results_payload(metrics, read_importances(), summary["top_features"], metrics["class_distribution"],
+                            summary["summary_text"], summary["prompt"], _read_json(plot_specs_path)),
+            plot_paths,
+            results_path,
+        )
+
+    def deck():
+        from presentasi_mental_health import build_presentation
+        from results_artifact import AnalysisResults
+        from slide_images import ImagePreparer
+
+        image_preparer = ImagePreparer(dpi=config.image_dpi, fmt=config.image_format) if config.image_dpi > 0 else None
+        build_presentation(AnalysisResults.load(results_path), image_preparer=image_preparer).save(config.deck_path)
+
+    # Ringkasan LLM hanya dipanggil jika token tersedia (atau backend mock).
+    summary_params = {
+        "backend": config.summary_backend,
+        "llm": bool(os.environ.get("REPLICATE_API_TOKEN")) or config.summary_backend == "mock",
+    }
+    importance_params = {"method": config.importance, "max_rows": config.permutation_max_rows,
+                         "repeats": config.permutation_repeats, "test_size": config.test_size}
+    stages = [
+        Stage("load", load, inputs=[config.survey_path], outputs=[validated_path, validation_report_path],
+              params={"chunksize": config.chunksize}, code=["validation", "data_loader"]),
+        Stage("clean", clean, deps=["load"], outputs=[clean_path], code=["cleaning"]),
+        Stage("encode", encode, deps=["clean"], outputs=[dataset_dir], code=["encoder", "dataset_cache"]),
+        Stage("train", train, deps=["encode"],
+              outputs=[bundle_path] + ([compact_path] if config.backend == "random_forest" else []),
+              params={**training_params, "test_size": config.test_size},
+              code=["Mental_Health_Data", "training", "scoring", "compact_forest"]),
+        Stage("evaluate", evaluate, deps=["encode", "train"], outputs=[metrics_path],
+              params={"test_size": config.test_size}, code=["Mental_Health_Data"]),
+        Stage("importance", importance, deps=["encode", "train"], outputs=[importance_path],
+              params=importance_params, code=["Mental_Health_Data", "feature_attribution"]),
+        Stage("plots", plots, deps=["evaluate", "importance"], outputs=[*plot_paths.values(), plot_specs_path],
+              code=["plotting"]),
+        Stage("summarize", summarize, deps=["evaluate", "importance"], outputs=[summary_path],
+              params=summary_params, code=["summarizer", "Mental_Health_Data"]),
+        Stage("results", results, deps=["evaluate", "importance", "plots", "summarize"], outputs=[results_path],
+              code=["Mental_Health_Data", "results_artifact"]),
+    ]
+    if config.build_deck:
+        stages.append(Stage("deck", deck, deps=["results"], outputs=[config.deck_path],
+                            params={"image_dpi": config.image_dpi, "image_format": config.image_format},
+                            code=["presentasi_mental_health", "slide_images"]))
+    return stages
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--survey", default="survey.csv")
+    parser.add_argument("--jobs", type=int, default=None, help="tahap yang berjalan bersamaan (default: min(4, CPU))")
+    parser.add_argument("--force", nargs="+", default=(), metavar="TAHAP")
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--backend", choices=("random_forest", "hist_gradient_boosting"), default="random_forest")
+    parser.add_argument("--n-estimators", type=int, default=100)
+    parser.add_argument("--importance", choices=("impurity", "permutation"), default="impurity")
+    parser.add_argument("--permutation-repeats", type=int, default=10)
+    parser.add_argument("--summary-backend", choices=("mock", "replicate"), default="replicate")
+    parser.add_argument("--no-deck", action="store_true")
+    parser.add_argument("--image-dpi", type=int, default=150)
+    parser.add_argument("--image-format", choices=("png", "png8", "jpeg"), default="png")
+    args = parser.parse_args(argv)
+
+    config = PipelineConfig(survey_path=args.survey, backend=args.backend, n_estimators=args.n_estimators,
+                            importance=args.importance, permutation_repeats=args.permutation_repeats,
+                            summary_backend=args.summary_backend, build_deck=not args.no_deck,
+                            image_dpi=args.image_dpi, image_format=args.image_format)
+    os.makedirs(config.work_dir, exist_ok=True)
+    runner = PipelineRunner(survey_stages(config), config.state_path, args.jobs, args.force)
+    if args.dry_run:
+        for name, status in runner.plan().items():
+            print(f"  {name:<12}{status}")
+        return
+
+    # Process pool (plot, permutation importance) dibuat dari thread tahap; fork dari
+    # proses multi-thread rawan deadlock, jadi worker di-spawn lewat forkserver.
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        multiprocessing.set_start_method("forkserver", force=True)
+    started = time.perf_counter()
+    results = runner.run()
+    elapsed = time.perf_counter() - started
+
+    print(f"\n{'tahap':<12}{'status':<20}{'mulai (s)':>10}{'durasi (s)':>12}")
+    for name, result in results.items():
+        start = f"{result['start']:.2f}" if result["start"] is not None else "-"
+        print(f"{name:<12}{result['status']:<20}{start:>10}{result['seconds']:>12.2f}")
+    busy = sum(result["seconds"] for result in results.values())
+    print(f"\n⏱️ Total {elapsed:.2f} s (jumlah durasi tahap {busy:.2f} s); state: {config.state_path}")
+    with open(os.path.join(config.work_dir, "last_run.json"), "w", encoding="utf-8") as f:
+        json.dump({"config": asdict(config), "elapsed": elapsed, "stages": results}, f, indent=2)
+    if any(result["status"] in ("failed", "blocked") for result in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Rendering plot paralel dengan cache.
+
+Setiap figure dibangun dengan API object-oriented Matplotlib (tanpa state global
+pyplot) di process worker, sehingga encoding PNG berjalan paralel dan tidak
+memblokir analisis. Figure yang data, style, dan DPI-nya sama dengan run
+sebelumnya tidak dirender ulang (lihat `.plot_manifest.json` di folder plot).
+"""
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Naikkan jika tampilan figure diubah, agar cache figure lama tidak dipakai.
+PLOT_STYLE_VERSION = 1
+PLOT_STYLE = {"seaborn_style": "whitegrid", "bar_color": "#0066cc", "version": PLOT_STYLE_VERSION}
+FINAL_DPI = 300
+PREVIEW_DPI = 72
+MANIFEST_NAME = ".plot_manifest.json"
+
+
+# --- PEMBANGUN FIGURE (dijalankan di worker) ---
+def _treatment_distribution(ax, data):
+    import seaborn as sns
+    sns.barplot(x=data["labels"], y=data["counts"], ax=ax)
+    ax.set_title("Distribusi Treatment")
+    ax.set_xlabel("Mencari Perawatan Mental")
+    ax.set_ylabel("Jumlah Responden")
+
+
+def _confusion_matrix(ax, data):
+    import seaborn as sns
+    sns.heatmap(np.asarray(data["matrix"]), annot=True, fmt='d', cmap='Blues', ax=ax,
+                xticklabels=['Predicted No Treatment', 'Predicted Treatment'],
+                yticklabels=['Actual No Treatment', 'Actual Treatment'])
+    ax.set_xlabel("Prediksi")
+    ax.set_ylabel("Aktual")
+    ax.set_title("Confusion Matrix")
+
+
+def _feature_importance(ax, data):
+    ax.bar(data["features"], data["importances"], color=PLOT_STYLE["bar_color"])
+    ax.set_title(data.get("title", "Feature Importance"))
+    ax.set_ylabel("Importansi")
+    ax.set_xlabel("Fitur")
+    ax.tick_params(axis='x', labelrotation=45)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment('right')
+
+
+FIGURE_BUILDERS = {
+    "treatment_distribution": (_treatment_distribution, (10, 5)),
+    "confusion_matrix": (_confusion_matrix, (8, 6)),
+    "feature_importance": (_feature_importance, (12, 6)),
+}
+
+
+def build_figure(kind, data):
+    """Membangun `matplotlib.figure.Figure` untuk satu jenis plot."""
+    import matplotlib
+    import seaborn as sns
+    from matplotlib.figure import Figure
+
+    builder, figsize = FIGURE_BUILDERS[kind]
+    with matplotlib.rc_context(sns.axes_style(PLOT_STYLE["seaborn_style"])):
+        fig = Figure(figsize=figsize)
+        builder(fig.add_subplot(), data)
+        fig.tight_layout()
+    return fig
+
+
+def _render(kind, data, path, dpi):
+    fig = build_figure(kind, data)
+    tmp_path = f"{path}.tmp"
+    fig.savefig(tmp_path, dpi=dpi, format="png")
+    os.replace(tmp_path, path)
+    return path
+
+
+# --- RENDERER ---
+def figure_digest(kind, data, dpi):
+    payload = json.dumps({"kind": kind, "data": data, "dpi": dpi, "style": PLOT_STYLE},
+                         sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class PlotRenderer:
+    """
+    Antrian rendering non-blocking.
+    `submit` langsung kembali; figure dirender di process pool dan `close`
+    menunggu semuanya selesai lalu memperbarui manifest cache.
+    """
+
+    def __init__(self, plots_dir, preview=False, workers=None, force=False):
+        self.plots_dir = os.path.join(plots_dir, "preview") if preview else plots_dir
+        self.dpi = PREVIEW_DPI if preview else FINAL_DPI
+        self.force = force
+        os.makedirs(self.plots_dir, exist_ok=True)
+        self._manifest_path = os.path.join(self.plots_dir, MANIFEST_NAME)
+        self._manifest = self._read_manifest()
+        self._pool = ProcessPoolExecutor(max_workers=workers or min(len(FIGURE_BUILDERS), os.cpu_count()))
+        self._pending = {}
+        self.skipped = []
+        # Spesifikasi semua figure (jenis + data) agar bisa dirender ulang dari artefak hasil.
+        self.specs = {}
+
+    def _read_manifest(self):
+        try:
+            with open(self._manifest_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def path_for(self, name):
+        return os.path.join(self.plots_dir, f"{name}.png")
+
+    def submit(self, name, kind, data):
+        """Menjadwalkan render; mengembalikan path output (mungkin belum ditulis)."""
+        path = self.path_for(name)
+        self.specs[name] = {"kind": kind, "data": data}
+        digest = figure_digest(kind, data, self.dpi)
+        if not self.force and self._manifest.get(name) == digest and os.path.exists(path):
+            self.skipped.append(name)
+            return path
+        self._pending[name] = (digest, self._pool.submit(_render, kind, data, path, self.dpi))
+        return path
+
+    def close(self):
+        """Menunggu semua render selesai; mengembalikan daftar nama yang dirender."""
+        rendered = []
+        try:
+            for name, (digest, future) in self._pending.items():
+                future.result()
+                self._manifest[name] = digest
+                rendered.append(name)
+        finally:
+            self._pool.shutdown()
+            self._pending = {}
+            with open(self._manifest_path, "w", encoding="utf-8") as f:
+                json.dump(self._manifest, f, indent=2, sort_keys=True)
+        return rendered
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,261 @@
+"""
+Instrumentasi per tahap pipeline: wall time, CPU time, peak RSS dan jumlah baris.
+
+Setiap tahap dibungkus `profiler.stage(nama)`; hasilnya ditulis sebagai JSON
+(`stage_trace.json`) yang bisa di-diff antar run, plus trace event format
+(`stage_trace.chrome.json`, buka di chrome://tracing atau Perfetto).
+
+Hook opsional per tahap (env `PROFILE_STAGES` di Mental_Health_Data.py):
+- cprofile    : simpan statistik cProfile per tahap (`<tahap>.prof`)
+- tracemalloc : catat puncak alokasi Python per tahap dan 10 lokasi teratas
+
+Membandingkan dua run:
+    python profiling.py model_output/stage_trace_lama.json model_output/stage_trace.json
+"""
+import argparse
+import cProfile
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import psutil
+except ImportError:  # peak RSS per tahap butuh psutil; tanpa itu dipakai ru_maxrss proses
+    psutil = None
+
+HOOKS = ("cprofile", "tracemalloc")
+RSS_SAMPLE_SECONDS = 0.01
+
+
+def _max_rss_bytes():
+    """High-water mark RSS seluruh proses (ru_maxrss: KB di Linux, byte di macOS)."""
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+class _RssSampler:
+    """Thread yang mencatat RSS tertinggi selama satu tahap berjalan."""
+
+    def __init__(self):
+        self._process = psutil.Process() if psutil is not None else None
+        self._stop = threading.Event()
+        self._thread = None
+        self.peak = 0
+
+    def _sample(self):
+        self.peak = max(self.peak, self._process.memory_info().rss)
+
+    def _run(self):
+        while not self._stop.wait(RSS_SAMPLE_SECONDS):
+            self._sample()
+
+    def start(self):
+        if self._process is None:
+            return self
+        self._sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._process is None:
+            return _max_rss_bytes()
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+        return self.peak
+
+
+class StageRecord:
+    """Hasil pengukuran satu tahap; `rows` dan `extra` boleh diisi dari dalam blok."""
+
+    def __init__(self, name):
+        self.name = name
+        self.rows = None
+        self.extra = {}
+        self.start = None
+        self.wall_seconds = None
+        self.cpu_seconds = None
+        self.peak_rss_bytes = None
+        self.rss_delta_bytes = None
+        self.status = "ok"
+
+    def to_dict(self):
+        record = {
+            "name": self.name,
+            "status": self.status,
+            "rows": self.rows,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "cpu_seconds": round(self.cpu_seconds, 6),
+            "peak_rss_bytes": self.peak_rss_bytes,
+            "rss_delta_bytes": self.rss_delta_bytes,
+        }
+        if self.rows and self.wall_seconds:
+            record["rows_per_second"] = round(self.rows / self.wall_seconds, 1)
+        record.update(self.extra)
+        return record
+
+
+class StageProfiler:
+    """
+    Mengumpulkan pengukuran per tahap.
+    `hook` = None, "cprofile" atau "tracemalloc"; `profile_dir` menampung file .prof.
+    CPU time dihitung untuk proses utama (worker process/thread pool sklearn
+    tercermin di wall time, bukan di sini).
+    """
+
+    def __init__(self, hook=None, profile_dir=None):
+        if hook not in (None, *HOOKS):
+            raise ValueError(f"Hook profiling tidak dikenal: {hook!r} (pilihan: {', '.join(HOOKS)})")
+        self.hook = hook
+        self.profile_dir = profile_dir
+        self.stages = []
+        self.started_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self._origin = time.perf_counter()
+        if hook == "tracemalloc" and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name):
+        record = StageRecord(name)
+        sampler = _RssSampler().start()
+        rss_before = sampler._process.memory_info().rss if sampler._process is not None else None
+        profiler = cProfile.Profile() if self.hook == "cprofile" else None
+        if self.hook == "tracemalloc":
+            tracemalloc.reset_peak()
+            snapshot_before = tracemalloc.take_snapshot()
+        record.start = time.perf_counter() - self._origin
+        cpu_started = time.process_time()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            yield record
+        except BaseException:
+            record.status = "error"
+            raise
+        finally:
+            if profiler is not None:
+                profiler.disable()
+            record.cpu_seconds = time.process_time() - cpu_started
+            record.wall_seconds = time.perf_counter() - self._origin - record.start
+            record.peak_rss_bytes = sampler.stop()
+            if rss_before is not None:
+                record.rss_delta_bytes = sampler._process.memory_info().rss - rss_before
+            if profiler is not None and self.profile_dir:
+                os.makedirs(self.profile_dir, exist_ok=True)
+                profile_path = os.path.join(self.profile_dir, f"{name}.prof")
+                profiler.dump_stats(profile_path)
+                record.extra["cprofile"] = profile_path
+            if self.hook == "tracemalloc":
+                record.extra["tracemalloc_peak_bytes"] = tracemalloc.get_traced_memory()[1]
+                top = tracemalloc.take_snapshot().compare_to(snapshot_before, "lineno")[:10]
+                record.extra["tracemalloc_top"] = [
+                    {"location": str(stat.traceback[0]), "size_diff_bytes": stat.size_diff} for stat in top
+                ]
+            self.stages.append(record)
+
+    def summary(self):
+        """DataFrame-friendly: list dict per tahap."""
+        return [record.to_dict() for record in self.stages]
+
+    def report(self):
+        print("\n⏱️ Profil per tahap:")
+        print(f"{'tahap':<22}{'wall (s)':>10}{'cpu (s)':>10}{'peak RSS (MB)':>15}{'baris':>12}")
+        for record in self.stages:
+            rows = f"{record.rows:,}" if record.rows is not None else "-"
+            print(f"{record.name:<22}{record.wall_seconds:>10.3f}{record.cpu_seconds:>10.3f}"
+                  f"{record.peak_rss_bytes / 1e6:>15.1f}{rows:>12}")
+
+    def save(self, path, metadata=None):
+        """
+        Menyimpan `<path>` (JSON untuk diff) dan `<path tanpa .json>.chrome.json` (trace event).
+        `metadata` (mis. commit git) ikut disimpan di tingkat atas JSON.
+        """
+        payload = {
+            **(metadata or {}),
+            "started_at": self.started_at,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "hook": self.hook,
+            "total_wall_seconds": round(time.perf_counter() - self._origin, 6),
+            "stages": self.summary(),
+        }
+        _write_json(path, payload)
+        trace_events = [
+            {
+                "name": record.name, "ph": "X", "pid": os.getpid(), "tid": 0,
+                "ts": round(record.start * 1e6), "dur": round(record.wall_seconds * 1e6),
+                "args": {key: value for key, value in record.to_dict().items()
+                         if key not in ("name", "tracemalloc_top")},
+            }
+            for record in self.stages
+        ]
+        _write_json(f"{os.path.splitext(path)[0]}.chrome.json", {"traceEvents": trace_events})
+        return path
+
+
+def _write_json(path, payload):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def compare_traces(baseline, current):
+    """Selisih per tahap antara dua trace JSON: list dict (nama, metrik lama/baru, rasio)."""
+    base = {stage["name"]: stage for stage in baseline["stages"]}
+    rows = []
+    for stage in current["stages"]:
+        old = base.get(stage["name"])
+        row = {"name": stage["name"]}
+        for metric in ("wall_seconds", "cpu_seconds", "peak_rss_bytes", "rows"):
+            new_value = stage.get(metric)
+            old_value = old.get(metric) if old else None
+            row[metric] = new_value
+            row[f"{metric}_before"] = old_value
+            row[f"{metric}_ratio"] = (new_value / old_value) if old_value and new_value is not None else None
+        rows.append(row)
+    return rows
+
+
+def _fmt(value, spec, scale=1, suffix=""):
+    return f"{value / scale:{spec}}{suffix}" if value is not None else "-"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline", help="trace JSON run pembanding")
+    parser.add_argument("current", help="trace JSON run baru")
+    parser.add_argument("--threshold", type=float, default=1.2, help="tandai tahap yang wall time-nya naik >= rasio ini")
+    args = parser.parse_args()
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    with open(args.current, encoding="utf-8") as f:
+        current = json.load(f)
+
+    regressions = 0
+    print(f"{'tahap':<22}{'wall lama':>11}{'wall baru':>11}{'rasio':>8}{'RSS lama (MB)':>15}{'RSS baru (MB)':>15}")
+    for row in compare_traces(baseline, current):
+        ratio = row["wall_seconds_ratio"]
+        flag = ""
+        if ratio is not None and ratio >= args.threshold:
+            flag = "  ⚠️ regresi"
+            regressions += 1
+        print(f"{row['name']:<22}{_fmt(row['wall_seconds_before'], '.3f'):>11}{_fmt(row['wall_seconds'], '.3f'):>11}"
+              f"{_fmt(ratio, '.2f', suffix='x'):>8}"
+              f"{_fmt(row['peak_rss_bytes_before'], '.1f', 1e6):>15}{_fmt(row['peak_rss_bytes'], '.1f', 1e6):>15}{flag}")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import base64
+import json
+import os
+import tempfile
+
+DEFAULT_RESULTS_PATH = os.path.join("model_output", "results.json")
+RESULTS_FORMAT_VERSION = 1
+
+
+def save_results(results, figure_paths, path=DEFAULT_RESULTS_PATH):
+    """
+    Menyimpan hasil analisis (metrik, importansi, distribusi kelas, ringkasan)
+    beserta isi PNG setiap figure, sehingga pembuat presentasi tidak perlu
+    membaca ulang folder plot.
+    """
+    figures = {}
+    for name, figure_path in figure_paths.items():
+        with open(figure_path, "rb") as f:
+            figures[name] = {"path": figure_path, "png_base64": base64.b64encode(f.read()).decode("ascii")}
+    payload = {"version": RESULTS_FORMAT_VERSION, **results, "figures": figures}
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+    return path
+
+
+class AnalysisResults:
+    """Hasil analisis yang dibaca dari artefak JSON."""
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def __getitem__(self, key):
+        return self.payload[key]
+
+    def get(self, key, default=None):
+        return self.payload.get(key, default)
+
+    def figure_bytes(self, name):
+        """Isi PNG figure sebagai bytes, atau None jika tidak ada."""
+        figure = self.payload.get("figures", {}).get(name)
+        if figure is None:
+            return None
+        return base64.b64decode(figure["png_base64"])
+
+    @classmethod
+    def load(cls, path=DEFAULT_RESULTS_PATH):
+        with open(path, encoding="utf-8") as f:
+            payload = json.load(f)
+        if payload.get("version") != RESULTS_FORMAT_VERSION:
+            raise ValueError(f"Versi artefak hasil tidak didukung: {payload.get('version')!r}")
+        return cls(payload)
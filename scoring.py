@@ -0,0 +1,197 @@
+"""
+Scoring batch untuk model treatment yang sudah dilatih.
+
+Input bisa berupa CSV survei (dibaca per batch, tidak pernah dimuat seluruhnya)
+atau aliran record JSON (satu objek per baris, `--input -` untuk stdin).
+Output berupa CSV `row,treatment_probability`.
+
+Contoh:
+    python scoring.py --input survey.csv --output scores.csv --batch-size 50000 --workers 4
+    cat records.jsonl | python scoring.py --input - --output -
+"""
+import argparse
+import contextlib
+import itertools
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from cleaning import clean_survey
+from data_loader import SURVEY_SCHEMA, iter_survey, records_to_frame
+from encoder import CategoricalEncoder
+
+DEFAULT_BUNDLE_PATH = os.path.join("model_output", "treatment_model.joblib")
+DEFAULT_COMPACT_PATH = os.path.join("model_output", "treatment_model_compact")
+POSITIVE_CLASS = "Yes"
+
+
+class ModelBundle:
+    """Encoder + model + urutan fitur; semua yang dibutuhkan untuk scoring."""
+
+    def __init__(self, model, encoder, feature_names, target="treatment"):
+        self.model = model
+        self.encoder = encoder
+        self.feature_names = list(feature_names)
+        self.target = target
+        # Kolom probabilitas untuk kelas positif, berdasarkan kode target di encoder.
+        positive_code = encoder.vocabularies[target].index(POSITIVE_CLASS)
+        self.positive_column = int(np.flatnonzero(model.classes_ == positive_code)[0])
+
+    def save(self, path=DEFAULT_BUNDLE_PATH):
+        import joblib  # hanya untuk bundle joblib; scoring model ringkas tidak memuatnya
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        joblib.dump({
+            "model": self.model,
+            "vocabularies": self.encoder.vocabularies,
+            "feature_names": self.feature_names,
+            "target": self.target,
+        }, path)
+        return path
+
+    def export_compact(self, path=DEFAULT_COMPACT_PATH):
+        """Menyimpan forest sebagai array datar (lihat compact_forest) + encoder & urutan fitur."""
+        from compact_forest import CompactForest
+
+        forest = CompactForest.from_sklearn(self.model, metadata={
+            "vocabularies": self.encoder.vocabularies,
+            "feature_names": self.feature_names,
+            "target": self.target,
+        })
+        return forest.save(path)
+
+    @classmethod
+    def load(cls, path=DEFAULT_BUNDLE_PATH):
+        """Memuat bundle joblib, atau direktori hasil `export_compact` (mmap, tanpa sklearn)."""
+        from compact_forest import CompactForest, is_compact_model
+
+        if is_compact_model(path):
+            forest = CompactForest.load(path)
+            meta = forest.metadata
+            return cls(forest, CategoricalEncoder(meta["vocabularies"]), meta["feature_names"], meta["target"])
+        import joblib
+
+        payload = joblib.load(path)
+        model = payload["model"]
+        # Paralelisme diatur di level batch, bukan di dalam predict_proba.
+        if hasattr(model, "n_jobs"):
+            model.n_jobs = 1
+        return cls(model, CategoricalEncoder(payload["vocabularies"]), payload["feature_names"], payload["target"])
+
+    def features(self, df):
+        """Cleaning + encoding satu batch menjadi matriks fitur berurutan."""
+        df = self.encoder.transform(clean_survey(df))
+        missing = [col for col in self.feature_names if col not in df.columns]
+        if missing:
+            raise ValueError(f"Kolom fitur tidak ada di input: {missing}")
+        # Age NA (tidak valid) menjadi NaN; model meneruskannya lewat cabang missing.
+        return df[self.feature_names].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    def predict_proba(self, df):
+        """Probabilitas treatment == 'Yes' untuk satu batch DataFrame."""
+        return self.model.predict_proba(self.features(df))[:, self.positive_column]
+
+
+# --- EKSEKUSI BATCH ---
+_process_bundle = None
+
+
+def _init_process(bundle_path):
+    global _process_bundle
+    _process_bundle = ModelBundle.load(bundle_path)
+
+
+def _score_in_process(batch):
+    return batch.index.to_numpy(), _process_bundle.predict_proba(batch)
+
+
+def iter_json_batches(stream, batch_size):
+    """Mengelompokkan record JSON (satu per baris) menjadi DataFrame per batch."""
+    offset = 0
+    lines = (line for line in stream if line.strip())
+    while True:
+        records = [json.loads(line) for line in itertools.islice(lines, batch_size)]
+        if not records:
+            return
+        batch = records_to_frame(records)
+        batch.index = pd.RangeIndex(offset, offset + len(batch))
+        offset += len(batch)
+        yield batch
+
+
+def score_batches(bundle, batches, workers=1, executor="thread", bundle_path=None):
+    """
+    Menilai batch secara paralel dan mengembalikan (row_index, probabilitas)
+    dalam urutan input. Jumlah batch yang sedang diproses dibatasi 2x worker
+    sehingga memori tetap terbatas berapapun panjang inputnya.
+    """
+    if workers <= 1:
+        for batch in batches:
+            yield batch.index.to_numpy(), bundle.predict_proba(batch)
+        return
+    if executor == "process":
+        pool = ProcessPoolExecutor(workers, initializer=_init_process, initargs=(bundle_path,))
+        submit = lambda batch: pool.submit(_score_in_process, batch)  # noqa: E731
+    else:
+        pool = ThreadPoolExecutor(workers)
+        submit = lambda batch: pool.submit(lambda b: (b.index.to_numpy(), bundle.predict_proba(b)), batch)  # noqa: E731
+    with pool:
+        in_flight = deque()
+        for batch in batches:
+            in_flight.append(submit(batch))
+            if len(in_flight) >= 2 * workers:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
+
+
+def score_file(model_path, input_path, output="-", batch_size=50_000, workers=1, executor="thread"):
+    """
+    Menilai CSV survei / file JSON Lines / stdin ('-') dan menulis CSV
+    `row,treatment_probability` ke `output` ('-' = stdout). Mengembalikan
+    (jumlah baris, detik).
+    """
+    # Worker proses memuat bundle sendiri di `_init_process`; proses induk tidak perlu.
+    bundle = None if workers > 1 and executor == "process" else ModelBundle.load(model_path)
+    with contextlib.ExitStack() as stack:
+        if input_path == "-":
+            batches = iter_json_batches(sys.stdin, batch_size)
+        elif input_path.endswith((".jsonl", ".json")):
+            batches = iter_json_batches(stack.enter_context(open(input_path, encoding="utf-8")), batch_size)
+        else:
+            header = pd.read_csv(input_path, nrows=0).columns
+            usecols = [col for col in header if col in SURVEY_SCHEMA and col != "comments"]
+            batches = iter_survey(input_path, chunksize=batch_size, usecols=usecols)
+
+        out = sys.stdout if output == "-" else stack.enter_context(open(output, "w", encoding="utf-8", newline=""))
+        started, total = time.perf_counter(), 0
+        out.write("row,treatment_probability\n")
+        for rows, probabilities in score_batches(bundle, batches, workers, executor, model_path):
+            pd.DataFrame({"row": rows, "treatment_probability": probabilities}).to_csv(
+                out, header=False, index=False, float_format="%.6f")
+            total += len(rows)
+    return total, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=DEFAULT_BUNDLE_PATH)
+    parser.add_argument("--input", required=True, help="CSV survei, file .jsonl, atau '-' untuk JSON dari stdin")
+    parser.add_argument("--output", default="-", help="CSV output, atau '-' untuk stdout")
+    parser.add_argument("--batch-size", type=int, default=50_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--executor", choices=("thread", "process"), default="thread")
+    args = parser.parse_args()
+
+    total, elapsed = score_file(args.model, args.input, args.output, args.batch_size, args.workers, args.executor)
+    print(f"✅ {total:,} baris dinilai dalam {elapsed:.2f} s ({total / elapsed:,.0f} baris/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Analisis per segmen: model treatment & feature importance per Country,
+per ukuran perusahaan (`no_employees`), dan per `tech_company`.
+
+Data ter-encode dibagikan sekali lewat shared memory. Pengelompokan dilakukan
+sekali per kolom segmen (argsort kode), sehingga setiap segmen hanyalah
+potongan [start, stop) dari array indeks, tanpa menyalin DataFrame per grup.
+
+Contoh:
+    python segmentation.py --min-size 50 --workers 4
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import roc_auc_score
+from sklearn.model_selection import train_test_split
+
+from shared_arrays import SharedArray
+
+SEGMENT_COLUMNS = ["Country", "no_employees", "tech_company"]
+TOP_FEATURES = 3
+
+_worker = {}
+
+
+def group_segments(X, feature_names, segment_columns):
+    """
+    Mengelompokkan baris per nilai kolom segmen.
+    Mengembalikan (order, segments): `order` berisi indeks baris yang diurutkan
+    per kolom (digabung), `segments` = [(kolom, kode, start, stop), ...].
+    """
+    orders, segments, offset = [], [], 0
+    for col in segment_columns:
+        codes = np.asarray(X[:, feature_names.index(col)])
+        order = np.argsort(codes, kind="stable")
+        values, starts, counts = np.unique(codes[order], return_index=True, return_counts=True)
+        for code, start, count in zip(values, starts, counts):
+            segments.append((col, int(code), offset + int(start), offset + int(start + count)))
+        orders.append(order)
+        offset += len(order)
+    return np.concatenate(orders), segments
+
+
+def _init_worker(X_handle, y_handle, order_handle, feature_names, random_state):
+    _worker.update(
+        X=SharedArray.attach(X_handle), y=SharedArray.attach(y_handle),
+        order=SharedArray.attach(order_handle), feature_names=feature_names, random_state=random_state,
+    )
+
+
+def _evaluate_segment(start, stop, n_estimators):
+    rows = _worker["order"].array[start:stop]
+    X, y = _worker["X"].array[rows], _worker["y"].array[rows]
+    class_counts = np.bincount(y)
+    class_counts = class_counts[class_counts > 0]
+    if len(class_counts) < 2 or class_counts.min() < 2:
+        return {"status": "skipped: kelas target kurang dari 2 per kelas"}
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=0.2, random_state=_worker["random_state"], stratify=y)
+    model = RandomForestClassifier(n_estimators=n_estimators, random_state=_worker["random_state"], n_jobs=1)
+    started = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - started
+    auc = roc_auc_score(y_test, model.predict_proba(X_test)[:, 1]) if len(np.unique(y_test)) > 1 else np.nan
+    importances = pd.Series(model.feature_importances_, index=_worker["feature_names"]).sort_values(ascending=False)
+    return {
+        "status": "ok",
+        "treatment_rate": float(y.mean()),
+        "roc_auc": float(auc),
+        "fit_seconds": fit_seconds,
+        "top_features": ", ".join(importances.head(TOP_FEATURES).index),
+        "importances": importances.round(6).to_dict(),
+    }
+
+
+def run_segments(X, y, feature_names, encoder, segment_columns=SEGMENT_COLUMNS, min_size=50,
+                 n_estimators=100, workers=None, random_state=42):
+    """
+    Melatih & mengevaluasi model per segmen di process pool.
+    Mengembalikan (tabel konsolidasi, {nama_segmen: importances}).
+    """
+    feature_names = list(feature_names)
+    order, segments = group_segments(X, feature_names, segment_columns)
+    rows, importances, futures = [], {}, {}
+
+    with SharedArray.publish(X) as X_shared, SharedArray.publish(y) as y_shared, \
+            SharedArray.publish(order) as order_shared:
+        with ProcessPoolExecutor(
+            max_workers=workers or os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(X_shared.handle, y_shared.handle, order_shared.handle, feature_names, random_state),
+        ) as pool:
+            for col, code, start, stop in segments:
+                vocabulary = encoder.vocabularies.get(col)
+                value = vocabulary[code] if vocabulary is not None and 0 <= code < len(vocabulary) else str(code)
+                row = {"segment_column": col, "segment_value": value, "rows": stop - start}
+                rows.append(row)
+                if stop - start < min_size:
+                    row["status"] = f"skipped: < {min_size} baris"
+                    continue
+                futures[len(rows) - 1] = pool.submit(_evaluate_segment, start, stop, n_estimators)
+            for i, future in futures.items():
+                result = future.result()
+                segment_importances = result.pop("importances", None)
+                if segment_importances is not None:
+                    importances[f"{rows[i]['segment_column']}={rows[i]['segment_value']}"] = segment_importances
+                rows[i].update(result)
+
+    table = pd.DataFrame(rows)
+    table = table.sort_values(["segment_column", "rows"], ascending=[True, False], ignore_index=True)
+    return table, importances
+
+
+def _slug(text):
+    return "".join(ch if ch.isalnum() else "_" for ch in str(text)).strip("_")
+
+
+def main():
+    from dataset_cache import load_survey_dataset
+    from plotting import PlotRenderer
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--survey", default="survey.csv")
+    parser.add_argument("--segments", nargs="+", default=SEGMENT_COLUMNS)
+    parser.add_argument("--min-size", type=int, default=50)
+    parser.add_argument("--n-estimators", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output-dir", default=os.path.join("model_output", "segments"))
+    parser.add_argument("--plots-dir", default=os.path.join("plots_output", "segments"))
+    parser.add_argument("--preview", action="store_true", help="plot per segmen dengan DPI rendah")
+    args = parser.parse_args()
+
+    dataset, _ = load_survey_dataset(args.survey, verbose=False)
+    started = time.perf_counter()
+    table, importances = run_segments(dataset.X, dataset.y, dataset.feature_names, dataset.encoder,
+                                      args.segments, args.min_size, args.n_estimators, args.workers)
+    print(f"✅ {int((table['status'] == 'ok').sum())} dari {len(table)} segmen dianalisis "
+          f"dalam {time.perf_counter() - started:.1f} s")
+    print(table.drop(columns=["top_features"], errors="ignore").head(20).to_string())
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    table_path = os.path.join(args.output_dir, "segment_results.csv")
+    table.to_csv(table_path, index=False)
+    print(f"\n💾 Tabel segmen disimpan di: {table_path}")
+
+    with PlotRenderer(args.plots_dir, preview=args.preview) as renderer:
+        for name, values in importances.items():
+            renderer.submit(f"feature_importance_{_slug(name)}", "feature_importance", {
+                "features": list(values), "importances": list(values.values()),
+                "title": f"Feature Importance - {name}",
+            })
+    print(f"📊 {len(importances)} plot segmen disimpan di: {renderer.plots_dir}")
+
+
+if __name__ == "__main__":
+    main()
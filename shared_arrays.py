@@ -0,0 +1,50 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+class SharedArray:
+    """
+    Array numpy di shared memory yang bisa dibuka worker tanpa pickling data.
+    Proses induk memanggil `publish`; worker cukup menerima `handle` (nama,
+    shape, dtype) dan memanggil `attach`.
+    """
+
+    def __init__(self, shm, array, owner):
+        self._shm = shm
+        self.array = array
+        self.owner = owner
+
+    @property
+    def handle(self):
+        return (self._shm.name, self.array.shape, self.array.dtype.str)
+
+    @classmethod
+    def publish(cls, array):
+        array = np.asarray(array)
+        shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        shared = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+        shared[...] = array
+        return cls(shm, shared, owner=True)
+
+    @classmethod
+    def attach(cls, handle):
+        name, shape, dtype = handle
+        # Worker multiprocessing berbagi resource tracker dengan proses induk,
+        # jadi segmen tetap hanya di-unlink sekali oleh induk lewat `close`.
+        shm = shared_memory.SharedMemory(name=name)
+        array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        array.flags.writeable = False
+        return cls(shm, array, owner=False)
+
+    def close(self):
+        self.array = None
+        self._shm.close()
+        if self.owner:
+            self._shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,84 @@
+import hashlib
+import io
+import os
+
+from PIL import Image
+
+EMU_PER_INCH = 914400
+DEFAULT_SLIDE_DPI = 150
+FORMATS = ("png", "png8", "jpeg")
+
+
+def image_digest(image_bytes):
+    return hashlib.sha256(image_bytes).hexdigest()
+
+
+def resample_image(image_bytes, box_width_in, box_height_in, dpi=DEFAULT_SLIDE_DPI, fmt="png", quality=85):
+    """
+    Mengubah ukuran gambar agar pas dengan kotak placeholder (inci) pada `dpi`
+    target, lalu meng-encode ulang. Gambar tidak pernah diperbesar.
+    - png  : PNG dengan `optimize=True`
+    - png8 : PNG palet 256 warna (sangat kecil untuk plot dengan warna terbatas)
+    - jpeg : JPEG dengan `quality`
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Format gambar tidak dikenal: {fmt!r} (pilihan: {', '.join(FORMATS)})")
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        image.load()
+    target = (max(1, round(box_width_in * dpi)), max(1, round(box_height_in * dpi)))
+    if image.width > target[0] or image.height > target[1]:
+        image = image.resize(target, Image.LANCZOS)
+
+    buffer = io.BytesIO()
+    if fmt == "jpeg":
+        image.convert("RGB").save(buffer, format="JPEG", quality=quality, optimize=True)
+    elif fmt == "png8":
+        image.convert("RGB").quantize(colors=256).save(buffer, format="PNG", optimize=True)
+    else:
+        image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+class ImagePreparer:
+    """
+    Menyiapkan gambar untuk slide dengan cache berbasis hash isi.
+    Gambar identik (di slide atau deck berbeda) hanya di-resample sekali;
+    `cache_dir` opsional membagikan hasilnya antar proses/run.
+    """
+
+    def __init__(self, dpi=DEFAULT_SLIDE_DPI, fmt="png", quality=85, cache_dir=None):
+        self.dpi = dpi
+        self.fmt = fmt
+        self.quality = quality
+        self.cache_dir = cache_dir
+        self._cache = {}
+        self.hits = 0
+        self.misses = 0
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _key(self, image_bytes, width_emu, height_emu):
+        return f"{image_digest(image_bytes)[:32]}-{width_emu}x{height_emu}-{self.dpi}-{self.fmt}-{self.quality}"
+
+    def prepare(self, image_bytes, width_emu, height_emu):
+        """Bytes gambar siap-embed untuk kotak berukuran `width_emu` x `height_emu`."""
+        key = self._key(image_bytes, int(width_emu), int(height_emu))
+        if key in self._cache:
+            self.hits += 1
+            return self._cache[key]
+        path = os.path.join(self.cache_dir, key) if self.cache_dir else None
+        if path and os.path.exists(path):
+            with open(path, "rb") as f:
+                prepared = f.read()
+            self.hits += 1
+        else:
+            prepared = resample_image(image_bytes, width_emu / EMU_PER_INCH, height_emu / EMU_PER_INCH,
+                                      self.dpi, self.fmt, self.quality)
+            self.misses += 1
+            if path:
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(prepared)
+                os.replace(tmp_path, path)
+        self._cache[key] = prepared
+        return prepared
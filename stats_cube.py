@@ -0,0 +1,305 @@
+"""
+Cube statistik deskriptif untuk query crosstab ad-hoc (mis. rate treatment per
+family_history x work_interfere x Country) tanpa membaca ulang CSV mentah.
+
+Cube menyimpan sel dasar yang jarang (sparse): setiap kombinasi kategori yang
+benar-benar muncul di data disimpan sekali sebagai baris kode + jumlah baris.
+Query apa pun atas subset dimensi adalah roll-up dari sel ini: kode dimensi
+yang diminta digabung menjadi satu kunci mixed-radix lalu dijumlah dengan
+`np.bincount`. Biayanya bergantung pada jumlah sel unik, bukan jumlah baris.
+Dimensi default sengaja dibatasi ke kolom berkardinalitas kecil dan tetap,
+sehingga jumlah sel dibatasi produk kardinalitasnya (bukan jumlah baris);
+kolom terbuka seperti Country atau state ditambahkan lewat `--dimensions`.
+
+Pembaruan inkremental memakai offset byte yang sama dengan `incremental.py`:
+hanya baris yang ditambahkan setelah build/refresh terakhir yang dibaca,
+divalidasi, dibersihkan lalu digabung ke sel yang ada.
+
+Contoh:
+    python stats_cube.py --by family_history work_interfere --where Gender=Female
+    python stats_cube.py --cube model_output/stats_cube_country --dimensions treatment family_history Country \
+        --by Country --target treatment=Yes --min-count 20
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+
+from cleaning import clean_survey
+from data_loader import SURVEY_SCHEMA
+from dataset_cache import DROP_COLUMNS
+
+CUBE_FORMAT_VERSION = 1
+DEFAULT_CUBE_PATH = os.path.join("model_output", "stats_cube")
+MISSING_LABEL = "__missing__"
+# Batas ukuran hasil query padat (produk kardinalitas dimensi `by`).
+MAX_DENSE_CELLS = 10_000_000
+
+# Age dijadikan dimensi kategori lewat kelompok usia.
+AGE_BAND_EDGES = [25, 35, 45, 55]
+AGE_BAND_LABELS = ["18-24", "25-34", "35-44", "45-54", "55+"]
+# Produk kardinalitas default 2*2*5*3*3*3*5 = 2.700 sel, berapa pun jumlah barisnya.
+# Semua kolom kategori sekaligus memberi hampir satu sel per baris (tidak ada roll-up).
+DEFAULT_DIMENSIONS = ["treatment", "family_history", "work_interfere", "benefits", "care_options", "Gender",
+                      "age_band"]
+# Dimensi yang boleh dipilih untuk cube kustom.
+AVAILABLE_DIMENSIONS = [
+    col for col, dtype in SURVEY_SCHEMA.items()
+    if col not in DROP_COLUMNS and (dtype == "category" or isinstance(dtype, CategoricalDtype))
+] + ["age_band"]
+
+
+def _dimension_values(chunk, dim):
+    if dim == "age_band":
+        age = chunk["Age"].to_numpy()
+        return pd.Categorical.from_codes(np.digitize(age, AGE_BAND_EDGES), categories=AGE_BAND_LABELS)
+    return chunk[dim]
+
+
+def _group_rows(codes, cardinalities):
+    """
+    Mengelompokkan baris matriks kode; mengembalikan (indeks baris pertama, inverse).
+    Kunci mixed-radix int64 jika muat, selain itu `np.unique(axis=0)`.
+    """
+    if np.prod(np.asarray(cardinalities, dtype=np.float64)) < 2 ** 62:
+        keys = np.zeros(len(codes), dtype=np.int64)
+        for dim, cardinality in enumerate(cardinalities):
+            keys = keys * cardinality + codes[:, dim]
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    else:
+        _, first, inverse = np.unique(codes, axis=0, return_index=True, return_inverse=True)
+    return first, inverse.reshape(-1)
+
+
+class StatsCube:
+    """Sel dasar sparse (kode per dimensi + jumlah) dengan query slice & roll-up."""
+
+    def __init__(self, dimensions=DEFAULT_DIMENSIONS, vocabularies=None, cells=None, counts=None, source=None):
+        self.dimensions = list(dimensions)
+        self.vocabularies = {dim: list((vocabularies or {}).get(dim, [])) for dim in self.dimensions}
+        self.cells = cells if cells is not None else np.empty((0, len(self.dimensions)), dtype=np.int16)
+        self.counts = counts if counts is not None else np.empty(0, dtype=np.int64)
+        self.source = dict(source or {})
+        self._query_cache = {}
+
+    @property
+    def rows(self):
+        return int(self.counts.sum())
+
+    @property
+    def n_cells(self):
+        return len(self.counts)
+
+    def cardinalities(self, dimensions=None):
+        return [len(self.vocabularies[dim]) for dim in (dimensions or self.dimensions)]
+
+    # --- PEMBARUAN ---
+    def _encode(self, values, dim):
+        """Kode per baris; label yang belum dikenal ditambahkan ke akhir vocabulary."""
+        values = pd.Series(values)
+        if isinstance(values.dtype, CategoricalDtype):
+            row_codes, labels = values.cat.codes.to_numpy(), values.cat.categories
+        else:
+            row_codes, labels = pd.factorize(values)
+        labels = [str(label) for label in labels] + [MISSING_LABEL]
+        vocabulary = self.vocabularies[dim]
+        lookup = pd.Index(vocabulary).get_indexer(labels)
+        used = np.zeros(len(labels), dtype=bool)
+        used[np.unique(row_codes)] = True  # kode -1 (NA) menandai elemen terakhir
+        for i in np.flatnonzero((lookup == -1) & used):
+            vocabulary.append(labels[i])
+            lookup[i] = len(vocabulary) - 1
+        return lookup[row_codes]
+
+    def update(self, chunk):
+        """Menambahkan baris dari DataFrame yang sudah divalidasi & dibersihkan."""
+        if chunk.empty:
+            return self
+        batch = np.column_stack([self._encode(_dimension_values(chunk, dim), dim) for dim in self.dimensions])
+        cells = np.concatenate([self.cells, batch])
+        counts = np.concatenate([self.counts, np.ones(len(batch), dtype=np.int64)])
+        first, inverse = _group_rows(cells, self.cardinalities())
+        code_dtype = np.int16 if max(self.cardinalities()) <= np.iinfo(np.int16).max else np.int32
+        self.cells = cells[first].astype(code_dtype)
+        self.counts = np.bincount(inverse, weights=counts, minlength=len(first)).astype(np.int64)
+        self._query_cache.clear()
+        return self
+
+    def refresh(self, survey_path, chunksize=100_000):
+        """Membaca baris baru setelah offset terakhir; mengembalikan jumlah baris yang ditambahkan."""
+        from incremental import iter_new_rows
+
+        chunks, end = iter_new_rows(survey_path, self.source.get("byte_offset", 0), chunksize)
+        added = 0
+        for chunk in chunks:
+            self.update(clean_survey(chunk))
+            added += len(chunk)
+        self.source.update(path=survey_path, byte_offset=end)
+        return added
+
+    @classmethod
+    def build(cls, survey_path, dimensions=DEFAULT_DIMENSIONS, chunksize=100_000):
+        cube = cls(dimensions)
+        cube.refresh(survey_path, chunksize)
+        return cube
+
+    # --- QUERY ---
+    def _resolve_filter(self, dim, value):
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        vocabulary = self.vocabularies[dim]
+        return [vocabulary.index(str(v)) for v in values if str(v) in vocabulary]
+
+    def slice(self, **filters):
+        """Sub-cube dengan sel yang cocok; nilai filter berupa label atau list label."""
+        mask = np.ones(self.n_cells, dtype=bool)
+        for dim, value in filters.items():
+            if dim not in self.vocabularies:
+                raise KeyError(f"Dimensi tidak dikenal: {dim!r}")
+            mask &= np.isin(self.cells[:, self.dimensions.index(dim)], self._resolve_filter(dim, value))
+        return StatsCube(self.dimensions, self.vocabularies, self.cells[mask], self.counts[mask], self.source)
+
+    def counts_array(self, by):
+        """Array padat berbentuk (kardinalitas dim_1, ..., dim_k) berisi jumlah baris."""
+        by = tuple(by)
+        cached = self._query_cache.get(by)
+        if cached is not None:
+            return cached
+        cardinalities = self.cardinalities(by)
+        if np.prod(np.asarray(cardinalities, dtype=np.float64)) > MAX_DENSE_CELLS:
+            raise ValueError(f"Terlalu banyak kombinasi untuk {list(by)}; kurangi dimensi atau slice lebih dulu")
+        keys = np.zeros(self.n_cells, dtype=np.int64)
+        for dim, cardinality in zip(by, cardinalities):
+            keys = keys * cardinality + self.cells[:, self.dimensions.index(dim)]
+        total = np.bincount(keys, weights=self.counts, minlength=int(np.prod(cardinalities, dtype=np.int64)))
+        result = total.astype(np.int64).reshape(cardinalities)
+        self._query_cache[by] = result
+        return result
+
+    def crosstab(self, by, min_count=1):
+        """Jumlah baris per kombinasi `by` (kombinasi kosong dibuang) sebagai Series ber-MultiIndex."""
+        by = list(by)
+        counts = self.counts_array(by)
+        index = pd.MultiIndex.from_product([self.vocabularies[dim] for dim in by], names=by)
+        series = pd.Series(counts.reshape(-1), index=index, name="count")
+        return series[series >= min_count]
+
+    def rate(self, by, target="treatment", positive="Yes", min_count=1):
+        """Jumlah, jumlah positif dan proporsi `target == positive` per kombinasi `by`."""
+        by = [dim for dim in by if dim != target]
+        if positive not in self.vocabularies[target]:
+            raise KeyError(f"{positive!r} bukan nilai {target}: {self.vocabularies[target]}")
+        counts = self.counts_array(by + [target])
+        total = counts.sum(axis=-1).reshape(-1)
+        hits = counts[..., self.vocabularies[target].index(positive)].reshape(-1)
+        index = pd.MultiIndex.from_product([self.vocabularies[dim] for dim in by], names=by)
+        table = pd.DataFrame({"count": total, "positive": hits}, index=index)
+        table = table[table["count"] >= min_count]
+        table["rate"] = table["positive"] / table["count"]
+        return table
+
+    # --- SIMPAN / MUAT ---
+    def save(self, path=DEFAULT_CUBE_PATH):
+        """Menulis sel .npy + meta.json ke direktori `path` secara atomik."""
+        parent = os.path.dirname(os.path.abspath(path))
+        os.makedirs(parent, exist_ok=True)
+        tmp_dir = tempfile.mkdtemp(prefix=".cube-", dir=parent)
+        try:
+            np.save(os.path.join(tmp_dir, "cells.npy"), self.cells)
+            np.save(os.path.join(tmp_dir, "counts.npy"), self.counts)
+            with open(os.path.join(tmp_dir, "meta.json"), "w", encoding="utf-8") as f:
+                json.dump({
+                    "version": CUBE_FORMAT_VERSION,
+                    "dimensions": self.dimensions,
+                    "vocabularies": self.vocabularies,
+                    "source": self.source,
+                    "rows": self.rows,
+                }, f, ensure_ascii=False, indent=2)
+            if os.path.exists(path):
+                shutil.rmtree(path)
+            os.replace(tmp_dir, path)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        return path
+
+    @classmethod
+    def load(cls, path=DEFAULT_CUBE_PATH):
+        """Memuat cube tersimpan; None jika belum ada atau formatnya lama."""
+        try:
+            with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            return None
+        if meta.get("version") != CUBE_FORMAT_VERSION:
+            return None
+        return cls(meta["dimensions"], meta["vocabularies"], np.load(os.path.join(path, "cells.npy")),
+                   np.load(os.path.join(path, "counts.npy")), meta["source"])
+
+
+def load_or_build_cube(survey_path, path=DEFAULT_CUBE_PATH, dimensions=DEFAULT_DIMENSIONS, rebuild=False):
+    """
+    Cube untuk `survey_path`: dimuat dari `path` lalu di-refresh dengan baris baru,
+    atau dibangun ulang jika belum ada, dimensinya berbeda, atau file mengecil
+    (ditulis ulang, bukan di-append). Mengembalikan (cube, baris_ditambahkan, dibangun_ulang).
+    """
+    cube = None if rebuild else StatsCube.load(path)
+    if (cube is None or cube.dimensions != list(dimensions) or cube.source.get("path") != survey_path
+            or os.path.getsize(survey_path) < cube.source.get("byte_offset", 0)):
+        cube = StatsCube.build(survey_path, dimensions)
+        cube.save(path)
+        return cube, cube.rows, True
+    added = cube.refresh(survey_path)
+    if added:
+        cube.save(path)
+    return cube, added, False
+
+
+def _parse_where(items):
+    filters = {}
+    for item in items or []:
+        dim, _, value = item.partition("=")
+        filters.setdefault(dim.strip(), []).append(value.strip().strip('"'))
+    return filters
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--survey", default="survey.csv")
+    parser.add_argument("--cube", default=DEFAULT_CUBE_PATH)
+    parser.add_argument("--dimensions", nargs="+", choices=AVAILABLE_DIMENSIONS, default=DEFAULT_DIMENSIONS,
+                        metavar="DIM", help="dimensi cube (cube dibangun ulang jika berbeda dari yang tersimpan)")
+    parser.add_argument("--by", nargs="+", default=["family_history", "work_interfere"])
+    parser.add_argument("--where", nargs="+", default=None, metavar="DIM=NILAI",
+                        help="filter slice; dimensi yang sama boleh diulang (OR)")
+    parser.add_argument("--target", default="treatment=Yes", help="DIM=NILAI untuk kolom rate; '' = jumlah saja")
+    parser.add_argument("--min-count", type=int, default=1)
+    parser.add_argument("--rebuild", action="store_true")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    cube, added, rebuilt = load_or_build_cube(args.survey, args.cube, args.dimensions, rebuild=args.rebuild)
+    elapsed = time.perf_counter() - started
+    action = "dibangun" if rebuilt else f"dimuat (+{added:,} baris baru)"
+    print(f"🧊 Cube {action} dalam {elapsed:.2f} s: {cube.rows:,} baris -> {cube.n_cells:,} sel, "
+          f"{len(cube.dimensions)} dimensi")
+
+    started = time.perf_counter()
+    view = cube.slice(**_parse_where(args.where))
+    if args.target:
+        target, _, positive = args.target.partition("=")
+        table = view.rate(args.by, target, positive, args.min_count)
+    else:
+        table = view.crosstab(args.by, args.min_count).to_frame()
+    elapsed = time.perf_counter() - started
+    print(table.to_string())
+    print(f"\n⏱️ Query {len(table):,} baris hasil dalam {elapsed * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+Klien ringkasan LLM: asinkron, konkuren terbatas, dengan cache di disk.
+
+- Backend `ReplicateBackend` memanggil IBM Granite via Replicate secara streaming.
+- Backend `MockBackend` menghasilkan token lokal (tanpa jaringan) untuk tes & benchmark.
+- Hasil disimpan di cache berbasis isi (hash prompt + model + parameter), jadi prompt
+  yang identik tidak pernah memanggil API dua kali; prompt identik yang sedang
+  berjalan bersamaan juga hanya dikirim sekali.
+
+Contoh (offline):
+    python summarizer.py --backend mock --prompt "Ringkas temuan survei" --repeat 20
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+DEFAULT_MODEL = "ibm-granite/granite-3.2-8b-instruct"
+DEFAULT_PARAMS = {"max_new_tokens": 250, "temperature": 0.7}
+DEFAULT_CACHE_DIR = os.path.join(".cache", "summaries")
+
+
+# --- CACHE ---
+def summary_key(prompt, model, params, backend="replicate"):
+    # Backend ikut kunci agar ringkasan mock tidak pernah dikembalikan untuk run Replicate.
+    payload = json.dumps({"prompt": prompt, "model": model, "params": params, "backend": backend},
+                         sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+    """Cache ringkasan di disk; satu file JSON per kunci (ditulis atomik)."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key):
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return json.load(f)["text"]
+        except (FileNotFoundError, json.JSONDecodeError, KeyError):
+            return None
+
+    def put(self, key, text, **meta):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"text": text, **meta}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+# --- BACKEND ---
+class ReplicateBackend:
+    """Streaming token dari Replicate. Membutuhkan REPLICATE_API_TOKEN."""
+
+    name = "replicate"
+
+    async def stream(self, prompt, model, params):
+        import replicate  # dependensi opsional, hanya untuk backend ini
+
+        async for event in replicate.async_stream(model, input={"prompt": prompt, **params}):
+            yield str(event)
+
+
+class MockBackend:
+    """Backend lokal deterministik: meniru latensi awal dan kecepatan token API."""
+
+    name = "mock"
+
+    def __init__(self, first_token_latency=0.2, tokens_per_second=200.0):
+        self.first_token_latency = first_token_latency
+        self.tokens_per_second = tokens_per_second
+        self.calls = 0
+
+    async def stream(self, prompt, model, params):
+        self.calls += 1
+        await asyncio.sleep(self.first_token_latency)
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8]
+        words = (f"**Ringkasan Eksekutif ({digest})**\n\n" + " ".join(
+            line.strip("- ").strip() for line in prompt.strip().splitlines() if line.startswith("- ")
+        )).split(" ")
+        limit = int(params.get("max_new_tokens", len(words)))
+        for word in words[:limit]:
+            await asyncio.sleep(1 / self.tokens_per_second)
+            yield word + " "
+
+
+BACKENDS = {"replicate": ReplicateBackend, "mock": MockBackend}
+
+
+# --- KLIEN ---
+class _TokenStream:
+    """
+    Token dari satu generasi yang sedang berjalan, diteruskan ke semua pendengar.
+    Pendengar yang bergabung belakangan menerima ulang token attempt saat ini.
+    `None` dikirim sebagai sinyal reset: token sebelumnya berasal dari attempt
+    yang gagal dan harus dibuang karena akan di-retry.
+    """
+
+    def __init__(self):
+        self.listeners = []
+        self.tokens = []
+
+    def add(self, on_token):
+        for token in self.tokens:
+            on_token(token)
+        self.listeners.append(on_token)
+
+    def emit(self, token):
+        self.tokens.append(token)
+        for on_token in self.listeners:
+            on_token(token)
+
+    def reset(self):
+        if self.tokens:
+            for on_token in self.listeners:
+                on_token(None)
+        self.tokens = []
+
+
+class SummarizationClient:
+    def __init__(self, backend, cache=None, model=DEFAULT_MODEL, params=None,
+                 max_concurrency=4, timeout=60.0, retries=2, backoff=1.0):
+        self.backend = backend
+        self.cache = cache
+        self.model = model
+        self.params = dict(DEFAULT_PARAMS if params is None else params)
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._in_flight = {}
+        self.cache_hits = 0
+        self.api_calls = 0
+
+    async def _generate(self, prompt, stream):
+        for attempt in range(self.retries + 1):
+            try:
+                async with self._semaphore:
+                    self.api_calls += 1
+                    async with asyncio.timeout(self.timeout):
+                        async for token in self.backend.stream(prompt, self.model, self.params):
+                            stream.emit(token)
+                    return "".join(stream.tokens).strip()
+            except Exception:
+                if attempt == self.retries:
+                    raise
+                stream.reset()
+                await asyncio.sleep(self.backoff * 2 ** attempt)
+
+    async def summarize(self, prompt, on_token=None):
+        """
+        Ringkasan untuk satu prompt; dari cache jika sudah pernah dibuat.
+
+        `on_token(token)` menerima token secara streaming, juga bila prompt identik
+        sudah berjalan (token yang terlewat dikirim ulang lebih dulu). `on_token(None)`
+        berarti attempt sebelumnya gagal: buang token yang sudah diterima. Hasil dari
+        cache dikembalikan langsung tanpa memanggil `on_token`.
+        """
+        backend_name = getattr(self.backend, "name", type(self.backend).__name__)
+        key = summary_key(prompt, self.model, self.params, backend_name)
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.cache_hits += 1
+                return cached
+        if key in self._in_flight:  # prompt identik sedang diproses: tunggu hasilnya
+            task, stream = self._in_flight[key]
+            if on_token is not None:
+                stream.add(on_token)
+            return await asyncio.shield(task)
+        stream = _TokenStream()
+        if on_token is not None:
+            stream.add(on_token)
+        task = asyncio.ensure_future(self._generate(prompt, stream))
+        self._in_flight[key] = (task, stream)
+        try:
+            text = await task
+        finally:
+            del self._in_flight[key]
+        if self.cache is not None:
+            self.cache.put(key, text, model=self.model, params=self.params, backend=backend_name,
+                           created=time.time())
+        return text
+
+    async def summarize_many(self, prompts, return_exceptions=False):
+        """Ringkasan paralel untuk banyak prompt (mis. per negara/segmen)."""
+        return await asyncio.gather(*(self.summarize(prompt) for prompt in prompts),
+                                    return_exceptions=return_exceptions)
+
+
+def summarize_sync(prompt, backend, cache_dir=DEFAULT_CACHE_DIR, **client_options):
+    """Pembungkus sinkron untuk skrip yang tidak berjalan di event loop."""
+    async def run():
+        client = SummarizationClient(backend, SummaryCache(cache_dir), **client_options)
+        return await client.summarize(prompt)
+    return asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="mock")
+    parser.add_argument("--prompt", required=True)
+    parser.add_argument("--repeat", type=int, default=1, help="jumlah varian prompt (untuk benchmark)")
+    parser.add_argument("--duplicates", type=int, default=2, help="berapa kali setiap varian dikirim")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    args = parser.parse_args()
+
+    prompts = [f"{args.prompt}\n- segmen {i}" for i in range(args.repeat)] * args.duplicates
+
+    async def run():
+        client = SummarizationClient(BACKENDS[args.backend](), SummaryCache(args.cache_dir),
+                                     max_concurrency=args.concurrency)
+        started = time.perf_counter()
+        results = await client.summarize_many(prompts)
+        elapsed = time.perf_counter() - started
+        print(results[0])
+        print(f"\n✅ {len(prompts)} prompt dalam {elapsed:.2f} s "
+              f"(panggilan API: {client.api_calls}, cache hit: {client.cache_hits})")
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
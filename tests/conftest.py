@@ -0,0 +1,35 @@
+import os
+import sys
+
+# Modul proyek berada di root repo (tanpa paket), jadi root ditambahkan ke sys.path.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+import pytest  # noqa: E402
+
+
+def _png(path, size=(1200, 900), color=(0, 102, 204)):
+    from PIL import Image
+
+    Image.new("RGB", size, color).save(path)
+    return str(path)
+
+
+@pytest.fixture
+def results_path(tmp_path):
+    """Artefak results.json minimal dengan tiga figure, seperti output Mental_Health_Data.py."""
+    from results_artifact import save_results
+
+    figures = {name: _png(tmp_path / f"{name}.png")
+               for name in ("treatment_distribution", "confusion_matrix", "feature_importance")}
+    return save_results({
+        "metrics": {"roc_auc": 0.8765, "model": "RandomForestClassifier", "n_features": 22, "n_respondents": 1234,
+                    "classification_report": {"0": {"precision": 0.80, "recall": 0.82, "support": 120},
+                                              "1": {"precision": 0.83, "recall": 0.81, "support": 127}}},
+        "importances": {"family_history": 0.3, "work_interfere": 0.2, "Age": 0.1},
+        "top_features": ["family_history", "work_interfere", "Age"],
+        "class_distribution": {"No": {"count": 600, "percent": 48.6}, "Yes": {"count": 634, "percent": 51.4}},
+        "summary_text": "Ringkasan uji.",
+    }, figures, str(tmp_path / "results.json"))
@@ -0,0 +1,27 @@
+import pandas as pd
+
+from cleaning import _canonical_gender, clean_survey, normalize_gender, GENDER_SYNONYMS
+
+
+def test_normalize_gender_matches_per_value_mapping():
+    raw = pd.Series(["Male", " f ", "Cis Female", "Trans woman", "Male-ish", "Agender", None, "Woman", "M"])
+    expected = [_canonical_gender(value, GENDER_SYNONYMS) for value in raw]
+    assert normalize_gender(raw).tolist() == expected
+    assert normalize_gender(raw.astype("category")).tolist() == expected
+    assert expected[:4] == ["male", "female", "female", "female"]
+    assert expected[5:7] == ["other", "other"]
+
+
+def test_normalize_gender_keeps_index_and_name():
+    raw = pd.Series(["female", "male"], index=[10, 20], name="Gender")
+    result = normalize_gender(raw, synonyms={})
+    assert result.index.tolist() == [10, 20]
+    assert result.name == "Gender"
+
+
+def test_clean_survey_fills_missing_answers():
+    chunk = pd.DataFrame({"Gender": ["F"], "work_interfere": [None], "self_employed": [None]})
+    cleaned = clean_survey(chunk)
+    assert cleaned.loc[0, "work_interfere"] == "Don't know"
+    assert cleaned.loc[0, "self_employed"] == "Don't know"
+    assert cleaned.loc[0, "Gender"] == "female"
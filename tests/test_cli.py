@@ -0,0 +1,30 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import cli
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("pandas", "sklearn", "matplotlib", "seaborn", "pptx", "replicate", "joblib")
+
+
+@pytest.mark.parametrize("statement", ["import cli; cli.build_parser()", "import Mental_Health_Data"])
+def test_startup_does_not_import_heavy_modules(statement):
+    code = f"import json, sys; {statement}; print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert json.loads(output.stdout.strip().splitlines()[-1]) == []
+
+
+def test_pipeline_arguments_are_passed_through(monkeypatch):
+    received = []
+    monkeypatch.setattr(cli, "cmd_pipeline", lambda args: received.append(args.pipeline_args))
+    cli.main(["pipeline", "--force", "train", "--dry-run"])
+    assert received == [["--force", "train", "--dry-run"]]
+
+
+def test_unknown_arguments_are_rejected_for_other_subcommands():
+    with pytest.raises(SystemExit):
+        cli.main(["score", "--input", "x.csv", "--bogus"])
@@ -0,0 +1,50 @@
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+
+from compact_forest import CompactForest, is_compact_model
+from encoder import CategoricalEncoder
+from scoring import ModelBundle
+
+
+def _forest(X, y, **kwargs):
+    return RandomForestClassifier(n_estimators=15, max_depth=8, random_state=0, **kwargs).fit(X, y)
+
+
+def test_nan_follows_sklearn_missing_branch():
+    rng = np.random.default_rng(0)
+    X = rng.integers(0, 5, size=(400, 4)).astype(float)
+    y = (X[:, 0] + rng.normal(size=400) > 2).astype(int)
+    X[rng.random(400) < 0.2, 0] = np.nan
+    model = _forest(X, y)
+
+    test = rng.integers(0, 5, size=(200, 4)).astype(float)
+    test[::3, 0] = np.nan
+    compact = CompactForest.from_sklearn(model)
+    np.testing.assert_allclose(compact.predict_proba(test), model.predict_proba(test), atol=1e-6)
+
+
+def test_predictions_match_sklearn_after_save_and_mmap_load(tmp_path):
+    rng = np.random.default_rng(1)
+    X = rng.integers(0, 40, size=(1000, 6)).astype(float)
+    y = rng.integers(0, 2, size=1000)
+    model = _forest(X, y, max_features=3)
+    path = CompactForest.from_sklearn(model).save(str(tmp_path / "compact"))
+
+    loaded = CompactForest.load(path)
+    assert isinstance(loaded.threshold, np.memmap)
+    test = rng.integers(0, 40, size=(300, 6)).astype(float)
+    np.testing.assert_allclose(loaded.predict_proba(test, block_rows=64), model.predict_proba(test), atol=1e-6)
+    np.testing.assert_array_equal(loaded.predict(test), model.predict(test))
+
+
+def test_bundle_load_detects_compact_directory(tmp_path):
+    rng = np.random.default_rng(2)
+    X = rng.integers(0, 3, size=(200, 2)).astype(float)
+    y = (X[:, 0] > 0).astype(int)
+    encoder = CategoricalEncoder({"treatment": ["No", "Yes"]})
+    bundle = ModelBundle(_forest(X, y), encoder, ["a", "b"])
+    path = bundle.export_compact(str(tmp_path / "compact"))
+
+    assert is_compact_model(path)
+    assert not is_compact_model(str(tmp_path))
+    assert isinstance(ModelBundle.load(path).model, CompactForest)
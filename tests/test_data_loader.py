@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+from cleaning import clean_survey
+from data_loader import SURVEY_SCHEMA, iter_survey, load_survey, records_to_frame
+from encoder import UNKNOWN_CODE, CategoricalEncoder
+
+
+def test_out_of_vocabulary_answer_encodes_as_unknown():
+    df = records_to_frame([{"work_interfere": "Frequently"}, {"work_interfere": "Often"}, {"work_interfere": None}])
+    assert df["work_interfere"].tolist()[:2] == ["Frequently", "Often"]
+    assert list(df["work_interfere"].cat.categories[:5]) == list(SURVEY_SCHEMA["work_interfere"].categories)
+
+    encoder = CategoricalEncoder({"work_interfere": SURVEY_SCHEMA["work_interfere"].categories})
+    codes = encoder.transform(clean_survey(df))["work_interfere"].tolist()
+    dont_know = list(SURVEY_SCHEMA["work_interfere"].categories).index("Don't know")
+    assert codes == [UNKNOWN_CODE, list(SURVEY_SCHEMA["work_interfere"].categories).index("Often"), dont_know]
+
+
+def test_invalid_age_is_na_and_raw_minus_one_is_kept():
+    df = records_to_frame([{"Age": "abc"}, {"Age": 329}, {"Age": -1}, {"Age": "31"}, {"Age": 30.5}])
+    assert str(df["Age"].dtype) == "Int8"
+    assert df["Age"].isna().tolist() == [True, True, False, False, True]
+    assert df["Age"].dropna().tolist() == [-1, 31]
+
+
+def test_chunks_agree_on_categories(tmp_path):
+    path = tmp_path / "survey.csv"
+    frame = pd.DataFrame({col: [None] * 4 for col in SURVEY_SCHEMA})
+    frame["Age"] = [30, 99999999999, 41, 25]
+    frame["treatment"] = ["Yes", "No", "Maybe", "Yes"]
+    frame.to_csv(path, index=False)
+
+    chunks = list(iter_survey(str(path), chunksize=2))
+    assert chunks[0]["treatment"].dtype != chunks[1]["treatment"].dtype
+    df = load_survey(str(path), chunksize=2)
+    assert list(df["treatment"].cat.categories) == ["No", "Yes", "Maybe"]
+    assert df["treatment"].tolist() == ["Yes", "No", "Maybe", "Yes"]
+    assert df["Age"].isna().tolist() == [False, True, False, False]
+    assert np.array_equal(df["Age"].dropna().to_numpy(), [30, 41, 25])
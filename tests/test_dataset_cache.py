@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+from dataset_cache import cache_key, load_or_build
+from encoder import CategoricalEncoder
+
+
+def _build(calls, frame):
+    def build():
+        calls.append(1)
+        encoder = CategoricalEncoder().fit(frame)
+        encoded = encoder.transform(frame)
+        return encoded.drop(columns="y"), encoded["y"].to_numpy(), encoder
+    return build
+
+
+def test_cache_key_changes_with_content_and_config(tmp_path):
+    path = tmp_path / "survey.csv"
+    path.write_text("a,b\n1,2\n", encoding="utf-8")
+    key = cache_key(str(path), {"drop": ["b"]})
+    assert cache_key(str(path), {"drop": ["b"]}) == key
+    assert cache_key(str(path), {"drop": ["a"]}) != key
+
+    path.write_text("a,b\n1,3\n", encoding="utf-8")
+    assert cache_key(str(path), {"drop": ["b"]}) != key
+
+
+def test_load_or_build_reuses_cache_until_csv_changes(tmp_path):
+    path = tmp_path / "survey.csv"
+    path.write_text("x\n1\n", encoding="utf-8")
+    frame = pd.DataFrame({"color": ["red", "blue", "red"], "n": np.array([1, 2, 3], dtype=np.int8),
+                          "y": ["Yes", "No", "Yes"]})
+    calls, cache_dir = [], str(tmp_path / "cache")
+
+    dataset, hit = load_or_build(str(path), _build(calls, frame), {"v": 1}, cache_dir)
+    assert not hit
+    assert isinstance(dataset.X, np.memmap)
+    assert dataset.feature_names == ["color", "n"]
+    np.testing.assert_array_equal(dataset.X, [[1, 1], [0, 2], [1, 3]])
+    np.testing.assert_array_equal(dataset.y, [1, 0, 1])
+    assert dataset.encoder.vocabularies["color"] == ["blue", "red"]
+
+    again, hit = load_or_build(str(path), _build(calls, frame), {"v": 1}, cache_dir)
+    assert hit and len(calls) == 1
+    np.testing.assert_array_equal(again.X, dataset.X)
+
+    path.write_text("x\n2\n", encoding="utf-8")
+    _, hit = load_or_build(str(path), _build(calls, frame), {"v": 1}, cache_dir)
+    assert not hit and len(calls) == 2
@@ -0,0 +1,16 @@
+import os
+
+from pptx import Presentation
+
+from deck_builder import generate_decks
+
+
+def test_generate_decks_builds_every_job(results_path, tmp_path):
+    jobs = [(results_path, str(tmp_path / "decks" / f"deck_{i}.pptx")) for i in range(3)]
+    stats = generate_decks(jobs, workers=2, image_options={"dpi": 72, "fmt": "png8"})
+    assert stats["deck"].tolist() == [output for _, output in jobs]
+    sizes = set()
+    for _, output in jobs:
+        assert os.path.getsize(output) > 0
+        sizes.add(len(Presentation(output).slides))
+    assert len(sizes) == 1
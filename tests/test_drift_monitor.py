@@ -0,0 +1,68 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy.spatial.distance import jensenshannon
+
+from drift_monitor import (MISSING_LABEL, OTHER_LABEL, AgeSketch, CategorySketch, DriftMonitor, jensen_shannon)
+from incremental import population_stability_index
+
+SURVEY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "survey.csv")
+
+
+def test_psi_and_js_known_values():
+    assert population_stability_index([50, 50], [50, 50]) == 0.0
+    expected = (0.9 - 0.5) * np.log(0.9 / 0.5) + (0.1 - 0.5) * np.log(0.1 / 0.5)
+    assert population_stability_index([50, 50], [90, 10]) == pytest.approx(expected)
+
+    p, q = [10, 30, 60], [40, 40, 20]
+    assert jensen_shannon(p, q) == pytest.approx(jensenshannon(p, q, base=2) ** 2)
+    assert jensen_shannon(p, q) == pytest.approx(jensen_shannon(q, p))
+    assert jensen_shannon([1, 0], [0, 1]) == pytest.approx(1.0)
+    assert jensen_shannon(p, p) == pytest.approx(0.0)
+
+
+def test_category_sketch_is_bounded():
+    sketch = CategorySketch(max_categories=3)
+    sketch.add(pd.Series(["a", "b", None, "c", "d", "a"]))
+    assert sketch.counts == {"a": 2, "b": 1, "c": 1, OTHER_LABEL: 2}  # "d" & NA melewati batas
+    sketch.add(pd.Series(["a", "e"]))
+    assert sketch.counts == {"a": 3, "b": 1, "c": 1, OTHER_LABEL: 3}
+
+    roomy = CategorySketch()
+    roomy.add(pd.Series(["a", None]))
+    assert roomy.counts == {"a": 1, MISSING_LABEL: 1}
+
+
+def test_age_sketch_quantiles_are_exact():
+    ages = np.array([20, 25, 30, 35, 40, 45, 50, 55, 60, 65])
+    sketch = AgeSketch()
+    sketch.add(ages)
+    assert sketch.quantile(0.5) == 40
+    assert sketch.quantile(1.0) == 65
+    assert sum(sketch.binned(sketch.psi_edges(bins=2))) == len(ages)
+
+
+def test_shifted_window_is_flagged_for_retrain(tmp_path):
+    rows = pd.read_csv(SURVEY, dtype=str, keep_default_na=False)
+    path = tmp_path / "survey.csv"
+    rows.iloc[:600].to_csv(path, index=False)
+    monitor = DriftMonitor(str(path), str(tmp_path / "drift" / "state.json"), min_window_rows=50)
+    report, added = monitor.run()
+    assert added == 0 and report["windows"] == []
+
+    shifted = rows.iloc[600:800].copy()
+    shifted["Timestamp"] = "2016-01-15 10:00:00"
+    shifted["family_history"] = "Yes"
+    shifted["treatment"] = "Yes"
+    shifted.to_csv(path, mode="a", header=False, index=False)
+    report, added = monitor.run()
+    (window,) = report["windows"]
+    assert window["window"] == "2016-01" and window["rows"] == added > 50
+    assert {"family_history", "treatment"} <= set(window["flagged"])
+    assert window["treatment_rate"] == 1.0
+    assert report["retrain"]
+
+    report, added = monitor.run()
+    assert added == 0 and report["windows"][0]["rows"] == window["rows"]
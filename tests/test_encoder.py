@@ -0,0 +1,48 @@
+import pandas as pd
+import pytest
+
+from encoder import MISSING_CODE, UNKNOWN_CODE, CategoricalEncoder
+
+
+@pytest.fixture
+def train():
+    return pd.DataFrame({
+        "country": pd.Series(["ID", "US", "ID", None], dtype="category"),
+        "answer": ["Yes", "No", None, "Yes"],
+        "age": [30, 40, 50, 60],
+    })
+
+
+def test_fit_transform_uses_sorted_vocabulary_and_keeps_other_columns(train):
+    encoder = CategoricalEncoder()
+    encoded = encoder.fit_transform(train)
+    assert encoder.vocabularies == {"country": ["ID", "US"], "answer": ["No", "Yes"]}
+    assert encoded["country"].tolist() == [0, 1, 0, MISSING_CODE]
+    assert encoded["answer"].tolist() == [1, 0, MISSING_CODE, 1]
+    assert encoded["age"].tolist() == [30, 40, 50, 60]
+
+
+def test_unseen_categories_map_to_unknown_code(train):
+    encoder = CategoricalEncoder().fit(train)
+    batch = pd.DataFrame({
+        "country": pd.Series(["US", "FR", None], dtype="category"),
+        "answer": ["Maybe", "Yes", None],
+    })
+    encoded = encoder.transform(batch)
+    assert encoded["country"].tolist() == [1, UNKNOWN_CODE, MISSING_CODE]
+    assert encoded["answer"].tolist() == [UNKNOWN_CODE, 1, MISSING_CODE]
+
+
+def test_save_load_round_trip_gives_identical_codes(train, tmp_path):
+    encoder = CategoricalEncoder().fit(train)
+    path = tmp_path / "encoder.json"
+    encoder.save(path)
+    loaded = CategoricalEncoder.load(path)
+    assert loaded.vocabularies == encoder.vocabularies
+    pd.testing.assert_frame_equal(loaded.transform(train), encoder.transform(train))
+
+
+def test_categorical_and_object_inputs_encode_identically(train):
+    encoder = CategoricalEncoder().fit(train)
+    as_object = train.assign(country=train["country"].astype(object))
+    pd.testing.assert_series_equal(encoder.transform(as_object)["country"], encoder.transform(train)["country"])
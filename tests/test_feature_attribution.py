@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+
+import feature_attribution
+from feature_attribution import permutation_importance, stratified_subsample
+
+
+def _fitted():
+    rng = np.random.default_rng(0)
+    X = rng.integers(0, 4, size=(600, 3)).astype(float)
+    y = (X[:, 1] >= 2).astype(int)
+    return RandomForestClassifier(n_estimators=10, random_state=0, n_jobs=1).fit(X, y), X, y
+
+
+def test_stratified_subsample_keeps_class_ratio():
+    y = np.array([0] * 900 + [1] * 100)
+    rows = stratified_subsample(y, 200)
+    assert len(rows) == 200
+    assert y[rows].sum() == 20
+
+
+def test_permutation_importance_is_deterministic_across_workers():
+    model, X, y = _fitted()
+    serial = permutation_importance(model, X, y, ["a", "b", "c"], max_rows=300, n_repeats=4, workers=1)
+    parallel = permutation_importance(model, X, y, ["a", "b", "c"], max_rows=300, n_repeats=4, workers=2)
+    assert serial["feature"].iloc[0] == "b"
+    assert (serial["ci_low"] <= serial["importance_mean"]).all()
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+def test_row_blocks_match_single_block(monkeypatch):
+    model, X, y = _fitted()
+    whole = permutation_importance(model, X, y, max_rows=None, n_repeats=3, scoring="accuracy", workers=1)
+    monkeypatch.setattr(feature_attribution, "ROW_BLOCK", 64)  # 600 baris -> 10 blok, blok terakhir parsial
+    blocked = permutation_importance(model, X, y, max_rows=None, n_repeats=3, scoring="accuracy", workers=1)
+    pd.testing.assert_frame_equal(whole, blocked)
@@ -0,0 +1,113 @@
+import os
+
+import pandas as pd
+import pytest
+
+import incremental
+from incremental import IncrementalPipeline, IncrementalState, _complete_end
+from training import TrainingConfig
+
+SURVEY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "survey.csv")
+
+
+@pytest.fixture
+def survey():
+    return pd.read_csv(SURVEY, dtype=str, keep_default_na=False)
+
+
+def _pipeline(tmp_path, path):
+    return IncrementalPipeline(str(path), state_dir=str(tmp_path / "state"), retrain_rows=10_000,
+                               drift_threshold=10.0, training_config=TrainingConfig(n_estimators=5, n_jobs=1))
+
+
+def _append(path, rows):
+    rows.to_csv(path, mode="a", header=False, index=False)
+
+
+def _pending_rows(pipeline, state):
+    return len(pipeline._load_pending(state.pending_file)[1] if state.pending_file else [])
+
+
+def test_run_reads_only_new_complete_rows(tmp_path, survey):
+    path = tmp_path / "survey.csv"
+    survey.iloc[:600].to_csv(path, index=False)
+    pipeline = _pipeline(tmp_path, path)
+    state = pipeline.run()
+    assert state.byte_offset == os.path.getsize(path)
+
+    _append(path, survey.iloc[600:800])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("2014-08-29 11:00:00,30,Male")  # baris yang masih ditulis
+    state = pipeline.run()
+    assert state.byte_offset == _complete_end(path) < os.path.getsize(path)
+    assert _pending_rows(pipeline, state) == state.rows_since_refresh > 0
+
+
+def test_failed_commit_does_not_duplicate_pending_rows(tmp_path, survey, monkeypatch):
+    path = tmp_path / "survey.csv"
+    survey.iloc[:600].to_csv(path, index=False)
+    pipeline = _pipeline(tmp_path, path)
+    pipeline.run()
+    _append(path, survey.iloc[600:800])
+    first = pipeline.run()
+
+    _append(path, survey.iloc[800:1000])
+    save = IncrementalState.save
+
+    def crash(self, state_path):
+        raise OSError("disk penuh")
+
+    monkeypatch.setattr(IncrementalState, "save", crash)
+    with pytest.raises(OSError):
+        pipeline.run()
+    monkeypatch.setattr(IncrementalState, "save", save)
+
+    assert IncrementalState.load(pipeline.state_path).byte_offset == first.byte_offset
+    state = pipeline.run()
+    assert _pending_rows(pipeline, state) == state.rows_since_refresh
+    assert state.rows_since_refresh > first.rows_since_refresh
+    assert sorted(name for name in os.listdir(pipeline.state_dir) if name.endswith(".npz")) == [state.pending_file]
+
+
+def test_full_retrain_stops_at_offset_seen_before_loading(tmp_path, survey, monkeypatch):
+    path = tmp_path / "survey.csv"
+    survey.iloc[:600].to_csv(path, index=False)
+    start_size = os.path.getsize(path)
+    build = incremental.build_survey_dataset
+
+    def build_while_appending(*args, **kwargs):
+        _append(path, survey.iloc[600:700])  # baris baru tiba selama load
+        return build(*args, **kwargs)
+
+    monkeypatch.setattr(incremental, "build_survey_dataset", build_while_appending)
+    monkeypatch.chdir(tmp_path)
+    pipeline = _pipeline(tmp_path, path)
+    state = pipeline.run()
+    assert state.byte_offset == start_size
+    assert os.path.exists(pipeline.quarantine_path)
+    assert not os.path.exists(tmp_path / "model_output")
+
+    monkeypatch.setattr(incremental, "build_survey_dataset", build)
+    state = pipeline.run()
+    assert state.byte_offset == os.path.getsize(path)
+    assert state.rows_since_refresh > 0
+
+
+def test_warm_start_waits_until_pending_has_every_class(tmp_path, survey):
+    path = tmp_path / "survey.csv"
+    survey.iloc[:600].to_csv(path, index=False)
+    pipeline = _pipeline(tmp_path, path)
+    pipeline.retrain_rows = 50
+    pipeline.run()
+
+    rest = survey.iloc[600:]
+    _append(path, rest[rest["treatment"] == "Yes"].iloc[:80])
+    state = pipeline.run()
+    assert state.history[-1]["event"] == "warm_start_deferred"
+    assert state.history[-1]["missing_classes"] == ["No"]
+    assert _pending_rows(pipeline, state) == state.rows_since_refresh
+
+    _append(path, rest[rest["treatment"] == "No"].iloc[:80])
+    state = pipeline.run()
+    assert state.history[-1]["event"] == "warm_start"
+    assert state.pending_file is None and state.rows_since_refresh == 0
@@ -0,0 +1,65 @@
+import asyncio
+import json
+
+import numpy as np
+
+from inference_server import InferenceServer, validate_record
+
+FEATURES = ["Age", "Gender", "work_interfere"]
+VALID = {"Age": 30, "Gender": "F", "work_interfere": None}
+
+
+class FakeBundle:
+    feature_names = FEATURES
+
+    def predict_proba(self, df):
+        if (df["Gender"] == "boom").any():
+            raise ValueError("boom")
+        return np.asarray(df["Age"], dtype=float) / 100
+
+
+def test_validate_record_rejects_missing_columns_and_bad_types():
+    assert validate_record(VALID, FEATURES) == []
+    assert validate_record({"foo": 1}, FEATURES)
+    assert validate_record({**VALID, "Age": "abc"}, FEATURES)
+    assert validate_record({**VALID, "Age": True}, FEATURES)
+    assert validate_record({**VALID, "Gender": 3}, FEATURES)
+    assert validate_record({**VALID, "Gender": None}, FEATURES)
+    assert validate_record({**VALID, "work_interfere": "Frequently"}, FEATURES) == []
+
+
+def test_failing_record_does_not_fail_its_batch():
+    async def scenario():
+        server = InferenceServer(FakeBundle(), max_batch_size=8, max_wait_ms=50)
+        server.batcher.start()
+        try:
+            return await asyncio.gather(
+                server._handle_request("POST", "/predict", json.dumps(VALID)),
+                server._handle_request("POST", "/predict", json.dumps({**VALID, "Gender": "boom"})),
+                server._handle_request("POST", "/predict", json.dumps({"foo": 1})),
+                server._handle_request("POST", "/predict", json.dumps({**VALID, "Age": 40})),
+            )
+        finally:
+            await server.batcher.stop()
+
+    statuses = [status.value for status, _ in asyncio.run(scenario())]
+    assert statuses == [200, 422, 422, 200]
+
+
+def test_invalid_or_oversized_content_length_is_rejected_before_reading():
+    async def scenario(length, **options):
+        server = InferenceServer(FakeBundle(), **options)
+        tcp = await asyncio.start_server(server.handle_connection, "127.0.0.1", 0)
+        port = tcp.sockets[0].getsockname()[1]
+        async with tcp:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(f"POST /predict HTTP/1.1\r\nContent-Length: {length}\r\n\r\n".encode())
+            await writer.drain()
+            status_line = await reader.readline()
+            writer.close()
+        return status_line
+
+    assert b" 400 " in asyncio.run(scenario("abc"))
+    assert b" 400 " in asyncio.run(scenario("-5"))
+    # Body tidak pernah dikirim: 413 harus datang sebelum server menunggu isinya.
+    assert b" 413 " in asyncio.run(scenario("1000000", max_body_bytes=1024))
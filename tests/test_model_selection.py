@@ -0,0 +1,37 @@
+import numpy as np
+
+from model_selection import PARAM_DISTRIBUTIONS, _fold_schedule, halving_search, sample_candidates
+from shared_arrays import SharedArray
+
+
+def test_sample_candidates_are_unique_and_capped():
+    candidates = sample_candidates(20)
+    assert len({tuple(params.values()) for params in candidates}) == 20
+    assert len(sample_candidates(10_000, {"a": [1, 2], "b": [3]})) == 2
+    assert set(candidates[0]) == set(PARAM_DISTRIBUTIONS)
+
+
+def test_fold_schedule():
+    assert _fold_schedule(5, 3) == [1, 3, 5]
+    assert _fold_schedule(1, 3) == [1]
+
+
+def test_halving_search_prunes_and_ranks_survivors_first():
+    rng = np.random.default_rng(0)
+    X = rng.integers(0, 5, size=(300, 4)).astype(np.int8)
+    y = (X[:, 0] + rng.integers(0, 2, size=300) > 2).astype(int)
+    candidates = [{"n_estimators": 10, "max_depth": depth} for depth in (1, 2, 3, 5, None, 8)]
+    table = halving_search(X, y, candidates, n_folds=3, eta=3, workers=2)
+    assert len(table) == len(candidates)
+    assert table["folds"].iloc[0] == 3
+    assert table["pruned_at_round"].notna().sum() == 4
+    assert table["folds"].is_monotonic_decreasing
+
+
+def test_shared_array_round_trip():
+    data = np.arange(12, dtype=np.int16).reshape(3, 4)
+    with SharedArray.publish(data) as shared:
+        view = SharedArray.attach(shared.handle)
+        np.testing.assert_array_equal(view.array, data)
+        assert not view.array.flags.writeable
+        view.close()
@@ -0,0 +1,96 @@
+import pytest
+
+from pipeline import PipelineConfig, PipelineRunner, Stage, code_digest, survey_stages, topological_order
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+
+
+def _stages(tmp_path, calls, fail_upper=False):
+    source, lower, upper = tmp_path / "source.txt", tmp_path / "lower.txt", tmp_path / "upper.txt"
+
+    def load():
+        calls.append("lower")
+        _write(lower, source.read_text(encoding="utf-8").strip().lower())
+
+    def shout():
+        calls.append("upper")
+        if fail_upper:
+            raise RuntimeError("gagal")
+        _write(upper, lower.read_text(encoding="utf-8").upper())
+
+    return [
+        Stage("upper", shout, deps=["lower"], outputs=[str(upper)]),
+        Stage("lower", load, inputs=[str(source)], outputs=[str(lower)]),
+    ]
+
+
+def _run(tmp_path, calls, **kwargs):
+    runner = PipelineRunner(_stages(tmp_path, calls, kwargs.pop("fail_upper", False)),
+                            str(tmp_path / "state.json"), jobs=2, **kwargs)
+    return {name: result["status"] for name, result in runner.run().items()}
+
+
+def test_unchanged_stages_are_skipped(tmp_path):
+    calls = []
+    _write(tmp_path / "source.txt", "Halo")
+    assert _run(tmp_path, calls) == {"lower": "ran", "upper": "ran"}
+    assert _run(tmp_path, calls) == {"lower": "skipped", "upper": "skipped"}
+    assert calls == ["lower", "upper"]
+
+
+def test_identical_upstream_output_does_not_rerun_downstream(tmp_path):
+    calls = []
+    _write(tmp_path / "source.txt", "Halo")
+    _run(tmp_path, calls)
+    _write(tmp_path / "source.txt", "HALO\n")  # input berubah, output 'lower' tetap "halo"
+    assert _run(tmp_path, calls) == {"lower": "ran (output sama)", "upper": "skipped"}
+
+    _write(tmp_path / "source.txt", "Dunia")
+    assert _run(tmp_path, calls) == {"lower": "ran", "upper": "ran"}
+
+
+def test_missing_output_or_force_reruns_stage(tmp_path):
+    calls = []
+    _write(tmp_path / "source.txt", "Halo")
+    _run(tmp_path, calls)
+    (tmp_path / "upper.txt").unlink()
+    assert _run(tmp_path, calls)["upper"] == "ran (output sama)"
+    assert _run(tmp_path, calls, force=["lower"]) == {"lower": "ran (output sama)", "upper": "skipped"}
+
+
+def test_failed_stage_is_retried_on_next_run(tmp_path):
+    calls = []
+    _write(tmp_path / "source.txt", "Halo")
+    assert _run(tmp_path, calls, fail_upper=True) == {"lower": "ran", "upper": "failed"}
+    assert _run(tmp_path, calls) == {"lower": "skipped", "upper": "ran"}
+
+
+def test_topological_order_rejects_cycles():
+    with pytest.raises(ValueError):
+        topological_order([Stage("a", print, deps=["b"]), Stage("b", print, deps=["a"])])
+
+
+def _calling(helper):
+    def run():
+        helper()
+    return Stage("s", run)
+
+
+def test_code_digest_covers_helper_closures():
+    def helper_a():
+        return 1
+
+    def helper_b():
+        return 2
+
+    assert code_digest(_calling(helper_a)) == code_digest(_calling(helper_a))
+    assert code_digest(_calling(helper_a)) != code_digest(_calling(helper_b))
+
+
+def test_survey_stages_share_analysis_module(tmp_path):
+    stages = {stage.name: stage for stage in survey_stages(PipelineConfig(model_dir=str(tmp_path)))}
+    for name in ("train", "evaluate", "importance", "summarize", "results"):
+        assert "Mental_Health_Data" in stages[name].code
+    assert "dataset_cache" in stages["encode"].code
@@ -0,0 +1,34 @@
+import os
+
+from plotting import PlotRenderer
+
+DATA = {"features": ["family_history", "Age"], "importances": [0.3, 0.1]}
+
+
+def _render(plots_dir, data, **kwargs):
+    with PlotRenderer(str(plots_dir), workers=1, **kwargs) as renderer:
+        path = renderer.submit("importance", "feature_importance", data)
+    return renderer, path
+
+
+def test_unchanged_figure_is_not_rendered_again(tmp_path):
+    first, path = _render(tmp_path, DATA, preview=True)
+    assert first.skipped == [] and os.path.getsize(path) > 0
+    assert path == os.path.join(str(tmp_path), "preview", "importance.png")
+    modified = os.path.getmtime(path)
+
+    second, _ = _render(tmp_path, DATA, preview=True)
+    assert second.skipped == ["importance"]
+    assert os.path.getmtime(path) == modified
+
+    third, _ = _render(tmp_path, {**DATA, "importances": [0.2, 0.1]}, preview=True)
+    assert third.skipped == []
+    assert third.specs["importance"]["kind"] == "feature_importance"
+
+
+def test_force_and_missing_file_rerender(tmp_path):
+    _, path = _render(tmp_path, DATA, preview=True)
+    assert _render(tmp_path, DATA, preview=True, force=True)[0].skipped == []
+    os.remove(path)
+    assert _render(tmp_path, DATA, preview=True)[0].skipped == []
+    assert os.path.exists(path)
@@ -0,0 +1,60 @@
+import pytest
+
+from presentasi_mental_health import build_presentation, build_template, describe_classification, describe_roc
+from results_artifact import AnalysisResults, save_results
+
+
+def _texts(prs):
+    return "\n".join(shape.text_frame.text for slide in prs.slides for shape in slide.shapes if shape.has_text_frame)
+
+
+def test_results_round_trip_keeps_figures(results_path, tmp_path):
+    results = AnalysisResults.load(results_path)
+    with open(tmp_path / "confusion_matrix.png", "rb") as f:
+        assert results.figure_bytes("confusion_matrix") == f.read()
+    assert results.figure_bytes("tidak_ada") is None
+    assert results["metrics"]["n_respondents"] == 1234
+
+    bad = save_results({"version": 0}, {}, str(tmp_path / "old.json"))
+    with pytest.raises(ValueError):
+        AnalysisResults.load(bad)
+
+
+def test_deck_text_comes_from_results(results_path):
+    prs = build_presentation(AnalysisResults.load(results_path))
+    text = _texts(prs)
+    assert "1,234" in text
+    assert "family_history" in text
+    assert "Ringkasan uji." in text
+    assert describe_roc(0.8765) == "sangat baik"
+    assert sum(shape.shape_type == 13 for slide in prs.slides for shape in slide.shapes) == 3  # PICTURE
+
+
+def test_template_deck_has_same_slides(results_path):
+    results = AnalysisResults.load(results_path)
+    plain = build_presentation(results)
+    templated = build_presentation(results, template_bytes=build_template())
+    assert len(templated.slides) == len(plain.slides)
+    assert "Ringkasan uji." in _texts(templated)
+
+
+def test_deck_conclusions_follow_model_and_report(results_path):
+    results = AnalysisResults.load(results_path)
+    text = _texts(build_presentation(results))
+    assert "seimbang" in text and "tidak seimbang" not in text
+    assert "Confusion Matrix model RandomForestClassifier" in text
+    assert "family_history, work_interfere dan Age" in text
+    assert "stres kerja" not in text
+
+    results["metrics"]["model"] = "HistGradientBoostingClassifier"
+    results["metrics"]["classification_report"] = {"0": {"precision": 0.9, "recall": 0.6}, "1": {"precision": 0.7, "recall": 0.95}}
+    results.payload["top_features"] = ["Country"]
+    text = _texts(build_presentation(results))
+    assert "HistGradientBoostingClassifier" in text and "Random Forest" not in text
+    assert "tidak seimbang" in text
+    assert "Model menempatkan Country" in text
+
+
+def test_describe_classification_without_report():
+    assert describe_classification(None) is None
+    assert describe_classification({}) is None
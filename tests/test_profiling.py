@@ -0,0 +1,48 @@
+import json
+import os
+
+import pytest
+
+from profiling import StageProfiler, compare_traces
+
+
+def test_stages_are_recorded_and_saved_as_json_and_chrome_trace(tmp_path):
+    profiler = StageProfiler()
+    with profiler.stage("load") as stage:
+        stage.rows = 1000
+        stage.extra["method"] = "chunked"
+    with pytest.raises(RuntimeError):
+        with profiler.stage("train"):
+            raise RuntimeError("gagal")
+
+    path = profiler.save(str(tmp_path / "stage_trace.json"), metadata={"commit": "abc"})
+    with open(path, encoding="utf-8") as f:
+        trace = json.load(f)
+    load, train = trace["stages"]
+    assert trace["commit"] == "abc"
+    assert (load["name"], load["status"], load["rows"], load["method"]) == ("load", "ok", 1000, "chunked")
+    assert load["wall_seconds"] >= 0 and load["peak_rss_bytes"] > 0
+    assert train["status"] == "error"
+    with open(tmp_path / "stage_trace.chrome.json", encoding="utf-8") as f:
+        events = json.load(f)["traceEvents"]
+    assert [event["name"] for event in events] == ["load", "train"]
+
+
+def test_cprofile_hook_writes_profile_per_stage(tmp_path):
+    profiler = StageProfiler(hook="cprofile", profile_dir=str(tmp_path))
+    with profiler.stage("encode"):
+        sum(range(1000))
+    assert os.path.exists(tmp_path / "encode.prof")
+    with pytest.raises(ValueError):
+        StageProfiler(hook="perf")
+
+
+def test_compare_traces_ratios():
+    baseline = {"stages": [{"name": "load", "wall_seconds": 2.0, "cpu_seconds": 1.0, "peak_rss_bytes": 100,
+                            "rows": 10}]}
+    current = {"stages": [{"name": "load", "wall_seconds": 3.0, "cpu_seconds": 1.0, "peak_rss_bytes": 50,
+                           "rows": 10},
+                          {"name": "deck", "wall_seconds": 1.0, "cpu_seconds": 1.0, "peak_rss_bytes": 1, "rows": None}]}
+    load, deck = compare_traces(baseline, current)
+    assert load["wall_seconds_ratio"] == 1.5 and load["peak_rss_bytes_ratio"] == 0.5
+    assert deck["wall_seconds_before"] is None and deck["wall_seconds_ratio"] is None
@@ -0,0 +1,71 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+
+from dataset_cache import build_survey_dataset
+from scoring import ModelBundle, score_file
+
+SURVEY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "survey.csv")
+
+
+@pytest.fixture(scope="module")
+def bundle_path(tmp_path_factory):
+    X_df, y, encoder = build_survey_dataset(SURVEY, verbose=False, quarantine_path=None)
+    model = RandomForestClassifier(n_estimators=10, random_state=0, n_jobs=1).fit(X_df.to_numpy(), y.to_numpy())
+    return ModelBundle(model, encoder, X_df.columns).save(str(tmp_path_factory.mktemp("model") / "bundle.joblib"))
+
+
+def _score(bundle_path, input_path, tmp_path, **kwargs):
+    output = tmp_path / f"scores-{kwargs.get('executor', 'serial')}-{kwargs.get('workers', 1)}.csv"
+    total, _ = score_file(bundle_path, str(input_path), str(output), batch_size=100, **kwargs)
+    scores = pd.read_csv(output)
+    assert len(scores) == total
+    return scores
+
+
+def test_jsonl_scores_match_across_executors_without_parent_load_in_process_mode(bundle_path, tmp_path,
+                                                                               monkeypatch):
+    records = pd.read_csv(SURVEY, nrows=250).drop(columns=["comments"]).replace({np.nan: None})
+    input_path = tmp_path / "input.jsonl"
+    with open(input_path, "w", encoding="utf-8") as f:
+        for record in records.to_dict("records"):
+            f.write(json.dumps(record) + "\n")
+
+    serial = _score(bundle_path, input_path, tmp_path)
+    threads = _score(bundle_path, input_path, tmp_path, workers=2, executor="thread")
+
+    parent_loads = []
+    load = ModelBundle.load.__func__
+    monkeypatch.setattr(ModelBundle, "load", classmethod(
+        lambda cls, path: parent_loads.append(os.getpid()) or load(cls, path)))
+    processes = _score(bundle_path, input_path, tmp_path, workers=2, executor="process")
+
+    assert serial["row"].tolist() == list(range(len(records)))
+    pd.testing.assert_frame_equal(serial, threads)
+    pd.testing.assert_frame_equal(serial, processes)
+    assert os.getpid() not in parent_loads
+
+
+def test_csv_input_scores_every_row(bundle_path, tmp_path):
+    csv_scores = _score(bundle_path, SURVEY, tmp_path)
+    assert len(csv_scores) == len(pd.read_csv(SURVEY))
+    assert csv_scores["treatment_probability"].between(0, 1).all()
+
+
+def test_compact_scoring_does_not_import_joblib_or_sklearn(bundle_path, tmp_path):
+    import subprocess
+    import sys
+
+    compact_path = ModelBundle.load(bundle_path).export_compact(str(tmp_path / "compact"))
+    code = (
+        "import json, sys; from scoring import score_file; "
+        f"score_file({compact_path!r}, {SURVEY!r}, {str(tmp_path / 'scores.csv')!r}, batch_size=500); "
+        "print(json.dumps([m for m in ('joblib', 'sklearn') if m in sys.modules]))"
+    )
+    root = os.path.dirname(SURVEY)
+    output = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+    assert json.loads(output.stdout.strip().splitlines()[-1]) == []
@@ -0,0 +1,37 @@
+import numpy as np
+
+from encoder import CategoricalEncoder
+from segmentation import group_segments, run_segments
+
+FEATURES = ["Country", "tech_company", "x"]
+
+
+def _data(rows=400, seed=0):
+    rng = np.random.default_rng(seed)
+    X = np.column_stack([rng.integers(0, 3, rows), rng.integers(0, 2, rows), rng.integers(0, 5, rows)])
+    X[:5, 0] = 3  # segmen kecil
+    y = (X[:, 2] > 2).astype(np.int8)
+    return X.astype(np.int16), y
+
+
+def test_group_segments_covers_every_row_once_per_column():
+    X, _ = _data()
+    order, segments = group_segments(X, FEATURES, ["Country", "tech_company"])
+    assert len(order) == 2 * len(X)
+    for col, code, start, stop in segments:
+        assert (X[order[start:stop], FEATURES.index(col)] == code).all()
+    assert sum(stop - start for col, _, start, stop in segments if col == "Country") == len(X)
+
+
+def test_run_segments_reports_small_segments_and_labels():
+    X, y = _data()
+    encoder = CategoricalEncoder({"Country": ["Canada", "India", "UK", "US"], "tech_company": ["No", "Yes"]})
+    table, importances = run_segments(X, y, FEATURES, encoder, ["Country", "tech_company"], min_size=50,
+                                      n_estimators=5, workers=2)
+    assert len(table) == 6
+    small = table[table["segment_value"] == "US"].iloc[0]
+    assert small["rows"] == 5 and small["status"].startswith("skipped")
+    assert (table.loc[table["segment_value"] != "US", "status"] == "ok").all()
+    assert set(importances) == {"Country=Canada", "Country=India", "Country=UK", "tech_company=No",
+                                "tech_company=Yes"}
+    assert next(iter(importances["Country=UK"])) == "x"
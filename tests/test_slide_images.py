@@ -0,0 +1,39 @@
+import io
+
+import pytest
+from PIL import Image
+
+from slide_images import EMU_PER_INCH, ImagePreparer, resample_image
+
+
+def _png(size=(1200, 900)):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (0, 102, 204)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def _size(image_bytes):
+    with Image.open(io.BytesIO(image_bytes)) as image:
+        return image.size, image.format
+
+
+def test_resample_fits_box_and_never_upscales():
+    assert _size(resample_image(_png(), 4, 3, dpi=100)) == ((400, 300), "PNG")
+    assert _size(resample_image(_png((200, 100)), 4, 3, dpi=100))[0] == (200, 100)
+    assert _size(resample_image(_png(), 4, 3, dpi=100, fmt="jpeg"))[1] == "JPEG"
+    with pytest.raises(ValueError):
+        resample_image(_png(), 4, 3, fmt="gif")
+
+
+def test_preparer_caches_identical_images_in_memory_and_on_disk(tmp_path):
+    image, box = _png(), (4 * EMU_PER_INCH, 3 * EMU_PER_INCH)
+    preparer = ImagePreparer(dpi=100, cache_dir=str(tmp_path))
+    first = preparer.prepare(image, *box)
+    assert preparer.prepare(image, *box) == first
+    assert (preparer.hits, preparer.misses) == (1, 1)
+
+    other_process = ImagePreparer(dpi=100, cache_dir=str(tmp_path))
+    assert other_process.prepare(image, *box) == first
+    assert (other_process.hits, other_process.misses) == (1, 0)
+    other_process.prepare(image, 2 * EMU_PER_INCH, 1 * EMU_PER_INCH)
+    assert other_process.misses == 1
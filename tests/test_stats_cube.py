@@ -0,0 +1,54 @@
+import os
+
+import pandas as pd
+import pytest
+
+from cleaning import clean_survey
+from stats_cube import DEFAULT_DIMENSIONS, StatsCube, load_or_build_cube
+from validation import load_validated_survey
+
+SURVEY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "survey.csv")
+BY = ["family_history", "work_interfere", "age_band"]
+
+
+def _as_dict(series):
+    return {key: int(count) for key, count in series.items() if count}
+
+
+def test_incremental_refresh_equals_full_build(tmp_path):
+    rows = pd.read_csv(SURVEY, dtype=str, keep_default_na=False)
+    path, cube_path = tmp_path / "survey.csv", str(tmp_path / "cube")
+    rows.iloc[:600].to_csv(path, index=False)
+    cube, added, rebuilt = load_or_build_cube(str(path), cube_path)
+    assert rebuilt and added == cube.rows
+
+    rows.iloc[600:900].to_csv(path, mode="a", header=False, index=False)
+    refreshed, added, rebuilt = load_or_build_cube(str(path), cube_path)
+    full = StatsCube.build(str(path))
+    assert not rebuilt and added > 0
+    assert refreshed.rows == full.rows == cube.rows + added
+    assert _as_dict(refreshed.crosstab(BY)) == _as_dict(full.crosstab(BY))
+
+    reloaded = StatsCube.load(cube_path)
+    assert _as_dict(reloaded.crosstab(BY)) == _as_dict(full.crosstab(BY))
+    _, added, _ = load_or_build_cube(str(path), cube_path)
+    assert added == 0
+
+
+def test_default_dimensions_roll_up_rows():
+    cube = StatsCube.build(SURVEY)
+    assert cube.dimensions == DEFAULT_DIMENSIONS and "Country" not in cube.dimensions
+    assert cube.n_cells <= cube.rows / 2
+
+
+def test_rate_and_slice_match_pandas():
+    cube = StatsCube.build(SURVEY, ["family_history", "treatment", "Country"])
+    df, _ = load_validated_survey(SURVEY, transform=clean_survey)
+
+    expected = df.groupby(["family_history"], observed=True)["treatment"].apply(lambda s: (s == "Yes").mean())
+    rates = cube.rate(["family_history"])["rate"]
+    assert {key[0]: rate for key, rate in rates.items()} == pytest.approx(expected.to_dict())
+
+    us = cube.slice(Country="United States").crosstab(["treatment"])
+    counts = df.loc[df["Country"] == "United States", "treatment"].value_counts()
+    assert _as_dict(us) == {(label,): int(count) for label, count in counts.items() if count}
@@ -0,0 +1,84 @@
+from summarizer import MockBackend, ReplicateBackend, SummarizationClient, SummaryCache, summary_key, summarize_sync
+
+PROMPT = "Ringkas temuan:\n- fitur utama: family_history\n- ROC AUC 0.87"
+
+
+def test_summary_key_depends_on_backend():
+    params = {"max_new_tokens": 10}
+    assert summary_key(PROMPT, "m", params, "mock") != summary_key(PROMPT, "m", params, "replicate")
+    assert summary_key(PROMPT, "m", params, "mock") == summary_key(PROMPT, "m", dict(params), "mock")
+
+
+def test_mock_summary_is_cached_and_not_reused_for_other_backend(tmp_path):
+    backend = MockBackend(first_token_latency=0, tokens_per_second=1e6)
+    first = summarize_sync(PROMPT, backend, cache_dir=str(tmp_path))
+    second = summarize_sync(PROMPT, backend, cache_dir=str(tmp_path))
+    assert first == second
+    assert backend.calls == 1
+
+    class FakeReplicate(ReplicateBackend):
+        async def stream(self, prompt, model, params):
+            yield "asli"
+
+    assert summarize_sync(PROMPT, FakeReplicate(), cache_dir=str(tmp_path)) == "asli"
+
+
+def test_identical_prompts_in_flight_call_backend_once(tmp_path):
+    import asyncio
+
+    backend = MockBackend(first_token_latency=0.01, tokens_per_second=1e6)
+
+    async def run():
+        client = SummarizationClient(backend, SummaryCache(str(tmp_path)))
+        return await client.summarize_many([PROMPT] * 5)
+
+    results = asyncio.run(run())
+    assert len(set(results)) == 1
+    assert backend.calls == 1
+
+
+def _replay(received):
+    """Teks akhir menurut kontrak `on_token`: `None` membuang token sebelumnya."""
+    tokens = []
+    for token in received:
+        if token is None:
+            tokens = []
+        else:
+            tokens.append(token)
+    return "".join(tokens).strip()
+
+
+def test_failed_attempt_tokens_are_reset_before_retry(tmp_path):
+    import asyncio
+
+    class FlakyBackend:
+        name = "flaky"
+
+        def __init__(self):
+            self.calls = 0
+
+        async def stream(self, prompt, model, params):
+            self.calls += 1
+            for word in ("satu ", "dua ", "tiga "):
+                await asyncio.sleep(0)
+                yield word
+            if self.calls == 1:
+                raise ConnectionError("stream terputus")
+            yield "empat"
+
+    backend = FlakyBackend()
+    first, joined = [], []
+
+    async def run():
+        client = SummarizationClient(backend, SummaryCache(str(tmp_path)), backoff=0)
+        leader = asyncio.ensure_future(client.summarize(PROMPT, on_token=first.append))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        follower = client.summarize(PROMPT, on_token=joined.append)
+        return await asyncio.gather(leader, follower)
+
+    texts = asyncio.run(run())
+    assert backend.calls == 2
+    assert texts == ["satu dua tiga empat"] * 2
+    assert first.count(None) == 1
+    assert _replay(first) == _replay(joined) == "satu dua tiga empat"
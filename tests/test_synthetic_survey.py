@@ -0,0 +1,33 @@
+import os
+
+import pandas as pd
+
+from benchmarks.synthetic_survey import generate_survey, parse_rows, synthetic_survey_path
+from data_loader import load_survey
+
+SURVEY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "survey.csv")
+
+
+def test_parse_rows():
+    assert (parse_rows("10k"), parse_rows("1.5M"), parse_rows("2_500")) == (10_000, 1_500_000, 2_500)
+
+
+def test_generated_survey_is_deterministic_and_keeps_schema(tmp_path):
+    first = generate_survey(2_500, str(tmp_path / "a.csv"), SURVEY, seed=7, chunk_rows=1_000)
+    second = generate_survey(2_500, str(tmp_path / "b.csv"), SURVEY, seed=7, chunk_rows=1_000)
+    with open(first, "rb") as a, open(second, "rb") as b:
+        assert a.read() == b.read()
+
+    source = pd.read_csv(SURVEY, dtype=str, keep_default_na=False)
+    synthetic = pd.read_csv(first, dtype=str, keep_default_na=False)
+    assert list(synthetic.columns) == list(source.columns) and len(synthetic) == 2_500
+    for col in ("Gender", "treatment", "Country"):
+        assert set(synthetic[col]) <= set(source[col])
+    assert len(load_survey(first, chunksize=1_000)) == 2_500
+
+
+def test_synthetic_survey_path_reuses_file(tmp_path):
+    path = synthetic_survey_path(100, str(tmp_path), SURVEY)
+    modified = os.path.getmtime(path)
+    assert synthetic_survey_path(100, str(tmp_path), SURVEY) == path
+    assert os.path.getmtime(path) == modified
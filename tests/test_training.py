@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import HistGradientBoostingClassifier
+
+from training import TrainingConfig, build_model, grow_forest, train_model
+
+
+def _data(rows=300, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.integers(0, 5, size=(rows, 4)).astype(np.int8)
+    return X, (X[:, 0] > 2).astype(int)
+
+
+def test_parallel_fit_matches_serial_fit():
+    X, y = _data()
+    serial, _ = train_model(X, y, TrainingConfig(n_estimators=20, n_jobs=1))
+    parallel, _ = train_model(X, y, TrainingConfig(n_estimators=20, n_jobs=2))
+    np.testing.assert_array_equal(serial.predict_proba(X), parallel.predict_proba(X))
+
+
+def test_hist_gradient_boosting_backend_and_unknown_backend():
+    assert isinstance(build_model(TrainingConfig(backend="hist_gradient_boosting")), HistGradientBoostingClassifier)
+    with pytest.raises(ValueError):
+        build_model(TrainingConfig(backend="svm"))
+
+
+def test_grow_forest_keeps_old_trees_and_requires_all_classes():
+    X, y = _data()
+    model, _ = train_model(X, y, TrainingConfig(n_estimators=10, n_jobs=1))
+    old_trees = list(model.estimators_)
+    X_new, y_new = _data(100, seed=1)
+    grow_forest(model, X_new, y_new, 5)
+    assert len(model.estimators_) == 15
+    assert model.estimators_[:10] == old_trees
+
+    with pytest.raises(ValueError):
+        grow_forest(model, X_new[y_new == 1], y_new[y_new == 1], 5)
@@ -0,0 +1,58 @@
+import os
+
+import pandas as pd
+
+from data_loader import SURVEY_SCHEMA
+from validation import QuarantineWriter, ValidationReport, iter_validated_survey, load_validated_survey
+
+SURVEY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "survey.csv")
+
+
+def _survey(tmp_path, overrides):
+    base = pd.read_csv(SURVEY, nrows=1, dtype=str, keep_default_na=False).iloc[0].to_dict()
+    rows = [{**base, **override} for override in overrides]
+    path = tmp_path / "survey.csv"
+    pd.DataFrame(rows, columns=list(SURVEY_SCHEMA)).to_csv(path, index=False)
+    return str(path)
+
+
+def test_rules_quarantine_bad_rows_and_count_each_rule(tmp_path):
+    path = _survey(tmp_path, [
+        {},
+        {"Age": "abc"},
+        {"Age": "30.5"},
+        {"Age": "329"},
+        {"work_interfere": "Frequently"},
+        {"Gender": ""},
+        {"Timestamp": "kemarin"},
+        {"state": "", "work_interfere": ""},
+    ])
+    quarantine = tmp_path / "quarantine.csv"
+    report = ValidationReport()
+    chunks = list(iter_validated_survey(path, chunksize=3, quarantine=str(quarantine), report=report))
+
+    assert report.rows == 8 and report.valid == 2
+    assert report.rule_counts == {"age_unparseable": 2, "age_range": 1, "domain:work_interfere": 1,
+                                  "missing:Gender": 1, "timestamp_unparseable": 1}
+    rejected = pd.read_csv(quarantine)
+    assert rejected["_row"].tolist() == [1, 2, 3, 4, 5, 6]
+    assert rejected.loc[rejected["_row"] == 4, "_failed_rules"].item() == "domain:work_interfere"
+
+    valid = pd.concat(chunks)
+    assert str(valid["Age"].dtype) == "int8"
+    assert valid["work_interfere"].dtype == SURVEY_SCHEMA["work_interfere"]
+
+
+def test_load_validated_survey_matches_unchunked_read(tmp_path):
+    path = _survey(tmp_path, [{}, {"Age": "abc"}, {"Age": "41"}, {}])
+    chunked, report = load_validated_survey(path, chunksize=1)
+    whole, _ = load_validated_survey(path)
+    assert report.to_dict()["rule_counts"] == {"age_unparseable": 1}
+    pd.testing.assert_frame_equal(chunked, whole)
+
+
+def test_quarantine_writer_appends_without_repeating_header(tmp_path):
+    path = str(tmp_path / "q.csv")
+    QuarantineWriter(path).write(pd.DataFrame({"a": [1]}))
+    QuarantineWriter(path, append=True).write(pd.DataFrame({"a": [2]}))
+    assert pd.read_csv(path)["a"].tolist() == [1, 2]
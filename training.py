@@ -0,0 +1,83 @@
+import time
+from dataclasses import asdict, dataclass
+
+import numpy as np
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+
+BACKENDS = ("random_forest", "hist_gradient_boosting")
+
+
+@dataclass
+class TrainingConfig:
+    """Konfigurasi mesin training untuk STEP 7."""
+    backend: str = "random_forest"
+    n_estimators: int = 100
+    n_jobs: int = -1
+    max_samples: float | None = None  # fraksi baris per pohon (bootstrap), None = semua
+    max_depth: int | None = None
+    warm_start: bool = False
+    random_state: int = 42
+    # Khusus hist_gradient_boosting
+    max_iter: int = 100
+    learning_rate: float = 0.1
+
+    def to_dict(self):
+        return asdict(self)
+
+
+def build_model(config):
+    if config.backend == "random_forest":
+        return RandomForestClassifier(
+            n_estimators=config.n_estimators,
+            n_jobs=config.n_jobs,
+            max_samples=config.max_samples,
+            max_depth=config.max_depth,
+            warm_start=config.warm_start,
+            random_state=config.random_state,
+        )
+    if config.backend == "hist_gradient_boosting":
+        # Fitur sudah berupa kode integer kecil, jadi binning histogram praktis tanpa biaya.
+        return HistGradientBoostingClassifier(
+            max_iter=config.max_iter,
+            learning_rate=config.learning_rate,
+            max_depth=config.max_depth,
+            warm_start=config.warm_start,
+            random_state=config.random_state,
+        )
+    raise ValueError(f"Backend tidak dikenal: {config.backend!r} (pilihan: {', '.join(BACKENDS)})")
+
+
+def _log_fit(label, model, X, started, cpu_started):
+    wall = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+    print(f"⏱️ {label} {type(model).__name__}: {len(X):,} baris dalam {wall:.2f} s "
+          f"(CPU proses utama {cpu:.2f} s)")
+    return wall
+
+
+def train_model(X, y, config=None):
+    """Melatih model sesuai `config`; mengembalikan (model, detik_wall)."""
+    config = config or TrainingConfig()
+    model = build_model(config)
+    started, cpu_started = time.perf_counter(), time.process_time()
+    model.fit(X, y)
+    return model, _log_fit("Fit", model, X, started, cpu_started)
+
+
+def grow_forest(model, X_new, y_new, extra_estimators):
+    """
+    Menambah `extra_estimators` pohon baru yang dilatih pada batch survei baru.
+    Pohon lama dipertahankan (warm_start), jadi tidak perlu retrain penuh.
+    """
+    if isinstance(model, RandomForestClassifier):
+        missing = np.setdiff1d(model.classes_, np.unique(y_new))
+        if missing.size:
+            raise ValueError(f"Batch baru harus memuat semua kelas target; tidak ada: {missing.tolist()}")
+        model.set_params(warm_start=True, n_estimators=model.n_estimators + extra_estimators)
+    elif isinstance(model, HistGradientBoostingClassifier):
+        model.set_params(warm_start=True, max_iter=model.max_iter + extra_estimators)
+    else:
+        raise TypeError(f"Model {type(model).__name__} tidak mendukung warm_start")
+    started, cpu_started = time.perf_counter(), time.process_time()
+    model.fit(X_new, y_new)
+    return model, _log_fit("Warm-start", model, X_new, started, cpu_started)
@@ -0,0 +1,229 @@
+"""
+Validasi kualitas data survei per chunk, tervektorisasi.
+
+Setiap kolom diperiksa terhadap domain yang dideklarasikan di skema
+(`data_loader.SURVEY_SCHEMA`): kategori yang diizinkan, batas Age, Timestamp
+yang bisa di-parse, dan kolom wajib (tidak boleh kosong). Kolom kategorikal
+dibaca mentah sebagai kategori dinamis, sehingga pemeriksaan cukup dilakukan
+sekali per nilai unik lalu dipetakan lewat kode, bukan per baris di Python.
+
+Baris yang gagal ditulis ke file karantina (nilai mentah + `_failed_rules`) dan
+jumlah pelanggaran per aturan dikumpulkan di `ValidationReport`.
+
+Contoh:
+    python validation.py --survey survey.csv --quarantine model_output/quarantine.csv
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import CategoricalDtype
+
+from data_loader import SURVEY_SCHEMA, _concat_chunks, _select_columns
+
+# Batas usia responden survei kerja; nilai di luar ini (mis. -29, 5, 329) dikarantina.
+AGE_BOUNDS = (18, 100)
+# Kolom yang boleh kosong; self_employed & work_interfere diisi "Don't know" saat cleaning.
+NULLABLE_COLUMNS = ("state", "self_employed", "work_interfere", "comments")
+DEFAULT_QUARANTINE_PATH = os.path.join("model_output", "quarantine.csv")
+
+
+class ValidationReport:
+    """Jumlah baris dan pelanggaran per aturan, diakumulasi lintas chunk."""
+
+    def __init__(self):
+        self.rows = 0
+        self.quarantined = 0
+        self.rule_counts = {}
+
+    @property
+    def valid(self):
+        return self.rows - self.quarantined
+
+    def add(self, rows, quarantined, rule_counts):
+        self.rows += rows
+        self.quarantined += quarantined
+        for rule, count in rule_counts.items():
+            if count:
+                self.rule_counts[rule] = self.rule_counts.get(rule, 0) + int(count)
+
+    def to_dict(self):
+        return {
+            "rows": self.rows,
+            "valid": self.valid,
+            "quarantined": self.quarantined,
+            "rule_counts": dict(sorted(self.rule_counts.items(), key=lambda item: -item[1])),
+        }
+
+    def save(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        os.replace(tmp_path, path)
+        return path
+
+
+class SurveyValidator:
+    """
+    Aturan validasi yang diturunkan dari skema survei.
+    Dipanggil per chunk mentah: `validator(chunk)` -> (valid, ditolak, hitungan_aturan).
+    """
+
+    def __init__(self, age_bounds=AGE_BOUNDS, nullable_columns=NULLABLE_COLUMNS, schema=SURVEY_SCHEMA):
+        if not (np.iinfo(np.int8).min <= age_bounds[0] <= age_bounds[1] <= np.iinfo(np.int8).max):
+            raise ValueError(f"Batas Age harus muat di int8: {age_bounds}")
+        self.age_bounds = tuple(age_bounds)
+        self.nullable_columns = tuple(nullable_columns)
+        self.schema = schema
+
+    def config(self):
+        """Konfigurasi aturan; ikut menentukan kunci cache dataset."""
+        return {"age_bounds": list(self.age_bounds), "nullable": sorted(self.nullable_columns)}
+
+    def read_dtypes(self, columns):
+        """Dtype untuk membaca chunk mentah: kolom kategori & Age sebagai kategori dinamis."""
+        dtypes = {}
+        for col in columns:
+            dtype = self.schema[col]
+            if col == "Age" or dtype == "category" or isinstance(dtype, CategoricalDtype):
+                dtypes[col] = "category"
+        return dtypes
+
+    def __call__(self, chunk):
+        chunk.columns = chunk.columns.str.strip()
+        n = len(chunk)
+        rules, converted = {}, {}
+        for col in chunk.columns:
+            dtype = self.schema.get(col)
+            values = chunk[col]
+            if col not in self.nullable_columns:
+                rules[f"missing:{col}"] = values.isna().to_numpy()
+            if col == "Age":
+                codes = values.cat.codes.to_numpy()
+                # Parse sekali per nilai unik; elemen terakhir (NaN) untuk kode -1.
+                numeric = np.append(pd.to_numeric(values.cat.categories, errors="coerce").to_numpy(np.float64), np.nan)
+                age = numeric[codes]
+                rules["age_unparseable"] = (codes >= 0) & ~(age == np.floor(age))  # NaN atau pecahan
+                rules["age_range"] = (age < self.age_bounds[0]) | (age > self.age_bounds[1])
+                converted[col] = age
+            elif dtype == "datetime":
+                parsed = pd.to_datetime(values, errors="coerce")
+                rules["timestamp_unparseable"] = (values.notna() & parsed.isna()).to_numpy()
+                converted[col] = parsed
+            elif isinstance(dtype, CategoricalDtype):
+                codes = values.cat.codes.to_numpy()
+                outside = np.append(~values.cat.categories.isin(dtype.categories), False)
+                rules[f"domain:{col}"] = outside[codes]
+
+        failed = np.zeros(n, dtype=bool)
+        for mask in rules.values():
+            failed |= mask
+        rule_counts = {rule: int(mask.sum()) for rule, mask in rules.items()}
+
+        rejected = chunk[failed].copy()
+        if len(rejected):
+            labels = np.full(len(rejected), "", dtype=object)
+            for rule, mask in rules.items():
+                hit = mask[failed]
+                labels[hit] = labels[hit] + f"{rule};"
+            rejected.insert(0, "_failed_rules", [label.rstrip(";") for label in labels])
+
+        valid = chunk[~failed].copy() if len(rejected) else chunk
+        for col in valid.columns:
+            dtype = self.schema.get(col)
+            if col == "Age":
+                valid[col] = converted[col][~failed].astype(np.int8)
+            elif dtype == "datetime":
+                valid[col] = converted[col][~failed]
+            elif isinstance(dtype, CategoricalDtype):
+                valid[col] = valid[col].astype(dtype)
+        return valid, rejected, rule_counts
+
+
+class QuarantineWriter:
+    """Menulis baris yang ditolak ke CSV secara bertahap (header sekali)."""
+
+    def __init__(self, path, append=False):
+        self.path = path
+        self.rows = 0
+        self._header = not (append and path and os.path.exists(path))
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            if not append and os.path.exists(path):
+                os.remove(path)
+
+    def write(self, rejected):
+        if not self.path or rejected.empty:
+            return
+        rejected.to_csv(self.path, mode="a", header=self._header, index=False)
+        self._header = False
+        self.rows += len(rejected)
+
+
+def iter_validated_survey(path, chunksize=100_000, usecols=None, include_comments=False, transform=None,
+                          names=None, validator=None, quarantine=None, report=None):
+    """
+    Seperti `data_loader.iter_survey`, tetapi setiap chunk divalidasi lebih dulu.
+    Baris yang gagal dikirim ke `quarantine` (QuarantineWriter atau path CSV) dan
+    dicatat di `report`; hanya baris valid (bertipe skema) yang di-yield.
+    Kolom `_row` di karantina adalah nomor baris data (0-based) dalam bacaan ini.
+    """
+    validator = validator or SurveyValidator()
+    if quarantine is None or isinstance(quarantine, str):
+        quarantine = QuarantineWriter(quarantine)
+    columns = _select_columns(usecols, include_comments)
+    reader = pd.read_csv(path, usecols=columns, dtype=validator.read_dtypes(columns), chunksize=chunksize,
+                         names=names, header=None if names is not None else "infer")
+    offset = 0
+    with reader:
+        for chunk in reader:
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            valid, rejected, rule_counts = validator(chunk)
+            if report is not None:
+                report.add(len(chunk), len(rejected), rule_counts)
+            quarantine.write(rejected.rename_axis("_row").reset_index())
+            valid = valid.reset_index(drop=True)
+            yield transform(valid) if transform is not None else valid
+
+
+def load_validated_survey(path, chunksize=100_000, usecols=None, include_comments=False, transform=None,
+                          validator=None, quarantine_path=None):
+    """Memuat survei tervalidasi sebagai satu DataFrame; mengembalikan (df, report)."""
+    report = ValidationReport()
+    chunks = list(iter_validated_survey(path, chunksize, usecols, include_comments, transform,
+                                        validator=validator, quarantine=quarantine_path, report=report))
+    return _concat_chunks(chunks), report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--survey", default="survey.csv")
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--quarantine", default=DEFAULT_QUARANTINE_PATH)
+    parser.add_argument("--age-min", type=int, default=AGE_BOUNDS[0])
+    parser.add_argument("--age-max", type=int, default=AGE_BOUNDS[1])
+    args = parser.parse_args()
+
+    report = ValidationReport()
+    validator = SurveyValidator(age_bounds=(args.age_min, args.age_max))
+    started = time.perf_counter()
+    for _ in iter_validated_survey(args.survey, args.chunksize, include_comments=True, validator=validator,
+                                   quarantine=args.quarantine, report=report):
+        pass
+    elapsed = time.perf_counter() - started
+    print(f"✅ {report.rows:,} baris divalidasi dalam {elapsed:.2f} s ({report.rows / elapsed:,.0f} baris/s); "
+          f"{report.quarantined:,} dikarantina ke {args.quarantine}")
+    for rule, count in report.to_dict()["rule_counts"].items():
+        print(f"  {rule:<32}{count:>10,}")
+    report_path = report.save(f"{os.path.splitext(args.quarantine)[0]}_report.json")
+    print(f"💾 Laporan validasi disimpan di: {report_path}")
+
+
+if __name__ == "__main__":
+    main()